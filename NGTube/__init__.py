@@ -10,6 +10,10 @@ from .comments.comments import Comments
 from .channel.channel import Channel
 from .search.search import Search, SearchFilters
 from .shorts.shorts import Shorts
+from .records import CommentRecord, VideoRecord, ShortRecord, SearchHit
+from .exceptions import NGTubeError, RequestError, RateLimitedError, NotFoundError, ParseError, CircuitOpenError, DeadlineExceededError
+from .deadline import Deadline
+from . import transport
 
 __version__ = "1.0.3"
 __author__ = "NGxD TV"
\ No newline at end of file
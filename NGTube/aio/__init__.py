@@ -0,0 +1,14 @@
+"""
+NGTube Async API
+
+Asyncio versions of the NGTube extractors, built on aiohttp (pip install NGTube[async]).
+"""
+
+from .core import AsyncYouTubeCore
+from .video import AsyncVideo
+from .comments import AsyncComments
+from .channel import AsyncChannel
+from .search import AsyncSearch
+from .shorts import AsyncShorts
+
+__all__ = ["AsyncYouTubeCore", "AsyncVideo", "AsyncComments", "AsyncChannel", "AsyncSearch", "AsyncShorts"]
@@ -0,0 +1,126 @@
+"""
+NGTube Async Channel Module
+
+This module provides the asyncio counterpart of Channel.
+"""
+
+from typing import Union, Optional
+from ..channel.channel import Channel
+from ..exceptions import NGTubeError
+from ..paging import drive_async
+from .core import AsyncYouTubeCore, AsyncScraper
+
+
+class AsyncChannel(AsyncScraper, Channel):
+    """
+    Asyncio version of Channel, parsing is shared with Channel.
+
+    Attributes:
+        url (str): The YouTube channel URL.
+        data (dict): The extracted channel data.
+        truncated (bool): True if the last extract_profile() stopped loading videos because of its deadline.
+        continuation (str): Token to resume a truncated extract_profile() from, None otherwise.
+    """
+
+    def __init__(self, url: str, country: Optional[dict] = None, record_type: str = "dict", session=None):
+        """
+        Initialize the AsyncChannel with a URL. The channel page is fetched on first use.
+
+        Args:
+            url (str): The YouTube channel URL.
+            country (dict): Country filter with 'hl' and 'gl' keys, use CountryFilters constants.
+            record_type (str): "dict" for dictionaries, "record" for compact VideoRecord objects in video and shorts lists.
+            session (aiohttp.ClientSession, optional): Shared session, see AsyncYouTubeCore.create_session().
+        """
+        self._session = session
+        self._setup(url, country, record_type)
+        self.visitor_data = None
+
+    def _make_core(self, url: str) -> AsyncYouTubeCore:
+        """Create the core that sends the requests."""
+        return AsyncYouTubeCore(url, session=self._session)
+
+    async def _prepare(self):
+        """Fetch the channel page once and set visitor_data."""
+        if self.visitor_data is None:
+            self.visitor_data = self.core.extract_visitor_data(await self.core.fetch_html())
+
+    async def _extract_channel_id(self) -> str:
+        """Extract channel ID from URL by fetching the channel page."""
+        await self._prepare()
+        if '/channel/' in self.url:
+            return self.url.split('/channel/')[1].split('/')[0].split('?')[0]
+        try:
+            return self._channel_id_from_html(await self.core.fetch_html())
+        except NGTubeError:
+            raise
+        except Exception as e:
+            raise ValueError(f"Failed to extract channel ID: {e}")
+
+    async def extract_profile(self, max_videos: Union[int, str] = 200, deadline=None, time_budget: Optional[float] = None,
+                              continuation: Optional[str] = None) -> dict:
+        """
+        Extract channel profile data including metadata and videos.
+
+        With a deadline, video pages stop loading before a page that would not finish in time,
+        see Channel.extract_profile().
+
+        Args:
+            max_videos (int | str): Maximum number of videos to load. Use 'all' to load all videos.
+            deadline (Deadline | float, optional): A Deadline, or a time.time() timestamp to finish by.
+            time_budget (float, optional): Seconds the call may take.
+            continuation (str, optional): Token of a truncated call, loads the videos from there on.
+        """
+        self.truncated = False
+        self.continuation = None
+        with self.core.budget(deadline, time_budget):
+            channel_id = await self._extract_channel_id()
+            steps = self._profile_steps(channel_id, max_videos, continuation)
+            self._set_videos([video async for video in drive_async(steps, self.core)])
+        return self._profile_result()
+
+    async def extract_shorts(self, max_shorts: Union[int, str] = 200) -> list:
+        """
+        Extract channel shorts.
+
+        Args:
+            max_shorts (int | str): Maximum number of shorts to load. Use 'all' to load all shorts.
+        """
+        channel_id = await self._extract_channel_id()
+        try:
+            data_shorts = await self.core.make_api_request("https://www.youtube.com/youtubei/v1/browse", self._get_payload_shorts(channel_id))
+        except NGTubeError:
+            raise
+        except Exception as e:
+            raise ValueError(f"Failed to fetch shorts data: {e}")
+        return self._extract_shorts_data(data_shorts, max_shorts)
+
+    async def extract_playlists(self, max_playlists: Union[int, str] = 200) -> list:
+        """
+        Extract channel playlists.
+
+        Args:
+            max_playlists (int | str): Maximum number of playlists to load. Use 'all' to load all playlists.
+        """
+        channel_id = await self._extract_channel_id()
+        try:
+            data_playlists = await self.core.make_api_request("https://www.youtube.com/youtubei/v1/browse", self._get_payload_playlists(channel_id))
+        except NGTubeError:
+            raise
+        except Exception as e:
+            raise ValueError(f"Failed to fetch playlists data: {e}")
+        return self._extract_playlists_data(data_playlists, max_playlists)
+
+    async def iter_videos(self, max_videos: Union[int, str] = 200):
+        """
+        Stream channel videos page by page, deduplicated by videoId.
+
+        Args:
+            max_videos (int | str): Maximum number of videos to yield. Use 'all' to load all videos.
+
+        Yields:
+            dict: A video.
+        """
+        channel_id = await self._extract_channel_id()
+        async for video in drive_async(self._videos_steps(channel_id, max_videos), self.core):
+            yield video
@@ -0,0 +1,149 @@
+"""
+NGTube Async Comments Module
+
+This module provides the asyncio counterpart of Comments.
+"""
+
+from typing import Optional
+from ..comments.comments import Comments
+from ..paging import drive_async
+from .core import AsyncYouTubeCore, AsyncScraper
+
+
+class AsyncComments(AsyncScraper, Comments):
+    """
+    Asyncio version of Comments, parsing is shared with Comments.
+
+    Attributes:
+        url (str): The YouTube video URL.
+        comments (list): List of extracted comments.
+        top_comments (list): List of top/pinned comments.
+        continuation (str): Token of the first comments page the next get_comments() loads, e.g. after
+            a truncated call or one that stopped at max_comments. None before the first call, which
+            starts from the watch page, and once all comments are loaded.
+        truncated (bool): True if the last get_comments() stopped early because of its deadline.
+    """
+
+    def __init__(self, url: str, country: Optional[dict] = None, record_type: str = "dict", session=None):
+        """
+        Initialize the AsyncComments with a URL. The watch page is fetched on first use.
+
+        Args:
+            url (str): The YouTube video URL.
+            country (dict): Country filter with 'hl' and 'gl' keys, use CountryFilters constants.
+            record_type (str): "dict" for dictionaries, "record" for compact CommentRecord objects.
+            session (aiohttp.ClientSession, optional): Shared session, see AsyncYouTubeCore.create_session().
+        """
+        self._session = session
+        self._setup(url, country, record_type)
+        self.visitor_data = None
+
+    @classmethod
+    def from_continuation(cls, token: str, visitor_data: str, country: Optional[dict] = None, record_type: str = "dict",
+                          session=None) -> "AsyncComments":
+        """
+        Create a comments loader from an existing comments continuation token without fetching the watch page.
+
+        Args:
+            token (str): The comments continuation token.
+            visitor_data (str): The visitorData the token was issued for.
+            country (dict): Country filter with 'hl' and 'gl' keys, use CountryFilters constants.
+            record_type (str): "dict" for dictionaries, "record" for compact CommentRecord objects.
+            session (aiohttp.ClientSession, optional): Shared session, see AsyncYouTubeCore.create_session().
+
+        Returns:
+            AsyncComments: A loader whose get_comments() and iter_comments() start from the token.
+        """
+        comments = cls.__new__(cls)
+        comments._session = session
+        comments._setup("https://www.youtube.com", country, record_type)
+        comments.visitor_data = visitor_data
+        comments.continuation = token
+        return comments
+
+    def _make_core(self, url: str) -> AsyncYouTubeCore:
+        """Create the core that sends the requests."""
+        return AsyncYouTubeCore(url, session=self._session)
+
+    async def _initial_data(self) -> dict:
+        """Fetch the watch page, set visitor_data and return its ytInitialData."""
+        html = await self.core.fetch_html()
+        if self.visitor_data is None:
+            self.visitor_data = self.core.extract_visitor_data(html)
+        return self.core.extract_ytinitialdata(html)
+
+    async def load_more_comments(self, data: dict, max_comments: Optional[int] = None):
+        """
+        Load additional comments via YouTube's API.
+
+        Args:
+            data (dict): The ytInitialData JSON.
+            max_comments (int, optional): Maximum number of comments to load. If None, loads all available.
+        """
+        await self._load_comment_pages(self._find_continuation(data), max_comments)
+
+    async def _load_comment_pages(self, continuation_token: Optional[str], max_comments: Optional[int]):
+        """Append comment pages from a token until max_comments comments in total or 50 pages are loaded."""
+        self._page_continuation = continuation_token
+        if continuation_token and (max_comments is None or len(self.comments) < max_comments):
+            max_calls = 50
+            call_count = 0
+            async for page_comments in self._iter_comment_pages(continuation_token):
+                self.comments.extend(page_comments)
+                call_count += 1
+                if call_count >= max_calls or (max_comments is not None and len(self.comments) >= max_comments):
+                    break
+        self._advance_continuation()
+
+    async def iter_comments(self, max_comments: Optional[int] = None):
+        """
+        Stream comments page by page from YouTube's API.
+
+        Args:
+            max_comments (int, optional): Maximum number of comments to yield. If None, yields all available.
+
+        Yields:
+            dict: A comment.
+        """
+        token = self.continuation
+        if not token:
+            token = self._find_continuation(await self._initial_data())
+        if not token:
+            return
+        yielded = 0
+        async for page_comments in self._iter_comment_pages(token):
+            for comment in page_comments:
+                if max_comments is not None and yielded >= max_comments:
+                    return
+                yield comment
+                yielded += 1
+
+    def _iter_comment_pages(self, continuation_token: str):
+        """Yield the comments of each API page, following continuations until a page has no comments."""
+        return drive_async(self._comment_page_steps(continuation_token), self.core)
+
+    async def get_comments(self, max_comments: Optional[int] = None, deadline=None, time_budget: Optional[float] = None) -> dict:
+        """
+        Get all available comments for the video, separated into top comments and regular comments.
+
+        With a deadline, loading stops before a page that would not finish in time, see Comments.get_comments().
+
+        Args:
+            max_comments (int, optional): Maximum number of comments in total, including those of
+                earlier calls. If None, loads all available.
+            deadline (Deadline | float, optional): A Deadline, or a time.time() timestamp to finish by.
+            time_budget (float, optional): Seconds the call may take.
+
+        Returns:
+            dict: Dictionary with 'top_comment' and 'comments' lists, 'truncated' and the
+                'continuation' to resume from (None unless truncated).
+        """
+        self.truncated = False
+        with self.core.budget(deadline, time_budget):
+            if self.continuation:
+                await self._load_comment_pages(self.continuation, max_comments)
+            elif not self._started:
+                data = await self._initial_data()
+                self.extract_initial_comments(data)
+                await self.load_more_comments(data, max_comments)
+        return self._comments_result()
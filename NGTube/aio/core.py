@@ -0,0 +1,291 @@
+"""
+NGTube Async Core Module
+
+This module provides the asyncio counterpart of YouTubeCore, built on aiohttp.
+Requires aiohttp (pip install NGTube[async]).
+"""
+
+import asyncio
+import re
+import time
+from typing import Optional
+from ..cache import ResponseCache
+from ..core import YouTubeCore
+from ..exceptions import DeadlineExceededError
+from ..ratelimit import endpoint_family
+from ..singleflight import AsyncSingleFlight
+
+
+def _import_aiohttp():
+    try:
+        import aiohttp
+    except ImportError:
+        raise ImportError("The async API requires aiohttp, install it with 'pip install NGTube[async]'")
+    return aiohttp
+
+
+class AsyncYouTubeCore(YouTubeCore):
+    """
+    Core class for YouTube data extraction on asyncio.
+
+    fetch_html(), make_api_request(), fetch_api_body() and get_client_version() are coroutines, the parsing
+    helpers are inherited from YouTubeCore. Requests go through an aiohttp ClientSession.
+    Pass one session to every extractor to share its connection pool, otherwise each
+    instance creates its own on first use and closes it in close().
+
+    Failed requests are retried like in YouTubeCore, connection errors included: up to
+    retries times, with exponential backoff or the Retry-After delay of 429/503 responses.
+    The response cache, rate limits, circuit breaker, hedging, deadlines, base_url and proxy
+    apply as in YouTubeCore, transport adapters do not. Cache lookups run in the default
+    executor so they do not block the event loop.
+
+    Attributes:
+        session (aiohttp.ClientSession): The session, None until the first request if none was given.
+        single_flight (AsyncSingleFlight): Coalesces identical concurrent requests of all async
+            instances, None to disable it.
+    """
+
+    single_flight = AsyncSingleFlight()
+
+    def __init__(self, url: str, session=None, cache: Optional[ResponseCache] = None, base_url: Optional[str] = None,
+                 proxy: Optional[str] = None):
+        """
+        Initialize the AsyncYouTubeCore with a URL.
+
+        Args:
+            url (str): The YouTube URL.
+            session (aiohttp.ClientSession, optional): Shared session, see create_session().
+            cache (ResponseCache, optional): Response cache for this instance, overrides YouTubeCore.cache.
+            base_url (str, optional): Base URL for this instance, overrides YouTubeCore.base_url.
+            proxy (str, optional): HTTP proxy URL for this instance, overrides YouTubeCore.proxy.
+        """
+        super().__init__(url, cache=cache, base_url=base_url, proxy=proxy)
+        self.session = session
+        self._owns_session = session is None
+
+    def _init_session(self):
+        # The aiohttp session has to be created inside the event loop, see _get_session()
+        return None
+
+    @staticmethod
+    def create_session(limit: int = 100, **kwargs):
+        """
+        Create an aiohttp ClientSession suited for sharing between extractors.
+
+        Args:
+            limit (int): Maximum number of simultaneous connections.
+            **kwargs: Passed to aiohttp.ClientSession.
+
+        Returns:
+            aiohttp.ClientSession: The session, close it when done.
+        """
+        aiohttp = _import_aiohttp()
+        return aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=limit), **kwargs)
+
+    def _get_session(self):
+        if self.session is None:
+            self.session = self.create_session()
+            self._owns_session = True
+        return self.session
+
+    async def close(self):
+        """Close the session if this instance created it."""
+        if self._owns_session and self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def _request(self, method: str, url: str, headers: Optional[dict] = None, **kwargs):
+        """
+        Send a request through the circuit breaker and rate limiter, with retries.
+        Extra headers are sent on top of the core's headers.
+
+        Returns:
+            tuple: Status, body and Retry-After header of the last response.
+        """
+        aiohttp = _import_aiohttp()
+        session = self._get_session()
+        limiter = self.rate_limits.limiter(url) if self.rate_limits is not None else None
+        headers = {**self.headers, **headers} if headers else self.headers
+
+        async def send():
+            seconds = self.deadline.timeout(self.timeout) if self.deadline is not None else self.timeout
+            timeout = aiohttp.ClientTimeout(total=seconds)
+            async with session.request(method, url, headers=headers, cookies=self.cookies, timeout=timeout,
+                                       proxy=self.proxy, **kwargs) as response:
+                return response.status, await response.read(), response.headers.get('Retry-After')
+
+        if self.hedging is not None and endpoint_family(url) is not None:
+            allow = limiter.try_acquire if limiter is not None else None
+            hedging = self.hedging
+            attempt_once = lambda: hedging.run_async(send, allow=allow)
+        else:
+            attempt_once = send
+
+        for attempt in range(self.retries + 1):
+            if self.breaker is not None:
+                await self._wait(self.breaker.wait_time(), url)
+            if limiter is not None:
+                await self._wait(limiter.reserve(), url)
+            start = time.monotonic()
+            try:
+                status, body, retry_after = await attempt_once()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if self._deadline_passed():
+                    raise DeadlineExceededError(f"Deadline passed during request to {url}") from e
+                self._record(limiter, None, time.monotonic() - start)
+                if attempt >= self.retries:
+                    raise
+                await self._wait(self._retry_delay(attempt), url)
+                continue
+            latency = time.monotonic() - start
+            self._record(limiter, status, latency)
+            if self.deadline is not None:
+                self.deadline.observe(latency)
+            if status not in self.retry_statuses or attempt >= self.retries:
+                return status, body, retry_after
+            await self._wait(self._retry_delay(attempt, status, retry_after), url)
+
+    async def _wait(self, seconds: float, url: str):
+        """Sleep before a request. Raises DeadlineExceededError instead if the request could not start in time."""
+        self._check_deadline(seconds, url)
+        if seconds > 0:
+            await asyncio.sleep(seconds)
+
+    async def _cache_get(self, key: str) -> Optional[bytes]:
+        """Look up the response cache in the default executor, it does blocking file I/O."""
+        if self.cache is None:
+            return None
+        return await asyncio.get_event_loop().run_in_executor(None, self.cache.get, key)
+
+    async def _cache_set(self, key: str, body: bytes):
+        """Store a response in the cache in the default executor."""
+        if self.cache is not None:
+            await asyncio.get_event_loop().run_in_executor(None, self.cache.set, key, body)
+
+    async def fetch_html(self) -> str:
+        """
+        Fetch the HTML content from the YouTube URL.
+
+        Returns:
+            str: The HTML content.
+        """
+        if self._cached_html:
+            return self._cached_html
+
+        url = self.resolve_url(self.url)
+        key = ResponseCache.make_key("GET", url)
+        body = await self._cache_get(key)
+        if body is not None:
+            self._cached_html = body.decode("utf-8")
+            return self._cached_html
+
+        async def fetch() -> str:
+            status, body, retry_after = await self._request("GET", url)
+            if status != 200:
+                raise self._status_error(f"Failed to fetch HTML: {status}", url, status, retry_after)
+            await self._cache_set(key, body)
+            return body.decode("utf-8", "replace")
+
+        self._cached_html = await self.coalesce(key, fetch)
+        return self._cached_html
+
+    async def make_api_request(self, endpoint: str, payload: dict, cacheable: bool = True,
+                               headers: Optional[dict] = None) -> dict:
+        """
+        Make a POST request to YouTube's internal API.
+
+        Args:
+            endpoint (str): The API endpoint.
+            payload (dict): The request payload.
+            cacheable (bool): False for requests whose answer differs on every call, see fetch_api_body().
+            headers (dict, optional): Extra HTTP headers for this request only.
+
+        Returns:
+            dict: The API response JSON.
+        """
+        return self._decode_api_body(await self.fetch_api_body(endpoint, payload, cacheable, headers))
+
+    async def fetch_api_body(self, endpoint: str, payload: dict, cacheable: bool = True,
+                             headers: Optional[dict] = None) -> bytes:
+        """
+        Make a POST request to YouTube's internal API and return the undecoded body.
+
+        Args:
+            endpoint (str): The API endpoint.
+            payload (dict): The request payload.
+            cacheable (bool): False for requests whose answer differs on every call, e.g. random shorts.
+                They bypass the response cache and are never merged with identical concurrent requests.
+            headers (dict, optional): Extra HTTP headers for this request only, e.g. a client-specific
+                User-Agent. They are not part of the cache key.
+
+        Returns:
+            bytes: The API response body.
+        """
+        endpoint = self.resolve_url(endpoint)
+        key = ResponseCache.make_key("POST", endpoint, payload)
+        if cacheable:
+            body = await self._cache_get(key)
+            if body is not None:
+                return body
+
+        async def fetch() -> bytes:
+            status, body, retry_after = await self._request("POST", endpoint, json=payload, headers=headers)
+            if status != 200:
+                raise self._status_error(f"API request failed: {status}", endpoint, status, retry_after)
+            if cacheable:
+                await self._cache_set(key, body)
+            return body
+
+        if not cacheable:
+            return await fetch()
+        return await self.coalesce(key, fetch)
+
+    async def coalesce(self, key, fn):
+        """
+        Await fn() through single_flight, so concurrent calls with the same key share one call.
+        A task waits for another task's call at most until its own deadline.
+
+        Args:
+            key (hashable): Identifies equivalent calls, e.g. a ResponseCache key.
+            fn (callable): Coroutine function without arguments.
+
+        Returns:
+            The result of fn, possibly from another task's call. Copy mutable results before changing them.
+        """
+        if self.single_flight is None:
+            return await fn()
+        return (await self.single_flight.do(key, fn, self.deadline))[0]
+
+    async def get_client_version(self, fallback: str = "2.20251208.06.00") -> str:
+        """
+        Extract clientVersion from the page HTML, with optional fallback.
+        """
+        if self._client_version:
+            return self._client_version
+        try:
+            html = await self.fetch_html()
+            match = re.search(r'"clientVersion"\s*:\s*"([^"]+)"', html)
+            if match:
+                self._client_version = match.group(1)
+                return self._client_version
+        except Exception:
+            pass
+        return fallback
+
+
+class AsyncScraper:
+    """
+    Base for async extractors: closing and async context manager support.
+
+    Closing an extractor closes its session only if the extractor created it.
+    """
+
+    async def close(self):
+        """Close the underlying session if this extractor created it."""
+        await self.core.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
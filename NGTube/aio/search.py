@@ -0,0 +1,81 @@
+"""
+NGTube Async Search Module
+
+This module provides the asyncio counterpart of Search.
+"""
+
+from typing import Optional
+from ..search.search import Search
+from ..paging import drive_async
+from .core import AsyncYouTubeCore, AsyncScraper
+
+
+class AsyncSearch(AsyncScraper, Search):
+    """
+    Asyncio version of Search, parsing is shared with Search.
+
+    Attributes:
+        query (str): The search query.
+        max_results (int): Maximum number of results to load.
+        results (list): List of video results.
+        estimated_results (int): Estimated total results.
+        truncated (bool): True if the last search stopped early because of its deadline.
+        continuation (str): Token a truncated search resumes from on the next perform_search(), None
+            to start from the first page.
+    """
+
+    def __init__(self, query: str, max_results: int = 50, filter: str = "", country: Optional[dict] = None,
+                 record_type: str = "dict", session=None):
+        """
+        Initialize the AsyncSearch with a query. The home page is fetched on first use.
+
+        Args:
+            query (str): The search query.
+            max_results (int): Maximum number of results to load.
+            filter (str): Search filter, use SearchFilters constants or custom params string.
+            country (dict): Country filter with 'hl' and 'gl' keys, use CountryFilters constants.
+            record_type (str): "dict" for dictionaries, "record" for compact SearchHit objects.
+            session (aiohttp.ClientSession, optional): Shared session, see AsyncYouTubeCore.create_session().
+        """
+        self._session = session
+        self._setup(query, max_results, filter, country, record_type)
+        self.visitor_data = None
+        self.client_version = None
+        self.payload = None
+
+    async def _prepare(self):
+        """Fetch the home page once and build the search payload."""
+        if self.payload is None:
+            self.visitor_data = self.core.extract_visitor_data(await self.core.fetch_html())
+            self.client_version = await self.core.get_client_version("2.20251208.06.00")
+            self.payload = self._get_payload()
+
+    def _make_core(self, url: str) -> AsyncYouTubeCore:
+        """Create the core that sends the requests."""
+        return AsyncYouTubeCore(url, session=self._session)
+
+    async def perform_search(self, deadline=None, time_budget: Optional[float] = None):
+        """
+        Perform the search and load results.
+
+        With a deadline, loading stops before a page that would not finish in time, see Search.perform_search().
+
+        Args:
+            deadline (Deadline | float, optional): A Deadline, or a time.time() timestamp to finish by.
+            time_budget (float, optional): Seconds the call may take.
+        """
+        with self.core.budget(deadline, time_budget):
+            self.results.extend([result async for result in self.iter_results()])
+
+    async def iter_results(self):
+        """
+        Stream search results page by page without storing them in results.
+
+        Stops after the page on which max_results is reached.
+
+        Yields:
+            dict: A search result.
+        """
+        await self._prepare()
+        async for result in drive_async(self._result_steps(), self.core):
+            yield result
@@ -0,0 +1,223 @@
+"""
+NGTube Async Shorts Module
+
+This module provides the asyncio counterpart of Shorts.
+"""
+
+import asyncio
+from typing import Optional
+from ..shorts.shorts import Shorts
+from ..paging import drive_async
+from .core import AsyncYouTubeCore, AsyncScraper
+
+
+class AsyncShorts(AsyncScraper, Shorts):
+    """
+    Asyncio version of Shorts, parsing is shared with Shorts.
+
+    Concurrent requests run as tasks on the event loop instead of worker threads.
+
+    Attributes:
+        data (dict): The extracted short data.
+        truncated (bool): True if the last fetch_shorts_feed() stopped early because of its deadline.
+        continuation (str): Feed token to resume a truncated fetch_shorts_feed() from, None otherwise.
+    """
+
+    def __init__(self, country: Optional[dict] = None, record_type: str = "dict", session=None):
+        """
+        Initialize the AsyncShorts class. The Shorts page is fetched on first use.
+
+        Args:
+            country (dict): Country filter with 'hl' and 'gl' keys, use CountryFilters constants.
+            record_type (str): "dict" for dictionaries, "record" for compact ShortRecord objects.
+            session (aiohttp.ClientSession, optional): Shared session, see AsyncYouTubeCore.create_session().
+        """
+        self._session = session
+        self._setup(country, record_type)
+        self.client_version = None
+        self.visitor_data = None
+
+    def _make_core(self, url: str) -> AsyncYouTubeCore:
+        """Create the core that sends the requests."""
+        return AsyncYouTubeCore(url, session=self._session)
+
+    async def _prepare(self):
+        """Fetch the Shorts page once and set client_version and visitor_data."""
+        if self.visitor_data is None:
+            self.client_version = await self.core.get_client_version("2.20251212.01.00")
+            self.visitor_data = self.core.extract_visitor_data(await self.core.fetch_html())
+
+    async def fetch_short(self) -> dict:
+        """
+        Fetch a random short from YouTube.
+
+        Returns:
+            dict: A dictionary containing short metadata.
+        """
+        self.data = self._short_record(await self._fetch_random_short())
+        return self.data
+
+    async def _fetch_random_short(self) -> dict:
+        """Fetch and parse one random short."""
+        await self._prepare()
+        response = await self.core.make_api_request(self.endpoint, self._get_watch_payload(), cacheable=False)
+
+        if response.get("status") == "REEL_ITEM_WATCH_STATUS_SUCCEEDED":
+            return self._parse_response(response)
+        raise Exception("Failed to fetch short")
+
+    async def sample(self, n: int, concurrency: int = 4, max_requests: Optional[int] = None) -> list:
+        """
+        Sample unique random shorts.
+
+        Args:
+            n (int): Number of unique shorts to collect.
+            concurrency (int): Number of parallel reel_item_watch requests.
+            max_requests (int, optional): Stop after this many requests. Defaults to 10 * n.
+
+        Returns:
+            list: Unique short metadata dictionaries. Request statistics are stored in sample_stats.
+        """
+        return [short async for short in self.iter_sample(n, concurrency, max_requests)]
+
+    async def iter_sample(self, n: int, concurrency: int = 4, max_requests: Optional[int] = None):
+        """
+        Stream unique random shorts, deduplicated by video ID.
+
+        Args:
+            n (int): Number of unique shorts to yield.
+            concurrency (int): Number of parallel reel_item_watch requests.
+            max_requests (int, optional): Stop after this many requests. Defaults to 10 * n.
+
+        Yields:
+            dict: Short metadata for every short not seen before.
+        """
+        await self._prepare()
+        max_requests, seen = self._start_sample(n, max_requests)
+        stats = self.sample_stats
+        concurrency = max(1, concurrency)
+
+        pending = set()
+        submitted = 0
+        try:
+            while stats['unique'] < n:
+                while len(pending) < concurrency and submitted < max_requests:
+                    pending.add(asyncio.ensure_future(self._fetch_random_short()))
+                    submitted += 1
+                if not pending:
+                    break
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    try:
+                        short_data = task.result()
+                    except Exception:
+                        short_data = None
+                    if self._accept_sample(short_data, seen, n):
+                        yield self._short_record(short_data)
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def fetch_shorts_feed(self, max_shorts: int = 50, enrich: bool = False, workers: int = 4, deadline=None,
+                                time_budget: Optional[float] = None, continuation: Optional[str] = None) -> list:
+        """
+        Fetch multiple shorts from the YouTube Shorts feed.
+
+        With a deadline, paging stops before a page that would not finish in time, see Shorts.fetch_shorts_feed().
+
+        Args:
+            max_shorts (int): Maximum number of shorts to fetch.
+            enrich (bool): If True, load full metadata (likes, comment count, comments continuation) for every short.
+            workers (int): Number of parallel detail requests when enrich is True.
+            deadline (Deadline | float, optional): A Deadline, or a time.time() timestamp to finish by.
+            time_budget (float, optional): Seconds the call may take.
+            continuation (str, optional): Feed token of a truncated call to resume from.
+
+        Returns:
+            list: A list of dictionaries containing short metadata (basic info only unless enrich is True).
+        """
+        with self.core.budget(deadline, time_budget):
+            return [short async for short in self.iter_shorts_feed(max_shorts, enrich=enrich, workers=workers,
+                                                                   continuation=continuation)]
+
+    async def iter_shorts_feed(self, max_shorts: int = 50, prefetch: int = 2, enrich: bool = False, workers: int = 4,
+                               continuation: Optional[str] = None):
+        """
+        Stream shorts from the YouTube Shorts feed.
+
+        The next sequence page is requested by a background task as soon as its
+        continuation token is known, so network time overlaps with parsing.
+
+        Args:
+            max_shorts (int): Maximum number of shorts to yield.
+            prefetch (int): Maximum number of fetched pages waiting to be parsed.
+            enrich (bool): If True, load full metadata for every short while the feed keeps paging.
+                Enriched shorts are yielded in completion order, marked as in Shorts.fetch_shorts_feed().
+            workers (int): Number of parallel detail requests when enrich is True.
+            continuation (str, optional): Feed token to start from instead of the Shorts page.
+
+        Yields:
+            dict: Short metadata (basic info only unless enrich is True).
+        """
+        shorts = self._iter_feed_entries(max_shorts, prefetch, continuation)
+        if enrich:
+            shorts = self._enrich_shorts(shorts, workers)
+        async for short_data in shorts:
+            yield self._short_record(short_data)
+
+    async def _iter_feed_entries(self, max_shorts: int, prefetch: int, continuation: Optional[str] = None):
+        """Yield basic short data from the feed while a background task fetches the next pages."""
+        self.truncated = False
+        self.continuation = None
+        await self._prepare()
+        sequence_continuation = continuation or self._feed_start(await self.core.fetch_html())
+
+        pages = asyncio.Queue(maxsize=max(1, prefetch))
+
+        async def fetch_pages(token: str):
+            try:
+                async for page in drive_async(self._feed_page_steps(token, max_shorts), self.core):
+                    await pages.put(page)
+            except Exception as e:
+                await pages.put(e)
+                return
+            await pages.put(None)
+
+        fetcher = asyncio.ensure_future(fetch_pages(sequence_continuation))
+        yielded = 0
+        try:
+            while yielded < max_shorts:
+                page_shorts = self._feed_page_shorts(await pages.get())
+                if page_shorts is None:
+                    break
+                for short_data in page_shorts[:max_shorts - yielded]:
+                    yield short_data
+                    yielded += 1
+        finally:
+            fetcher.cancel()
+
+    async def _enrich_shorts(self, shorts, workers: int):
+        """Load full metadata for shorts from an async iterator, keeping at most 2 * workers requests in flight."""
+        workers = max(1, workers)
+        pending = set()
+        try:
+            async for short_data in shorts:
+                pending.add(asyncio.ensure_future(self._enrich_short(short_data)))
+                if len(pending) >= workers * 2:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        yield task.result()
+            for task in asyncio.as_completed(pending):
+                yield await task
+            pending = set()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _enrich_short(self, short_data: dict) -> dict:
+        """Add reel_item_watch metadata to basic feed data. Falls back to the marked basic data on failure."""
+        try:
+            response = await self.core.make_api_request(self.endpoint, self._get_watch_payload(short_data['video_id']))
+        except Exception as e:
+            return self._enrich_failed(short_data, f"{type(e).__name__}: {e}")
+        return self._merge_details(short_data, response)
@@ -0,0 +1,47 @@
+"""
+NGTube Async Video Module
+
+This module provides the asyncio counterpart of Video.
+"""
+
+import copy
+from ..video.video import Video
+from .core import AsyncYouTubeCore, AsyncScraper
+
+
+class AsyncVideo(AsyncScraper, Video):
+    """
+    Asyncio version of Video, parsing is shared with Video.
+
+    Attributes:
+        url (str): The YouTube video URL.
+        data (dict): The extracted video data.
+    """
+
+    def __init__(self, url: str, session=None):
+        """
+        Initialize the AsyncVideo with a URL. No request is made until extract_metadata() is awaited.
+
+        Args:
+            url (str): The YouTube video URL.
+            session (aiohttp.ClientSession, optional): Shared session, see AsyncYouTubeCore.create_session().
+        """
+        self.url = url
+        self.core = AsyncYouTubeCore(url, session=session)
+        self.data = {}
+
+    async def extract_metadata(self) -> dict:
+        """
+        Extract video metadata from ytInitialData and ytInitialPlayerResponse.
+
+        Returns:
+            dict: A dictionary containing video metadata.
+        """
+        async def parse() -> dict:
+            return self._parse_metadata(await self.core.fetch_html())
+
+        data = await self.core.coalesce(("metadata", self.core.resolve_url(self.url)), parse)
+        if data is not self.data:
+            # Parsed by another instance
+            self.data = copy.deepcopy(data)
+        return self.data
@@ -0,0 +1,130 @@
+"""
+NGTube Circuit Breaker Module
+
+This module provides the circuit breaker shared by all YouTubeCore instances. It pauses
+every worker when YouTube asks for it (Retry-After) or when too many requests fail,
+instead of letting each worker keep retrying on its own.
+"""
+
+import collections
+import threading
+import time
+from .exceptions import CircuitOpenError
+
+
+class CircuitBreaker:
+    """
+    Thread-safe circuit breaker over the outcomes of recent requests.
+
+    The breaker opens for cooldown seconds when at least threshold of the last window
+    requests failed (and at least min_requests were seen), and for the Retry-After delay
+    of every 429/503 response. While it is open, wait_time() tells callers how long to wait
+    before a request; YouTubeCore sleeps that long, checking its deadline first. If the wait
+    would take longer than max_wait, wait_time() raises CircuitOpenError instead, so batch
+    runners can reschedule the job. After a cooldown the outcome window starts over, and a failure
+    in the first requests reopens the breaker with twice the cooldown, up to max_cooldown.
+
+    Attributes:
+        threshold (float): Failure ratio that opens the breaker.
+        window (int): Number of recent outcomes considered.
+        min_requests (int): Outcomes needed before the ratio is checked.
+        cooldown (float): Seconds the breaker stays open after tripping.
+        max_cooldown (float): Longest cooldown after repeated trips.
+        max_wait (float): Longest wait wait_time() returns before raising CircuitOpenError instead.
+    """
+
+    def __init__(self, threshold: float = 0.5, window: int = 50, min_requests: int = 25, cooldown: float = 10.0,
+                 max_cooldown: float = 300.0, max_wait: float = 60.0):
+        """
+        Create a circuit breaker.
+
+        Args:
+            threshold (float): Failure ratio that opens the breaker.
+            window (int): Number of recent outcomes considered.
+            min_requests (int): Outcomes needed before the ratio is checked.
+            cooldown (float): Seconds the breaker stays open after tripping.
+            max_cooldown (float): Longest cooldown after repeated trips.
+            max_wait (float): Longest wait wait_time() returns before raising CircuitOpenError instead.
+        """
+        self.threshold = threshold
+        self.window = window
+        self.min_requests = min_requests
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.max_wait = max_wait
+        self._outcomes = collections.deque(maxlen=window)
+        self._open_until = 0.0
+        self._current_cooldown = cooldown
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        """True while requests are held back."""
+        return time.monotonic() < self._open_until
+
+    def wait_time(self) -> float:
+        """
+        Get the time a request has to wait before it may be sent.
+
+        Returns:
+            float: Seconds until the breaker closes, 0 if it is closed.
+
+        Raises:
+            CircuitOpenError: If the wait is longer than max_wait.
+        """
+        with self._lock:
+            wait = max(0.0, self._open_until - time.monotonic())
+        if wait > self.max_wait:
+            raise CircuitOpenError(f"Circuit breaker open for another {wait:.0f} s", retry_after=wait)
+        return wait
+
+    def pause(self, seconds: float):
+        """
+        Hold back all requests for a number of seconds, e.g. the Retry-After delay of a response.
+
+        Args:
+            seconds (float): Seconds to pause.
+        """
+        with self._lock:
+            self._open_until = max(self._open_until, time.monotonic() + seconds)
+
+    def record(self, success: bool):
+        """
+        Record the outcome of a request.
+
+        Args:
+            success (bool): False for connection errors, 429 and 5xx responses.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if now < self._open_until:
+                # Sent before the breaker opened
+                return
+            if self._probing:
+                # First outcomes after a trip decide whether the breaker stays closed
+                if success:
+                    self._probing = False
+                    self._current_cooldown = self.cooldown
+                else:
+                    self._current_cooldown = min(self.max_cooldown, self._current_cooldown * 2)
+                    self._trip(now)
+                    return
+            self._outcomes.append(success)
+            if len(self._outcomes) >= self.min_requests:
+                failures = self._outcomes.count(False)
+                if failures / len(self._outcomes) >= self.threshold:
+                    self._trip(now)
+
+    def _trip(self, now: float):
+        self._open_until = max(self._open_until, now + self._current_cooldown)
+        self._outcomes.clear()
+        self._probing = True
+
+    def reset(self):
+        """Close the breaker and forget all outcomes."""
+        with self._lock:
+            self._outcomes.clear()
+            self._open_until = 0.0
+            self._current_cooldown = self.cooldown
+            self._probing = False
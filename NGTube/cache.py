@@ -0,0 +1,191 @@
+"""
+NGTube Cache Module
+
+This module provides an on-disk HTTP response cache shared by all YouTubeCore instances.
+"""
+
+import copy
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Optional
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    digest TEXT NOT NULL,
+    expires REAL NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS blobs (
+    digest TEXT PRIMARY KEY,
+    size INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_entries_accessed ON entries (accessed);
+CREATE INDEX IF NOT EXISTS idx_entries_digest ON entries (digest);
+"""
+
+
+class ResponseCache:
+    """
+    On-disk response cache with TTL, size-bounded eviction and content-hash deduplication.
+
+    Bodies are stored zlib-compressed under their SHA-256, so identical responses reached
+    through different keys are stored once. An SQLite index maps keys to bodies. When the
+    compressed size exceeds max_bytes, the least recently used entries are evicted.
+
+    Enable it for every scraper with:
+
+        YouTubeCore.cache = ResponseCache("~/.cache/ngtube", ttl=3600)
+
+    Attributes:
+        directory (str): The cache directory.
+        ttl (float): Default time to live in seconds.
+        max_bytes (int): Maximum compressed size of all bodies.
+    """
+
+    def __init__(self, directory: str = "~/.cache/ngtube", ttl: float = 3600, max_bytes: int = 512 * 1024 * 1024):
+        """
+        Open or create a cache.
+
+        Args:
+            directory (str): The cache directory.
+            ttl (float): Default time to live in seconds.
+            max_bytes (int): Maximum compressed size of all bodies.
+        """
+        self.directory = os.path.expanduser(directory)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        os.makedirs(os.path.join(self.directory, "blobs"), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(os.path.join(self.directory, "index.sqlite"), check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    @staticmethod
+    def make_key(method: str, url: str, payload: Optional[dict] = None) -> str:
+        """
+        Build a cache key from the request.
+
+        The payload is serialized with sorted keys. The per-session visitorData is left out,
+        so different scraper instances share entries. Continuation tokens stay part of the key.
+
+        Args:
+            method (str): HTTP method.
+            url (str): Request URL.
+            payload (dict, optional): JSON request body.
+
+        Returns:
+            str: The key.
+        """
+        normalized = ""
+        if payload is not None:
+            client = payload.get("context", {}).get("client", {})
+            if "visitorData" in client:
+                payload = copy.deepcopy(payload)
+                del payload["context"]["client"]["visitorData"]
+            normalized = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(f"{method} {url} {normalized}".encode("utf-8")).hexdigest()
+
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self.directory, "blobs", digest[:2], digest)
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Get a cached body.
+
+        Args:
+            key (str): The key from make_key().
+
+        Returns:
+            bytes | None: The body, or None if missing or expired.
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT digest, expires FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            if row[1] < now:
+                with self._conn:
+                    self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                return None
+            with self._conn:
+                self._conn.execute("UPDATE entries SET accessed = ? WHERE key = ?", (now, key))
+        try:
+            with open(self._blob_path(row[0]), "rb") as f:
+                return zlib.decompress(f.read())
+        except (OSError, zlib.error):
+            return None
+
+    def set(self, key: str, body: bytes, ttl: Optional[float] = None):
+        """
+        Store a body.
+
+        Args:
+            key (str): The key from make_key().
+            body (bytes): The response body.
+            ttl (float, optional): Time to live in seconds, defaults to the cache ttl.
+        """
+        digest = hashlib.sha256(body).hexdigest()
+        path = self._blob_path(digest)
+        now = time.time()
+        with self._lock:
+            known = self._conn.execute("SELECT 1 FROM blobs WHERE digest = ?", (digest,)).fetchone()
+            if not known or not os.path.exists(path):
+                compressed = zlib.compress(body, 6)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+                with open(temp_path, "wb") as f:
+                    f.write(compressed)
+                os.replace(temp_path, path)
+                with self._conn:
+                    self._conn.execute("INSERT OR REPLACE INTO blobs (digest, size) VALUES (?, ?)", (digest, len(compressed)))
+            previous = self._conn.execute("SELECT digest FROM entries WHERE key = ?", (key,)).fetchone()
+            with self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO entries (key, digest, expires, accessed) VALUES (?, ?, ?, ?)",
+                    (key, digest, now + (self.ttl if ttl is None else ttl), now),
+                )
+            self._evict(now, replaced=previous is not None and previous[0] != digest)
+
+    def _evict(self, now: float, replaced: bool = False):
+        """Remove expired entries, then least recently used ones until the size bound holds. Caller holds the lock."""
+        with self._conn:
+            removed = self._conn.execute("DELETE FROM entries WHERE expires < ?", (now,)).rowcount + int(replaced)
+            total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+            if total > self.max_bytes:
+                for key, digest in self._conn.execute("SELECT key, digest FROM entries ORDER BY accessed").fetchall():
+                    self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                    removed += 1
+                    if not self._conn.execute("SELECT 1 FROM entries WHERE digest = ? LIMIT 1", (digest,)).fetchone():
+                        size = self._conn.execute("SELECT size FROM blobs WHERE digest = ?", (digest,)).fetchone()
+                        total -= size[0] if size else 0
+                    if total <= self.max_bytes:
+                        break
+            if not removed:
+                return
+            orphans = self._conn.execute(
+                "SELECT digest FROM blobs WHERE digest NOT IN (SELECT DISTINCT digest FROM entries)"
+            ).fetchall()
+            for (digest,) in orphans:
+                self._conn.execute("DELETE FROM blobs WHERE digest = ?", (digest,))
+                try:
+                    os.remove(self._blob_path(digest))
+                except OSError:
+                    pass
+
+    def clear(self):
+        """Remove all entries and bodies."""
+        with self._lock:
+            with self._conn:
+                self._conn.execute("UPDATE entries SET expires = 0")
+            self._evict(time.time())
+
+    def close(self):
+        """Close the index."""
+        with self._lock:
+            self._conn.close()
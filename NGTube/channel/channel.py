@@ -4,10 +4,15 @@ NGTube Channel Module
 This module provides functionality to extract channel metadata and videos from YouTube channels.
 """
 
+import json
 import re
+from concurrent.futures import Executor
 from typing import Union, Optional
 from ..core import YouTubeCore
+from ..exceptions import CircuitOpenError, DeadlineExceededError, NGTubeError, ParseError, RateLimitedError
+from ..paging import Fetch, drive
 from .. import utils
+from ..records import VideoRecord, record_factory
 
 class Channel:
     """
@@ -16,61 +21,98 @@ class Channel:
     Attributes:
         url (str): The YouTube channel URL.
         data (dict): The extracted channel data.
+        truncated (bool): True if the last extract_profile() stopped loading videos because of its deadline.
+        continuation (str): Token to resume a truncated extract_profile() from, None otherwise.
     """
 
-    def __init__(self, url: str, country: Optional[dict] = None):
+    def __init__(self, url: str, country: Optional[dict] = None, record_type: str = "dict"):
         """
         Initialize the Channel with a URL.
 
         Args:
             url (str): The YouTube channel URL.
             country (dict): Country filter with 'hl' and 'gl' keys, use CountryFilters constants.
+            record_type (str): "dict" for dictionaries, "record" for compact VideoRecord objects in video and shorts lists.
         """
+        self._setup(url, country, record_type)
+        self.visitor_data = self.core.extract_visitor_data(self.core.fetch_html())
+
+    def _setup(self, url: str, country: Optional[dict], record_type: str):
+        """Initialize state shared with AsyncChannel."""
         if country is None:
             from ..core import CountryFilters
             country = CountryFilters.US
         self.country = country
         self.url = url
-        self.core = YouTubeCore(url)
+        self._video_record = record_factory(VideoRecord, record_type)
+        self.core = self._make_core(url)
         self.data = {}
-        self.visitor_data = self.core.extract_visitor_data(self.core.fetch_html())
+        self.truncated = False
+        self.continuation = None
+
+    def _make_core(self, url: str) -> YouTubeCore:
+        """Create the core that sends the requests."""
+        return YouTubeCore(url)
 
-    def extract_profile(self, max_videos: Union[int, str] = 200) -> dict:
+    def extract_profile(self, max_videos: Union[int, str] = 200, deadline=None, time_budget: Optional[float] = None,
+                        continuation: Optional[str] = None) -> dict:
         """
         Extract channel profile data including metadata and videos.
 
+        With a deadline, video pages stop loading before a page that would not finish in time.
+        The data then has 'truncated' set and a 'continuation' token, pass it to the next call
+        to load the remaining videos.
+
         Args:
             max_videos (int | str): Maximum number of videos to load. Use 'all' to load all videos.
+            deadline (Deadline | float, optional): A Deadline, or a time.time() timestamp to finish by.
+            time_budget (float, optional): Seconds the call may take.
+            continuation (str, optional): Token of a truncated call, loads the videos from there on.
         """
+        self.truncated = False
+        self.continuation = None
+        with self.core.budget(deadline, time_budget):
+            # Extract channel ID from URL
+            channel_id = self._extract_channel_id()
+            self._set_videos(list(drive(self._profile_steps(channel_id, max_videos, continuation), self.core)))
+        return self._profile_result()
+
+    def _profile_result(self) -> dict:
+        """Add the truncation state to the data and return it."""
+        self.data['truncated'] = self.truncated
+        self.data['continuation'] = self.continuation
+        return self.data
+
+    def _profile_steps(self, channel_id: str, max_videos: Union[int, str], continuation: Optional[str]):
+        """Paging protocol of extract_profile(), shared with AsyncChannel. Sets the profile data and yields the videos."""
         # API URL
         api_url = "https://www.youtube.com/youtubei/v1/browse"
 
-        # Extract channel ID from URL
-        channel_id = self._extract_channel_id()
-
         # Payload for Home Tab (to get profile data)
         payload_home = self._get_payload_home(channel_id)
 
         # Make API request for home tab
         try:
-            data_home = self.core.make_api_request(api_url, payload_home)
+            data_home = yield Fetch(api_url, payload_home)
             # Extract profile data from home response
             self._extract_profile_data(data_home)
         except Exception:
             # If home fails, try videos response for profile data
             pass
 
-        # Payload for Videos Tab
-        payload_videos = self._get_payload_videos(channel_id)
+        # Payload for Videos Tab, or for the page a truncated call stopped at
+        payload_videos = self._get_payload_continuation(continuation) if continuation else self._get_payload_videos(channel_id)
 
         # Make API request for videos
         try:
-            data_videos = self.core.make_api_request(api_url, payload_videos)
+            data_videos = yield Fetch(api_url, payload_videos)
+        except NGTubeError:
+            raise
         except Exception as e:
             raise Exception(f"Failed to fetch videos data: {e}")
 
         # Extract videos
-        self._extract_videos(data_videos, max_videos)
+        yield from self._video_page_steps(data_videos, max_videos)
 
         # If profile data not extracted from home, try from videos
         if not self.data.get('title'):
@@ -79,8 +121,6 @@ class Channel:
         # Extract numbers
         self._extract_numbers()
 
-        return self.data
-
     def extract_shorts(self, max_shorts: Union[int, str] = 200) -> list:
         """
         Extract channel shorts.
@@ -100,6 +140,8 @@ class Channel:
         # Make API request for shorts tab
         try:
             data_shorts = self.core.make_api_request(api_url, payload_shorts)
+        except NGTubeError:
+            raise
         except Exception as e:
             raise ValueError(f"Failed to fetch shorts data: {e}")
 
@@ -126,6 +168,8 @@ class Channel:
         # Make API request for playlists tab
         try:
             data_playlists = self.core.make_api_request(api_url, payload_playlists)
+        except NGTubeError:
+            raise
         except Exception as e:
             raise ValueError(f"Failed to fetch playlists data: {e}")
 
@@ -138,7 +182,7 @@ class Channel:
         shorts = self._find_shorts(data)
         if max_shorts != 'all' and isinstance(max_shorts, int):
             shorts = shorts[:max_shorts]
-        return shorts
+        return [self._video_record(short) for short in shorts]
 
     def _extract_playlists_data(self, data: dict, max_playlists: Union[int, str]) -> list:
         """Extract playlists data from API response."""
@@ -193,67 +237,39 @@ class Channel:
         if '/channel/' in self.url:
             # Direct channel ID in URL
             return self.url.split('/channel/')[1].split('/')[0].split('?')[0]
-        
-        if '@' in self.url:
-            # For @handles, fetch the page to get the UC-ID
-            try:
-                html = self.core.fetch_html()
-                # Try to find channel ID in the HTML
-                # Pattern 1: browseId in ytInitialData (most reliable)
-                match = re.search(r'"browseId"\s*:\s*"(UC[a-zA-Z0-9_-]+)"', html)
-                if match:
-                    return match.group(1)
-                
-                # Pattern 2: "channelId":"UC..."
-                match = re.search(r'"channelId"\s*:\s*"(UC[a-zA-Z0-9_-]+)"', html)
-                if match:
-                    return match.group(1)
-                
-                # Pattern 3: "externalId":"UC..."
-                match = re.search(r'"externalId"\s*:\s*"(UC[a-zA-Z0-9_-]+)"', html)
-                if match:
-                    return match.group(1)
-                
-                # Pattern 4: /channel/UC... in canonical URL
-                match = re.search(r'/channel/(UC[a-zA-Z0-9_-]+)', html)
-                if match:
-                    return match.group(1)
-                    
-                raise ValueError("Could not find channel ID in page")
-                
-            except Exception as e:
-                raise ValueError(f"Failed to extract channel ID: {e}")
-        
-        # For other formats, fetch the page to get the real channel ID
+
+        # For @handles and other formats, fetch the page to get the UC-ID
         try:
-            html = self.core.fetch_html()
-            
-            # Try to find channel ID in the HTML
-            # Pattern 1: browseId in ytInitialData (most reliable)
-            match = re.search(r'"browseId"\s*:\s*"(UC[a-zA-Z0-9_-]+)"', html)
-            if match:
-                return match.group(1)
-            
-            # Pattern 2: "channelId":"UC..."
-            match = re.search(r'"channelId"\s*:\s*"(UC[a-zA-Z0-9_-]+)"', html)
-            if match:
-                return match.group(1)
-            
-            # Pattern 3: "externalId":"UC..."
-            match = re.search(r'"externalId"\s*:\s*"(UC[a-zA-Z0-9_-]+)"', html)
-            if match:
-                return match.group(1)
-            
-            # Pattern 4: /channel/UC... in canonical URL
-            match = re.search(r'/channel/(UC[a-zA-Z0-9_-]+)', html)
-            if match:
-                return match.group(1)
-                
-            raise ValueError("Could not find channel ID in page")
-            
+            return self._channel_id_from_html(self.core.fetch_html())
+        except NGTubeError:
+            raise
         except Exception as e:
             raise ValueError(f"Failed to extract channel ID: {e}")
 
+    def _channel_id_from_html(self, html: str) -> str:
+        """Find the channel ID in the channel page HTML."""
+        # Pattern 1: browseId in ytInitialData (most reliable)
+        match = re.search(r'"browseId"\s*:\s*"(UC[a-zA-Z0-9_-]+)"', html)
+        if match:
+            return match.group(1)
+
+        # Pattern 2: "channelId":"UC..."
+        match = re.search(r'"channelId"\s*:\s*"(UC[a-zA-Z0-9_-]+)"', html)
+        if match:
+            return match.group(1)
+
+        # Pattern 3: "externalId":"UC..."
+        match = re.search(r'"externalId"\s*:\s*"(UC[a-zA-Z0-9_-]+)"', html)
+        if match:
+            return match.group(1)
+
+        # Pattern 4: /channel/UC... in canonical URL
+        match = re.search(r'/channel/(UC[a-zA-Z0-9_-]+)', html)
+        if match:
+            return match.group(1)
+
+        raise ParseError("Could not find channel ID in page")
+
     def _get_payload_home(self, channel_id: str) -> dict:
         """Get payload for home tab."""
         return {
@@ -285,6 +301,21 @@ class Channel:
             "params": "EgZ2aWRlb3PyBgQKAjoA"
         }
 
+    def _get_payload_continuation(self, continuation_token: str) -> dict:
+        """Get payload for a videos continuation."""
+        return {
+            "context": {
+                "client": {
+                    "hl": self.country["hl"],
+                    "gl": self.country["gl"],
+                    "clientName": "WEB",
+                    "clientVersion": "2.20251208.06.00",
+                    "visitorData": self.visitor_data
+                }
+            },
+            "continuation": continuation_token
+        }
+
     def _get_payload_shorts(self, channel_id: str) -> dict:
         """Get payload for shorts tab."""
         return {
@@ -406,63 +437,83 @@ class Channel:
 
         find_profile_data(data)
 
-    def _extract_videos(self, data: dict, max_videos: Union[int, str]):
-        """Extract videos from API response with continuation."""
-        api_url = "https://www.youtube.com/youtubei/v1/browse"
-        data_videos_list = [data]
-        loaded_videos = 0
+    def iter_videos(self, max_videos: Union[int, str] = 200, parse_pool: Optional[Executor] = None):
+        """
+        Stream channel videos page by page, deduplicated by videoId.
 
-        # Initial videos
-        initial_videos = self._find_videos(data)
-        loaded_videos += len(initial_videos)
-
-        # Find continuation token
-        continuation_token = self._find_continuation_token(data)
-
-        # Load more videos
-        while continuation_token and (max_videos == 'all' or (isinstance(max_videos, int) and loaded_videos < max_videos)):
-            payload_continuation = {
-                "context": {
-                    "client": {
-                        "hl": self.country["hl"],
-                        "gl": self.country["gl"],
-                        "clientName": "WEB",
-                        "clientVersion": "2.20251208.06.00",
-                        "visitorData": self.visitor_data
-                    }
-                },
-                "continuation": continuation_token
-            }
+        Args:
+            max_videos (int | str): Maximum number of videos to yield. Use 'all' to load all videos.
+            parse_pool (Executor, optional): Executor that decodes and parses continuation pages, e.g. a
+                ProcessPoolExecutor shared by channels crawled in several threads. Only the videos are sent back.
 
-            try:
-                data_cont = self.core.make_api_request(api_url, payload_continuation)
-                data_videos_list.append(data_cont)
-                new_videos = len(self._find_videos(data_cont))
-                loaded_videos += new_videos
-                if new_videos == 0:
-                    break
-                continuation_token = self._find_continuation_token(data_cont)
-            except Exception:
-                break
+        Yields:
+            dict: A video.
+        """
+        channel_id = self._extract_channel_id()
+        yield from drive(self._videos_steps(channel_id, max_videos), self.core, parse_pool)
 
-        # Collect all videos and deduplicate by videoId
-        all_videos = []
+    def _videos_steps(self, channel_id: str, max_videos: Union[int, str]):
+        """Paging protocol of iter_videos(), shared with AsyncChannel."""
+        try:
+            data_videos = yield Fetch("https://www.youtube.com/youtubei/v1/browse", self._get_payload_videos(channel_id))
+        except NGTubeError:
+            raise
+        except Exception as e:
+            raise Exception(f"Failed to fetch videos data: {e}")
+        yield from self._video_page_steps(data_videos, max_videos)
+
+    def _set_videos(self, videos: list):
+        """Store the loaded videos in the data."""
+        self.data['videos'] = videos
+        self.data['loaded_videos_count'] = len(videos)
+
+    def _video_page_steps(self, data: dict, max_videos: Union[int, str]):
+        """Paging protocol yielding deduplicated videos from a videos tab response and its continuations."""
+        api_url = "https://www.youtube.com/youtubei/v1/browse"
+        limit = max_videos if max_videos != 'all' and isinstance(max_videos, int) else None
         seen_video_ids = set()
-        for data in data_videos_list:
-            for video in self._find_videos(data):
+        yielded = 0
+        loaded_videos = 0
+        page_videos, continuation_token = self._find_videos(data), self._find_continuation_token(data)
+
+        while True:
+            loaded_videos += len(page_videos)
+            for video in page_videos:
+                if limit is not None and yielded >= limit:
+                    return
                 video_id = video.get('videoId')
-                if video_id and video_id not in seen_video_ids:
+                if video_id and video_id in seen_video_ids:
+                    continue
+                if video_id:
                     seen_video_ids.add(video_id)
-                    all_videos.append(video)
-                elif not video_id:
-                    all_videos.append(video)  # Keep videos without ID
+                # Videos without ID are kept
+                yield self._video_record(video)
+                yielded += 1
+
+            if not continuation_token or not (max_videos == 'all' or (isinstance(max_videos, int) and loaded_videos < max_videos)):
+                return
 
-        # Limit videos if max_videos is not 'all'
-        if max_videos != 'all' and isinstance(max_videos, int):
-            all_videos = all_videos[:max_videos]
+            if self.core.out_of_time():
+                self._truncate(continuation_token)
+                return
+            payload = self._get_payload_continuation(continuation_token)
+            try:
+                page_videos, continuation_token = yield Fetch(api_url, payload, parse=_parse_videos_page)
+            except DeadlineExceededError:
+                self._truncate(payload['continuation'])
+                return
+            except (RateLimitedError, CircuitOpenError):
+                # Stopping here would silently truncate the videos, let the caller retry later
+                raise
+            except Exception:
+                return
+            if not page_videos:
+                return
 
-        self.data['videos'] = all_videos
-        self.data['loaded_videos_count'] = len(all_videos)
+    def _truncate(self, continuation_token: str):
+        """Mark the videos as cut short by the deadline, with the token to resume from."""
+        self.truncated = True
+        self.continuation = continuation_token
 
     def _find_videos(self, obj):
         """Find videos in the data structure."""
@@ -623,3 +674,10 @@ class Channel:
             self.data['total_views'] = utils.extract_number(self.data['viewCountText'])
         if 'videoCountText' in self.data:
             self.data['video_count'] = utils.extract_number(self.data['videoCountText'])
+
+
+def _parse_videos_page(body: bytes) -> tuple:
+    """Decode a videos continuation page and return its videos and next token, may run in parse pool processes."""
+    data = json.loads(body)
+    parser = Channel.__new__(Channel)
+    return parser._find_videos(data), parser._find_continuation_token(data)
@@ -4,10 +4,12 @@ NGTube Comments Module
 This module provides functionality to extract comments from YouTube videos.
 """
 
-import time
 from typing import Optional
 from ..core import YouTubeCore
+from ..exceptions import DeadlineExceededError
+from ..paging import Fetch, drive
 from .. import utils
+from ..records import CommentRecord, record_factory
 
 class Comments:
     """
@@ -17,25 +19,75 @@ class Comments:
         url (str): The YouTube video URL.
         comments (list): List of extracted comments.
         top_comments (list): List of top/pinned comments.
+        continuation (str): Token of the first comments page the next get_comments() loads, e.g. after
+            a truncated call or one that stopped at max_comments. None before the first call, which
+            starts from the watch page, and once all comments are loaded.
+        truncated (bool): True if the last get_comments() stopped early because of its deadline.
     """
 
-    def __init__(self, url: str, country: Optional[dict] = None):
+    def __init__(self, url: str, country: Optional[dict] = None, record_type: str = "dict"):
         """
         Initialize the Comments with a URL.
 
         Args:
             url (str): The YouTube video URL.
             country (dict): Country filter with 'hl' and 'gl' keys, use CountryFilters constants.
+            record_type (str): "dict" for dictionaries, "record" for compact CommentRecord objects.
         """
+        self._setup(url, country, record_type)
+        self.visitor_data = self.core.extract_visitor_data(self.core.fetch_html())
+
+    @classmethod
+    def from_continuation(cls, token: str, visitor_data: str, country: Optional[dict] = None, record_type: str = "dict") -> "Comments":
+        """
+        Create a comments loader from an existing comments continuation token without fetching the watch page.
+
+        Use this with the 'comments_continuation' of a short and the visitor_data of the Shorts instance.
+
+        Args:
+            token (str): The comments continuation token.
+            visitor_data (str): The visitorData the token was issued for.
+            country (dict): Country filter with 'hl' and 'gl' keys, use CountryFilters constants.
+            record_type (str): "dict" for dictionaries, "record" for compact CommentRecord objects.
+
+        Returns:
+            Comments: A loader whose get_comments() and iter_comments() start from the token.
+        """
+        comments = cls.__new__(cls)
+        comments._setup("https://www.youtube.com", country, record_type)
+        comments.visitor_data = visitor_data
+        comments.continuation = token
+        return comments
+
+    def _setup(self, url: str, country: Optional[dict], record_type: str):
+        """Initialize state shared by all constructors."""
         if country is None:
             from ..core import CountryFilters
             country = CountryFilters.US
         self.country = country
         self.url = url
-        self.core = YouTubeCore(url)
+        self.core = self._make_core(url)
         self.comments = []
         self.top_comments = []
-        self.visitor_data = self.core.extract_visitor_data(self.core.fetch_html())
+        self.continuation = None
+        self.truncated = False
+        # Token of the page after the last one loaded, see _comment_page_steps()
+        self._page_continuation = None
+        self._started = False
+        self._comment_record = record_factory(CommentRecord, record_type)
+
+    def _make_core(self, url: str) -> YouTubeCore:
+        """Create the core that sends the requests."""
+        return YouTubeCore(url)
+
+    def _comments_result(self) -> dict:
+        """Build the result of get_comments()."""
+        return {
+            'top_comment': self.top_comments,
+            'comments': self.comments,
+            'truncated': self.truncated,
+            'continuation': self.continuation if self.truncated else None
+        }
 
     def extract_initial_comments(self, data: dict):
         """
@@ -59,7 +111,7 @@ class Comments:
                                 'alternateName': comment.get('author', {}).get('alternateName', ''),
                                 'upvoteCount': comment.get('upvoteCount', 0)
                             }
-                            self.top_comments.append(micro_comment)
+                            self.top_comments.append(self._comment_record(micro_comment))
                 for v in obj.values():
                     find_microformat_comments(v)
             elif isinstance(obj, list):
@@ -100,7 +152,7 @@ class Comments:
                                             'commentId': comment_id,
                                             'replyCount': reply_count
                                         }
-                                        self.top_comments.append(top_comment)
+                                        self.top_comments.append(self._comment_record(top_comment))
                                     elif thread.get('isTopLevelThread'):
                                         # Regular top-level comment
                                         comment_renderer = thread.get('comment', {}).get('commentRenderer', {})
@@ -121,7 +173,7 @@ class Comments:
                                             'commentId': comment_id,
                                             'replyCount': reply_count
                                         }
-                                        self.comments.append(comment)
+                                        self.comments.append(self._comment_record(comment))
                 for v in obj.values():
                     find_top_comments(v)
             elif isinstance(obj, list):
@@ -137,7 +189,29 @@ class Comments:
             data (dict): The ytInitialData JSON.
             max_comments (int, optional): Maximum number of comments to load. If None, loads all available.
         """
-        # Find continuation token and load more comments
+        self._load_comment_pages(self._find_continuation(data), max_comments)
+
+    def _load_comment_pages(self, continuation_token: Optional[str], max_comments: Optional[int]):
+        """Append comment pages from a token until max_comments comments in total or 50 pages are loaded."""
+        self._page_continuation = continuation_token
+        if continuation_token and (max_comments is None or len(self.comments) < max_comments):
+            max_calls = 50  # Increased from 10 to allow loading more comments
+            call_count = 0
+            for page_comments in self._iter_comment_pages(continuation_token):
+                self.comments.extend(page_comments)
+                call_count += 1
+                if call_count >= max_calls or (max_comments is not None and len(self.comments) >= max_comments):
+                    break
+        self._advance_continuation()
+
+    def _advance_continuation(self):
+        """Point continuation at the first page not loaded yet, None once all comments are loaded."""
+        self._started = True
+        if not self.truncated:
+            self.continuation = self._page_continuation
+
+    def _find_continuation(self, data: dict) -> Optional[str]:
+        """Find the comments section continuation token in ytInitialData."""
         continuation_token = None
         def find_continuation(obj):
             nonlocal continuation_token
@@ -164,108 +238,172 @@ class Comments:
                         return True
             return False
         find_continuation(data)
+        return continuation_token
 
-        if continuation_token:
-            # Build payload and make API requests
-            current_continuation = continuation_token
-            max_calls = 50  # Increased from 10 to allow loading more comments
-            call_count = 0
-            while current_continuation and call_count < max_calls and (max_comments is None or len(self.comments) < max_comments):
-                payload = {
-                    "context": {
-                        "client": {
-                            "hl": self.country["hl"],
-                            "gl": self.country["gl"],
-                            "clientName": "WEB",
-                            "clientVersion": "2.20251208.06.00",
-                            "visitorData": self.visitor_data
-                        }
-                    },
-                    "continuation": current_continuation
+    def iter_comments(self, max_comments: Optional[int] = None):
+        """
+        Stream comments page by page from YouTube's API.
+
+        Starts from continuation, e.g. the token given to from_continuation(), or from the comments
+        section of the watch page.
+
+        Args:
+            max_comments (int, optional): Maximum number of comments to yield. If None, yields all available.
+
+        Yields:
+            dict: A comment.
+        """
+        token = self.continuation
+        if not token:
+            data = self.core.extract_ytinitialdata(self.core.fetch_html())
+            token = self._find_continuation(data)
+        if not token:
+            return
+        yielded = 0
+        for page_comments in self._iter_comment_pages(token):
+            for comment in page_comments:
+                if max_comments is not None and yielded >= max_comments:
+                    return
+                yield comment
+                yielded += 1
+
+    def _iter_comment_pages(self, continuation_token: str):
+        """Yield the comments of each API page, following continuations until a page has no comments."""
+        return drive(self._comment_page_steps(continuation_token), self.core)
+
+    def _comment_page_steps(self, continuation_token: str):
+        """Paging protocol of the comments pages, shared with AsyncComments. See NGTube.paging."""
+        current_continuation = continuation_token
+        while current_continuation:
+            if self.core.out_of_time():
+                self._truncate(current_continuation)
+                return
+            try:
+                api_data = yield Fetch("https://www.youtube.com/youtubei/v1/next", self._get_continuation_payload(current_continuation))
+            except DeadlineExceededError:
+                self._truncate(current_continuation)
+                return
+            page_comments = self.extract_api_comments(api_data)
+            if not page_comments:
+                self._page_continuation = None
+                break  # No new comments
+            current_continuation = self._find_next_continuation(api_data)
+            self._page_continuation = current_continuation
+            yield page_comments
+
+    def _truncate(self, continuation: str):
+        """Remember where a crawl stopped for its deadline, so get_comments() can resume there."""
+        self.truncated = True
+        self.continuation = continuation
+
+    def _get_continuation_payload(self, continuation: str) -> dict:
+        """Get payload for a comments continuation request."""
+        return {
+            "context": {
+                "client": {
+                    "hl": self.country["hl"],
+                    "gl": self.country["gl"],
+                    "clientName": "WEB",
+                    "clientVersion": "2.20251208.06.00",
+                    "visitorData": self.visitor_data
                 }
+            },
+            "continuation": continuation
+        }
 
-                api_data = self.core.make_api_request("https://www.youtube.com/youtubei/v1/next", payload)
-                comments_before = len(self.comments)
-
-                # Extract comments from API response
-                def extract_api_comments(obj):
-                    if isinstance(obj, dict):
-                        if 'commentEntityPayload' in obj:
-                            payload = obj['commentEntityPayload']
-                            properties = payload.get('properties', {})
-                            author = payload.get('author', {})
-                            toolbar = payload.get('toolbar', {})
-                            comment = {
-                                'author': author.get('displayName', properties.get('authorButtonA11y', '')),
-                                'text': properties.get('content', {}).get('content', ''),
-                                'likeCount': utils.extract_number(toolbar.get('likeCountNotliked', '0')),
-                                'publishedTimeText': properties.get('publishedTime', ''),
-                                'authorThumbnail': author.get('avatarThumbnailUrl', ''),
-                                'commentId': properties.get('commentId', ''),
-                                'replyCount': int(toolbar.get('replyCount', 0) or 0)
-                            }
-                            self.comments.append(comment)
-                        for v in obj.values():
-                            extract_api_comments(v)
-                    elif isinstance(obj, list):
-                        for item in obj:
-                            extract_api_comments(item)
-                extract_api_comments(api_data)
-
-                comments_after = len(self.comments)
-                if comments_after == comments_before:
-                    break  # No new comments
-
-                time.sleep(0.5)
-
-                # Find next continuation - direct path approach
-                next_continuation = None
-
-                # Check onResponseReceivedEndpoints directly
-                endpoints = api_data.get('onResponseReceivedEndpoints', [])
-                for endpoint in endpoints:
-                    if isinstance(endpoint, dict):
-                        # Check for appendContinuationItemsAction
-                        if 'appendContinuationItemsAction' in endpoint:
-                            continuation_items = endpoint['appendContinuationItemsAction'].get('continuationItems', [])
-                            if continuation_items and isinstance(continuation_items[-1], dict) and 'continuationItemRenderer' in continuation_items[-1]:
-                                endpoint_obj = continuation_items[-1]['continuationItemRenderer'].get('continuationEndpoint', {})
+    def extract_api_comments(self, api_data: dict) -> list:
+        """
+        Extract comments from a comments continuation API response.
+
+        Args:
+            api_data (dict): The API response JSON.
+
+        Returns:
+            list: The comments in the response.
+        """
+        comments = []
+        def find_api_comments(obj):
+            if isinstance(obj, dict):
+                if 'commentEntityPayload' in obj:
+                    payload = obj['commentEntityPayload']
+                    properties = payload.get('properties', {})
+                    author = payload.get('author', {})
+                    toolbar = payload.get('toolbar', {})
+                    comment = {
+                        'author': author.get('displayName', properties.get('authorButtonA11y', '')),
+                        'text': properties.get('content', {}).get('content', ''),
+                        'likeCount': utils.extract_number(toolbar.get('likeCountNotliked', '0')),
+                        'publishedTimeText': properties.get('publishedTime', ''),
+                        'authorThumbnail': author.get('avatarThumbnailUrl', ''),
+                        'commentId': properties.get('commentId', ''),
+                        'replyCount': int(toolbar.get('replyCount', 0) or 0)
+                    }
+                    comments.append(self._comment_record(comment))
+                for v in obj.values():
+                    find_api_comments(v)
+            elif isinstance(obj, list):
+                for item in obj:
+                    find_api_comments(item)
+        find_api_comments(api_data)
+        return comments
+
+    def _find_next_continuation(self, api_data: dict) -> Optional[str]:
+        """Find the next comments continuation token in an API response."""
+        # Check onResponseReceivedEndpoints directly
+        endpoints = api_data.get('onResponseReceivedEndpoints', [])
+        for endpoint in endpoints:
+            if isinstance(endpoint, dict):
+                # Check for appendContinuationItemsAction
+                if 'appendContinuationItemsAction' in endpoint:
+                    continuation_items = endpoint['appendContinuationItemsAction'].get('continuationItems', [])
+                    if continuation_items and isinstance(continuation_items[-1], dict) and 'continuationItemRenderer' in continuation_items[-1]:
+                        endpoint_obj = continuation_items[-1]['continuationItemRenderer'].get('continuationEndpoint', {})
+                        command = endpoint_obj.get('continuationCommand', {})
+                        token = command.get('token')
+                        if token:
+                            return token
+                # Check for reloadContinuationItemsCommand
+                elif 'reloadContinuationItemsCommand' in endpoint:
+                    cmd = endpoint['reloadContinuationItemsCommand']
+                    # Shorts use a different panel ID than watch pages
+                    if 'comments-section' in cmd.get('targetId', ''):
+                        continuation_items = cmd.get('continuationItems', [])
+                        for item in reversed(continuation_items):
+                            if isinstance(item, dict) and 'continuationItemRenderer' in item:
+                                endpoint_obj = item['continuationItemRenderer'].get('continuationEndpoint', {})
                                 command = endpoint_obj.get('continuationCommand', {})
                                 token = command.get('token')
                                 if token:
-                                    next_continuation = token
-                                    break
-                        # Check for reloadContinuationItemsCommand
-                        elif 'reloadContinuationItemsCommand' in endpoint:
-                            cmd = endpoint['reloadContinuationItemsCommand']
-                            if cmd.get('targetId') == 'engagement-panel-comments-section':
-                                continuation_items = cmd.get('continuationItems', [])
-                                for item in reversed(continuation_items):
-                                    if isinstance(item, dict) and 'continuationItemRenderer' in item:
-                                        endpoint_obj = item['continuationItemRenderer'].get('continuationEndpoint', {})
-                                        command = endpoint_obj.get('continuationCommand', {})
-                                        token = command.get('token')
-                                        if token:
-                                            next_continuation = token
-                                            break
-                current_continuation = next_continuation
-                call_count += 1
+                                    return token
+        return None
 
-    def get_comments(self, max_comments: Optional[int] = None) -> dict:
+    def get_comments(self, max_comments: Optional[int] = None, deadline=None, time_budget: Optional[float] = None) -> dict:
         """
         Get all available comments for the video, separated into top comments and regular comments.
 
+        With a deadline, loading stops before a page that would not finish in time. The result is
+        then marked truncated, and calling get_comments() again resumes from 'continuation',
+        appending to the comments loaded so far. A call that stopped at max_comments resumes
+        the same way, and once all comments are loaded further calls return them unchanged.
+
         Args:
-            max_comments (int, optional): Maximum number of comments to load. If None, loads all available.
+            max_comments (int, optional): Maximum number of comments in total, including those of
+                earlier calls. If None, loads all available.
+            deadline (Deadline | float, optional): A Deadline, or a time.time() timestamp to finish by.
+            time_budget (float, optional): Seconds the call may take.
 
         Returns:
-            dict: Dictionary with 'top_comment' and 'comments' lists.
+            dict: Dictionary with 'top_comment' and 'comments' lists, 'truncated' and the
+                'continuation' to resume from (None unless truncated).
         """
-        html = self.core.fetch_html()
-        data = self.core.extract_ytinitialdata(html)
-        self.extract_initial_comments(data)
-        self.load_more_comments(data, max_comments)
-        return {
-            'top_comment': self.top_comments,
-            'comments': self.comments
-        }
\ No newline at end of file
+        self.truncated = False
+        with self.core.budget(deadline, time_budget):
+            if self.continuation:
+                # Created from a continuation token or resumed, there is no watch page to read top comments from
+                self._load_comment_pages(self.continuation, max_comments)
+            elif not self._started:
+                html = self.core.fetch_html()
+                data = self.core.extract_ytinitialdata(html)
+                self.extract_initial_comments(data)
+                self.load_more_comments(data, max_comments)
+        return self._comments_result()
\ No newline at end of file
@@ -5,10 +5,22 @@ This module provides the core functionality for interacting with YouTube.
 """
 
 import requests
-from requests.adapters import HTTPAdapter
+from requests.adapters import BaseAdapter, HTTPAdapter
+from urllib3.exceptions import MaxRetryError
 from urllib3.util.retry import Retry
 import re
+import json
+import threading
+import time
+from contextlib import contextmanager
+from typing import Optional
 import demjson3 as demjson
+from .breaker import CircuitBreaker
+from .cache import ResponseCache
+from .deadline import Deadline
+from .exceptions import DeadlineExceededError, NotFoundError, ParseError, RateLimitedError, RequestError
+from .ratelimit import RateLimits, endpoint_family
+from .singleflight import SingleFlight
 
 class CountryFilters:
     """
@@ -24,6 +36,57 @@ class CountryFilters:
     IT = {"hl": "it", "gl": "IT"}
     JP = {"hl": "ja", "gl": "JP"}
 
+# Scheme and host of youtube.com URLs, replaced when YouTubeCore.base_url is set
+_YOUTUBE_ORIGIN = re.compile(r'^https?://(?:www\.|m\.)?youtube\.com(?=/|$|\?)')
+
+# Deadline of the request the current thread is sending, see transport_deadline()
+_transport_state = threading.local()
+
+
+def transport_deadline() -> Optional[Deadline]:
+    """
+    Get the deadline of the request the current thread is sending through a transport.
+
+    Transports do not retry on their own while a request has a deadline: their retries
+    would ignore it. YouTubeCore retries the request instead, within the deadline.
+
+    Returns:
+        Deadline: The deadline, None if the request has none.
+    """
+    return getattr(_transport_state, 'deadline', None)
+
+
+class DeadlineRetry(Retry):
+    """urllib3 retry policy that gives up at once while the request has a deadline, see transport_deadline()."""
+
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        if transport_deadline() is not None:
+            raise MaxRetryError(_pool, url, error)
+        return super().increment(method, url, response=response, error=error, _pool=_pool, _stacktrace=_stacktrace)
+
+
+def default_retries() -> Retry:
+    """
+    Retry policy used by the default transport.
+
+    Only connection errors are retried here, and only for requests without a deadline.
+    Error statuses are retried by YouTubeCore, which honours Retry-After and reports them
+    to the shared circuit breaker.
+    """
+    return DeadlineRetry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=(),
+        allowed_methods=("GET", "POST"),
+        respect_retry_after_header=False,
+    )
+
+def retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Parse the seconds form of a Retry-After header, None if missing or an HTTP date."""
+    if value and value.strip().isdigit():
+        return float(value.strip())
+    return None
+
 class YouTubeCore:
     """
     Core class for YouTube data extraction.
@@ -31,18 +94,66 @@ class YouTubeCore:
     Attributes:
         url (str): The YouTube URL.
         headers (dict): HTTP headers for requests.
+        cache (ResponseCache): Response cache shared by all instances, None to disable.
+            Set YouTubeCore.cache to enable it for every scraper.
+        transport (requests.adapters.BaseAdapter): Transport adapter mounted on every new session,
+            None for the default HTTPAdapter with retries. See NGTube.transport.
+        base_url (str): Scheme and host that replace https://www.youtube.com in every request,
+            e.g. a local stand-in server for load tests. None to talk to YouTube.
+        proxy (str): Proxy URL every request is sent through, e.g. the egress proxy of a corporate
+            network. Takes precedence over the HTTP(S)_PROXY environment variables. None to connect
+            directly or through those.
+        rate_limits (RateLimits): Adaptive rate limiters for API requests shared by all instances,
+            one per endpoint family. None to disable rate limiting.
+        breaker (CircuitBreaker): Circuit breaker shared by all instances, None to disable it.
+        single_flight (SingleFlight): Coalesces identical concurrent page and API requests of all
+            instances, keyed like the response cache, so they share one network call. None to disable it.
+        hedging (HedgePolicy): Hedges slow innertube API requests with a duplicate request, shared by
+            all instances. None, the default, to never hedge. See NGTube.hedging.
+        retries (int): Maximum number of retries of 429 and 5xx responses per request.
+        backoff_factor (float): Delay before the first retry in seconds, doubled for every further retry.
+            429 and 503 responses with a Retry-After header wait that long instead, and pause the breaker.
+        timeout (float): Timeout per request in seconds.
+        deadline (Deadline): Deadline of the running operation, None without one. See budget().
     """
 
-    def __init__(self, url: str):
+    cache = None
+    transport = None
+    base_url = None
+    proxy = None
+    rate_limits = RateLimits()
+    breaker = CircuitBreaker()
+    single_flight = SingleFlight()
+    hedging = None
+    retries = 3
+    backoff_factor = 0.5
+    retry_statuses = (429, 500, 502, 503, 504)
+    timeout = 10
+
+    def __init__(self, url: str, cache: Optional[ResponseCache] = None, transport: Optional[BaseAdapter] = None,
+                 base_url: Optional[str] = None, proxy: Optional[str] = None):
         """
         Initialize the YouTubeCore with a URL.
 
         Args:
             url (str): The YouTube URL.
+            cache (ResponseCache, optional): Response cache for this instance, overrides YouTubeCore.cache.
+            transport (BaseAdapter, optional): Transport for this instance, overrides YouTubeCore.transport.
+            base_url (str, optional): Base URL for this instance, overrides YouTubeCore.base_url.
+            proxy (str, optional): Proxy URL for this instance, overrides YouTubeCore.proxy.
         """
         self.url = url
+        if cache is not None:
+            self.cache = cache
+        if transport is not None:
+            self.transport = transport
+        if base_url is not None:
+            self.base_url = base_url
+        if proxy is not None:
+            self.proxy = proxy
         self._cached_html = None
         self._client_version = None
+        self.deadline = None
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept-Language': 'en-US,en;q=0.9',
@@ -56,21 +167,30 @@ class YouTubeCore:
         self.session = self._init_session()
 
     def _init_session(self) -> requests.Session:
-        """Create a requests session with basic retry and shared headers/cookies."""
+        """Create a requests session with basic retry (or the configured transport) and shared headers/cookies."""
         session = requests.Session()
         session.headers.update(self.headers)
-        retries = Retry(
-            total=3,
-            backoff_factor=0.5,
-            status_forcelist=(429, 500, 502, 503, 504),
-            allowed_methods=("GET", "POST"),
-        )
-        adapter = HTTPAdapter(max_retries=retries)
+        adapter = self.transport if self.transport is not None else HTTPAdapter(max_retries=default_retries())
         session.mount("https://", adapter)
         session.mount("http://", adapter)
         session.cookies.update(self.cookies)
         return session
 
+    def resolve_url(self, url: str) -> str:
+        """
+        Point a youtube.com URL at base_url, if one is set.
+
+        Args:
+            url (str): A YouTube URL.
+
+        Returns:
+            str: The URL to request.
+        """
+        if self.base_url:
+            base_url = self.base_url.rstrip('/')
+            return _YOUTUBE_ORIGIN.sub(lambda match: base_url, url, count=1)
+        return url
+
     def fetch_html(self) -> str:
         """
         Fetch the HTML content from the YouTube URL.
@@ -81,11 +201,24 @@ class YouTubeCore:
         if self._cached_html:
             return self._cached_html
 
-        response = self.session.get(self.url, timeout=10)
-        if response.status_code != 200:
-            raise Exception(f"Failed to fetch HTML: {response.status_code}")
+        url = self.resolve_url(self.url)
+        key = ResponseCache.make_key("GET", url)
+        if self.cache is not None:
+            body = self.cache.get(key)
+            if body is not None:
+                self._cached_html = body.decode("utf-8")
+                return self._cached_html
+
+        def fetch() -> str:
+            response = self._send("GET", url)
+            if response.status_code != 200:
+                raise self._status_error(f"Failed to fetch HTML: {response.status_code}", url, response.status_code,
+                                         response.headers.get('Retry-After'))
+            if self.cache is not None:
+                self.cache.set(key, response.content)
+            return response.text
 
-        self._cached_html = response.text
+        self._cached_html = self.coalesce(key, fetch)
         return self._cached_html
 
     def extract_ytinitialdata(self, html: str) -> dict:
@@ -137,9 +270,9 @@ class YouTubeCore:
                 else:
                     raise Exception("Parsed data is not a dictionary")
             except Exception as e:
-                raise Exception(f"Failed to parse ytInitialData: {e}")
+                raise ParseError(f"Failed to parse ytInitialData: {e}")
         else:
-            raise Exception("ytInitialData not found in HTML")
+            raise ParseError("ytInitialData not found in HTML")
 
     def extract_ytinitialplayerresponse(self, html: str) -> dict:
         """
@@ -190,9 +323,9 @@ class YouTubeCore:
                 else:
                     raise Exception("Parsed data is not a dictionary")
             except Exception as e:
-                raise Exception(f"Failed to parse ytInitialPlayerResponse: {e}")
+                raise ParseError(f"Failed to parse ytInitialPlayerResponse: {e}")
         else:
-            raise Exception("ytInitialPlayerResponse not found in HTML")
+            raise ParseError("ytInitialPlayerResponse not found in HTML")
 
     def extract_visitor_data(self, html: str) -> str:
         """
@@ -225,22 +358,210 @@ class YouTubeCore:
         except Exception:
             return ""
 
-    def make_api_request(self, endpoint: str, payload: dict) -> dict:
+    def make_api_request(self, endpoint: str, payload: dict, cacheable: bool = True,
+                         headers: Optional[dict] = None) -> dict:
         """
         Make a POST request to YouTube's internal API.
 
         Args:
             endpoint (str): The API endpoint.
             payload (dict): The request payload.
+            cacheable (bool): False for requests whose answer differs on every call, see fetch_api_body().
+            headers (dict, optional): Extra HTTP headers for this request only.
 
         Returns:
             dict: The API response JSON.
         """
-        response = self.session.post(endpoint, json=payload, timeout=10)
-        if response.status_code == 200:
-            return response.json()
-        else:
-            raise Exception(f"API request failed: {response.status_code}")
+        return self._decode_api_body(self.fetch_api_body(endpoint, payload, cacheable, headers))
+
+    @staticmethod
+    def _decode_api_body(body: bytes) -> dict:
+        """Decode an API response body."""
+        try:
+            return json.loads(body)
+        except ValueError as e:
+            raise ParseError(f"Invalid JSON in API response: {e}")
+
+    def fetch_api_body(self, endpoint: str, payload: dict, cacheable: bool = True,
+                       headers: Optional[dict] = None) -> bytes:
+        """
+        Make a POST request to YouTube's internal API and return the undecoded body.
+
+        Use this to decode the response elsewhere, e.g. in a process pool.
+
+        Args:
+            endpoint (str): The API endpoint.
+            payload (dict): The request payload.
+            cacheable (bool): False for requests whose answer differs on every call, e.g. random shorts.
+                They bypass the response cache and are never merged with identical concurrent requests.
+            headers (dict, optional): Extra HTTP headers for this request only, e.g. a client-specific
+                User-Agent. They are not part of the cache key.
+
+        Returns:
+            bytes: The API response body.
+        """
+        endpoint = self.resolve_url(endpoint)
+        key = ResponseCache.make_key("POST", endpoint, payload)
+        cache = self.cache if cacheable else None
+        if cache is not None:
+            body = cache.get(key)
+            if body is not None:
+                return body
+
+        def fetch() -> bytes:
+            response = self._send("POST", endpoint, json=payload, headers=headers)
+            if response.status_code != 200:
+                raise self._status_error(f"API request failed: {response.status_code}", endpoint, response.status_code,
+                                         response.headers.get('Retry-After'))
+            if cache is not None:
+                cache.set(key, response.content)
+            return response.content
+
+        if not cacheable:
+            return fetch()
+        return self.coalesce(key, fetch)
+
+    def coalesce(self, key, fn):
+        """
+        Run fn through single_flight, so concurrent calls with the same key share one call.
+        A caller waits for another caller's call at most until its own deadline.
+
+        Args:
+            key (hashable): Identifies equivalent calls, e.g. a ResponseCache key.
+            fn (callable): Function without arguments.
+
+        Returns:
+            The result of fn, possibly from another thread's call. Copy mutable results before changing them.
+        """
+        if self.single_flight is None:
+            return fn()
+        return self.single_flight.do(key, fn, self.deadline)[0]
+
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send a request through the circuit breaker and rate limiter, retrying 429 and 5xx responses.
+
+        Returns:
+            requests.Response: The last response.
+        """
+        limiter = self.rate_limits.limiter(url) if self.rate_limits is not None else None
+        for attempt in range(self.retries + 1):
+            if self.breaker is not None:
+                self._wait(self.breaker.wait_time(), url)
+            if limiter is not None:
+                self._wait(limiter.reserve(), url)
+            start = time.monotonic()
+            try:
+                response = self._request_once(method, url, limiter, **kwargs)
+            except requests.RequestException as e:
+                if self._deadline_passed():
+                    raise DeadlineExceededError(f"Deadline passed during request to {url}") from e
+                self._record(limiter, None, time.monotonic() - start)
+                if self.deadline is None or attempt >= self.retries:
+                    # Without a deadline, connection errors were already retried by the transport
+                    raise
+                self._wait(self._retry_delay(attempt), url)
+                continue
+            latency = time.monotonic() - start
+            self._record(limiter, response.status_code, latency)
+            if self.deadline is not None:
+                self.deadline.observe(latency)
+            if response.status_code not in self.retry_statuses or attempt >= self.retries:
+                return response
+            self._wait(self._retry_delay(attempt, response.status_code, response.headers.get('Retry-After')), url)
+
+    def _wait(self, seconds: float, url: str):
+        """Sleep before a request. Raises DeadlineExceededError instead if the request could not start in time."""
+        self._check_deadline(seconds, url)
+        if seconds > 0:
+            time.sleep(seconds)
+
+    def _deadline_passed(self) -> bool:
+        """
+        True if the deadline passed, so a failed request most likely timed out because the
+        deadline shortened its timeout. Such failures say nothing about YouTube and are kept
+        out of the shared circuit breaker and the rate limits.
+        """
+        return self.deadline is not None and self.deadline.remaining() <= 0
+
+    def _check_deadline(self, seconds: float, url: str):
+        """Raise DeadlineExceededError if a request that first waits seconds could not start in time."""
+        if self.deadline is not None and seconds + self.deadline.reserve >= self.deadline.remaining():
+            raise DeadlineExceededError(f"No time left for a request to {url}")
+
+    @contextmanager
+    def budget(self, deadline=None, time_budget: Optional[float] = None):
+        """
+        Set the deadline of the requests made inside the with block.
+
+        Args:
+            deadline (Deadline | float, optional): A Deadline, or a time.time() timestamp.
+            time_budget (float, optional): Seconds from now.
+
+        Yields:
+            Deadline: The deadline, None if neither argument is given and no outer budget is active.
+        """
+        previous = self.deadline
+        resolved = Deadline.resolve(deadline, time_budget)
+        if resolved is not None:
+            self.deadline = resolved
+        try:
+            yield self.deadline
+        finally:
+            self.deadline = previous
+
+    def out_of_time(self) -> bool:
+        """True if a deadline is set and another request would likely not finish before it."""
+        return self.deadline is not None and self.deadline.nearly_expired()
+
+    def _request_once(self, method: str, url: str, limiter, **kwargs) -> requests.Response:
+        """Send one attempt, hedged if hedging is set and the URL is an innertube API endpoint."""
+        timeout = self.deadline.timeout(self.timeout) if self.deadline is not None else self.timeout
+        if self.proxy:
+            # Per-request proxies win over HTTP(S)_PROXY, session.proxies would not
+            kwargs["proxies"] = {"http": self.proxy, "https": self.proxy}
+        deadline = self.deadline
+
+        def send() -> requests.Response:
+            # Set in the thread that sends, hedged requests run in pool threads
+            _transport_state.deadline = deadline
+            try:
+                return self.session.request(method, url, timeout=timeout, **kwargs)
+            finally:
+                _transport_state.deadline = None
+
+        if self.hedging is None or endpoint_family(url) is None:
+            return send()
+        # The duplicate needs a free rate limit token, hedges never wait for one
+        allow = limiter.try_acquire if limiter is not None else None
+        return self.hedging.run(send, allow=allow, discard=lambda response: response.close())
+
+    def _record(self, limiter, status: Optional[int], latency: float):
+        """Report the outcome of a request to the rate limiter and the circuit breaker."""
+        if limiter is not None:
+            limiter.record(status, latency)
+        if self.breaker is not None:
+            self.breaker.record(status is not None and status != 429 and status < 500)
+
+    def _retry_delay(self, attempt: int, status: Optional[int] = None, retry_after: Optional[str] = None) -> float:
+        """Delay before a retry. A Retry-After delay pauses the shared breaker, so other workers wait as well."""
+        seconds = retry_after_seconds(retry_after) if status in (429, 503) else None
+        if seconds is None:
+            return self.backoff_factor * (2 ** attempt)
+        if self.breaker is not None:
+            self.breaker.pause(seconds)
+            # The next attempt waits for the pause through breaker.wait_time(), with the deadline checked
+            return 0.0
+        return seconds
+
+    @staticmethod
+    def _status_error(message: str, url: str, status: int, retry_after: Optional[str] = None) -> RequestError:
+        """Create the typed error for a failed response."""
+        if status == 429:
+            return RateLimitedError(message, status, url, retry_after_seconds(retry_after))
+        if status == 404:
+            return NotFoundError(message, status, url)
+        return RequestError(message, status, url)
 
     def get_client_version(self, fallback: str = "2.20251208.06.00") -> str:
         """
@@ -0,0 +1,74 @@
+"""
+NGTube Deadline Module
+
+This module provides time budgets for paginated operations. A Deadline is carried by
+every request of an operation: request timeouts shrink to the remaining time, and
+pagination stops before a page that would not finish in time.
+"""
+
+import time
+from typing import Optional, Union
+
+
+class Deadline:
+    """
+    Point in time by which an operation has to finish.
+
+    Pass one Deadline to several calls to share a budget between them, e.g. the
+    latency objective of a whole API handler.
+
+    Attributes:
+        expires (float): time.monotonic() value of the deadline.
+        reserve (float): Seconds kept free, no request starts with less time left.
+        request_time (float): Duration of the slowest request so far in seconds.
+    """
+
+    def __init__(self, seconds: float, reserve: float = 0.1):
+        """
+        Create a deadline.
+
+        Args:
+            seconds (float): Time budget from now in seconds.
+            reserve (float): Seconds kept free, no request starts with less time left.
+        """
+        self.expires = time.monotonic() + seconds
+        self.reserve = reserve
+        self.request_time = 0.0
+
+    @classmethod
+    def resolve(cls, deadline: Union["Deadline", float, None] = None,
+                time_budget: Optional[float] = None) -> Optional["Deadline"]:
+        """
+        Build the deadline of an operation from the deadline= and time_budget= arguments.
+
+        Args:
+            deadline (Deadline | float, optional): A Deadline, or a time.time() timestamp.
+            time_budget (float, optional): Seconds from now. If both are given, the earlier one wins.
+
+        Returns:
+            Deadline: The deadline, None if neither is given.
+        """
+        if deadline is not None and not isinstance(deadline, Deadline):
+            deadline = cls(deadline - time.time())
+        if time_budget is None:
+            return deadline
+        budget = cls(time_budget)
+        if deadline is None or budget.expires < deadline.expires:
+            return budget
+        return deadline
+
+    def remaining(self) -> float:
+        """Seconds until the deadline, negative once it passed."""
+        return self.expires - time.monotonic()
+
+    def observe(self, seconds: float):
+        """Record the duration of a finished request."""
+        self.request_time = max(self.request_time, seconds)
+
+    def nearly_expired(self) -> bool:
+        """True if another request as slow as the slowest so far would not finish in time."""
+        return self.remaining() < self.request_time + self.reserve
+
+    def timeout(self, timeout: float) -> float:
+        """Shorten a request timeout to the remaining time."""
+        return max(0.001, min(timeout, self.remaining()))
@@ -0,0 +1,74 @@
+"""
+NGTube Exceptions Module
+
+This module defines the errors raised by NGTube. All of them derive from NGTubeError,
+which derives from Exception, so existing "except Exception" handlers keep working.
+"""
+
+from typing import Optional
+
+
+class NGTubeError(Exception):
+    """Base class of all NGTube errors."""
+
+
+class RequestError(NGTubeError):
+    """
+    A request failed with an unexpected HTTP status.
+
+    Attributes:
+        status (int): The HTTP status.
+        url (str): The requested URL.
+    """
+
+    def __init__(self, message: str, status: Optional[int] = None, url: Optional[str] = None):
+        super().__init__(message)
+        self.status = status
+        self.url = url
+
+
+class RateLimitedError(RequestError):
+    """
+    YouTube kept answering 429 after all retries. Retry the job later.
+
+    Attributes:
+        retry_after (float): Seconds YouTube asked to wait, None if it did not say.
+    """
+
+    def __init__(self, message: str, status: Optional[int] = 429, url: Optional[str] = None,
+                 retry_after: Optional[float] = None):
+        super().__init__(message, status, url)
+        self.retry_after = retry_after
+
+
+class NotFoundError(RequestError):
+    """The video, channel or page does not exist (404). Retrying will not help."""
+
+
+class ParseError(NGTubeError, ValueError):
+    """
+    A response could not be parsed, e.g. ytInitialData is missing or invalid JSON was returned.
+
+    Also a ValueError, which NGTube raised for these cases before.
+    """
+
+
+class CircuitOpenError(NGTubeError):
+    """
+    The shared circuit breaker is open because of a high error rate and would block for too long.
+
+    Attributes:
+        retry_after (float): Seconds until the breaker lets requests through again.
+    """
+
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class DeadlineExceededError(NGTubeError, TimeoutError):
+    """
+    The deadline of an operation passed, or would pass before the next request finishes.
+
+    Paginated operations catch it and return their partial results as truncated.
+    """
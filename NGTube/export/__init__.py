@@ -0,0 +1,11 @@
+"""
+NGTube Export Module
+
+This module provides sinks for writing extractor output to files.
+"""
+
+from .base import RecordSink
+from .parquet import ParquetSink
+from .ndjson import NDJSONSink
+
+__all__ = ["RecordSink", "ParquetSink", "NDJSONSink"]
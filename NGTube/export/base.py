@@ -0,0 +1,80 @@
+"""
+NGTube Export Base Module
+
+This module provides the base class shared by all export sinks.
+"""
+
+from abc import ABC, abstractmethod
+
+
+class RecordSink(ABC):
+    """
+    Base class for sinks that write extractor output row by row.
+
+    Rows can be dictionaries or records (anything with to_dict()). Keyword arguments
+    passed to write() and write_many() are added to every row, e.g. video_id=...
+
+    Subclasses implement _write_row() and close().
+    """
+
+    def write(self, record, **context):
+        """
+        Write a single row.
+
+        Args:
+            record (dict | record): The row to write.
+            **context: Extra fields added to the row.
+        """
+        row = record.to_dict() if hasattr(record, 'to_dict') else dict(record)
+        if context:
+            row.update(context)
+        self._write_row(row)
+
+    def write_many(self, records, **context) -> int:
+        """
+        Write rows from any iterable, including streaming iterators such as Comments.iter_comments().
+
+        Args:
+            records (iterable): The rows to write.
+            **context: Extra fields added to every row.
+
+        Returns:
+            int: Number of rows written.
+        """
+        count = 0
+        for record in records:
+            self.write(record, **context)
+            count += 1
+        return count
+
+    def write_video(self, metadata: dict) -> int:
+        """Write the output of Video.extract_metadata()."""
+        self.write(metadata)
+        return 1
+
+    def write_comments(self, comments: dict, video_id: str = None) -> int:
+        """Write the output of Comments.get_comments(), marking top comments with is_top."""
+        count = self.write_many(comments.get('top_comment', []), video_id=video_id, is_top=True)
+        return count + self.write_many(comments.get('comments', []), video_id=video_id, is_top=False)
+
+    def write_channel(self, profile: dict) -> int:
+        """Write the videos of Channel.extract_profile(), tagged with the channel ID."""
+        return self.write_many(profile.get('videos', []), channel_id=profile.get('channelId'))
+
+    def write_search(self, results: dict) -> int:
+        """Write the items of Search.get_results(), tagged with the query."""
+        return self.write_many(results.get('items', []), query=results.get('query'))
+
+    @abstractmethod
+    def _write_row(self, row: dict):
+        """Write one row, with the context fields already added."""
+
+    @abstractmethod
+    def close(self):
+        """Flush and close the output."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
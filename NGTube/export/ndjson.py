@@ -0,0 +1,135 @@
+"""
+NGTube NDJSON Export Module
+
+This module provides a line-delimited JSON sink with optional compression, file rotation and fsync policies.
+zstd compression requires zstandard (pip install NGTube[zstd]).
+"""
+
+import gzip
+import json
+import os
+import time
+from typing import Optional, Union
+from .base import RecordSink
+
+_EXTENSIONS = {None: "", "gzip": ".gz", "zstd": ".zst"}
+
+
+class NDJSONSink(RecordSink):
+    """
+    Streaming NDJSON sink, every row is written as soon as it is produced.
+
+    With rotation enabled, a new file is started when the current one reaches rotate_bytes
+    (bytes on disk) or is older than rotate_seconds. The path may contain {index} and {time}
+    placeholders; if it has none, ".{index:05d}" is inserted before the extension. Without
+    rotation the path is used as given, braces included.
+
+    With compression, the size on disk lags behind the rows written, because the compressor
+    holds back output until it has enough input. Compressed files can therefore end up larger
+    than rotate_bytes by what the compressor had buffered, typically some tens of kilobytes.
+
+    Attributes:
+        files (list): Paths of all files written so far.
+        rows_written (int): Number of rows written.
+    """
+
+    def __init__(self, path: str, compression: Optional[str] = None, rotate_bytes: Optional[int] = None,
+                 rotate_seconds: Optional[float] = None, fsync: Union[str, float] = "rotate"):
+        """
+        Initialize the sink.
+
+        Args:
+            path (str): Output path or path template. The compression extension (.gz/.zst) is added if missing.
+            compression (str, optional): None, "gzip" or "zstd".
+            rotate_bytes (int, optional): Start a new file after this many bytes on disk (compressed
+                size, see above).
+            rotate_seconds (float, optional): Start a new file after this many seconds.
+            fsync (str | float): "never", "rotate" (when a file is closed), "always" (after every row),
+                or a number of seconds between fsyncs.
+        """
+        if compression not in _EXTENSIONS:
+            raise ValueError(f"Unknown compression {compression!r}, use None, 'gzip' or 'zstd'")
+        if compression == "zstd":
+            try:
+                import zstandard
+            except ImportError:
+                raise ImportError("zstd compression requires zstandard, install it with 'pip install NGTube[zstd]'")
+            self._zstd = zstandard
+        if not isinstance(fsync, (int, float)) and fsync not in ("never", "rotate", "always"):
+            raise ValueError(f"Unknown fsync policy {fsync!r}, use 'never', 'rotate', 'always' or seconds")
+        extension = _EXTENSIONS[compression]
+        if extension and not path.endswith(extension):
+            path += extension
+        if (rotate_bytes or rotate_seconds) and '{index' not in path and '{time' not in path:
+            root, ext = os.path.splitext(path[:len(path) - len(extension)] if extension else path)
+            path = root + ".{index:05d}" + ext + extension
+        self.path = path
+        self._rotating = bool(rotate_bytes or rotate_seconds)
+        self.compression = compression
+        self.rotate_bytes = rotate_bytes
+        self.rotate_seconds = rotate_seconds
+        self.fsync = fsync
+        self.files = []
+        self.rows_written = 0
+        self._index = 0
+        self._raw = None
+        self._stream = None
+        self._opened_at = 0.0
+        self._synced_at = 0.0
+
+    def _open(self):
+        path = self.path
+        if self._rotating:
+            path = path.format(index=self._index, time=time.strftime("%Y%m%d-%H%M%S"))
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._raw = open(path, "wb")
+        if self.compression == "gzip":
+            self._stream = gzip.GzipFile(fileobj=self._raw, mode="wb")
+        elif self.compression == "zstd":
+            self._stream = self._zstd.ZstdCompressor().stream_writer(self._raw, closefd=False)
+        else:
+            self._stream = self._raw
+        self.files.append(path)
+        self._index += 1
+        self._opened_at = self._synced_at = time.monotonic()
+
+    def _close_file(self):
+        if self._stream is not self._raw:
+            self._stream.close()
+        if self.fsync != "never":
+            self._raw.flush()
+            os.fsync(self._raw.fileno())
+        self._raw.close()
+        self._raw = self._stream = None
+
+    def _sync(self):
+        if self.compression == "gzip":
+            self._stream.flush()
+        elif self.compression == "zstd":
+            self._stream.flush(self._zstd.FLUSH_BLOCK)
+        self._raw.flush()
+        os.fsync(self._raw.fileno())
+        self._synced_at = time.monotonic()
+
+    def _write_row(self, row: dict):
+        if self._stream is not None and (
+            (self.rotate_bytes and self._raw.tell() >= self.rotate_bytes)
+            or (self.rotate_seconds and time.monotonic() - self._opened_at >= self.rotate_seconds)
+        ):
+            self._close_file()
+        if self._stream is None:
+            self._open()
+        line = json.dumps(row, ensure_ascii=False, separators=(',', ':'), default=str) + "\n"
+        self._stream.write(line.encode("utf-8"))
+        self.rows_written += 1
+        if self.fsync == "always" or (
+            isinstance(self.fsync, (int, float)) and time.monotonic() - self._synced_at >= self.fsync
+        ):
+            self._sync()
+
+    def close(self):
+        """Close the current file."""
+        if self._stream is not None:
+            self._close_file()
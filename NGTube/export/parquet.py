@@ -0,0 +1,194 @@
+"""
+NGTube Parquet Export Module
+
+This module provides a columnar sink that writes extractor output to Parquet or Arrow IPC files.
+Requires pyarrow (pip install NGTube[parquet]).
+"""
+
+from typing import Optional
+from .base import RecordSink
+from .. import utils
+
+# Column specs per kind: (column, type) or (column, type, source keys tried in order)
+SCHEMAS = {
+    "video": [
+        ("video_id", "string"), ("title", "string"), ("channel_id", "string"), ("channel_name", "string"),
+        ("channel_url", "string"), ("author", "string"), ("view_count", "int64"), ("like_count", "int64"),
+        ("subscriber_count", "int64"), ("duration_in_seconds", "int64"), ("description", "string"),
+        ("tags", "string_list"), ("category", "string"), ("publish_date", "string"), ("upload_date", "string"),
+        ("family_safe", "bool"), ("is_private", "bool"), ("is_live_content", "bool"), ("is_crawlable", "bool"),
+        ("allow_ratings", "bool"), ("is_owner_viewing", "bool"), ("is_unplugged_corpus", "bool"),
+        ("thumbnail", "thumbnails"),
+    ],
+    "comment": [
+        ("video_id", "string"), ("commentId", "string"), ("is_top", "bool"), ("author", "string"), ("text", "string"),
+        ("likeCount", "int64"), ("replyCount", "int64"), ("publishedTimeText", "string"), ("authorThumbnail", "string"),
+        ("dateCreated", "string"), ("url", "string"), ("alternateName", "string"), ("upvoteCount", "int64"),
+    ],
+    "channel_video": [
+        ("channel_id", "string"), ("videoId", "string"), ("title", "string"), ("publishedTimeText", "string"),
+        ("viewCountText", "string"), ("viewCount", "int64", ("viewCount", "viewCountText")), ("lengthText", "string"),
+        ("thumbnails", "thumbnails"),
+    ],
+    "search": [
+        ("query", "string"), ("type", "string"), ("videoId", "string"), ("channelId", "string"), ("title", "string"),
+        ("description", "string"), ("channel", "string"), ("publishedTime", "string"), ("length", "string"),
+        ("viewCountText", "string", ("viewCount",)), ("viewCount", "int64"), ("subscriberCount", "string"),
+        ("videoCount", "string"), ("thumbnail", "string"),
+    ],
+    "short": [
+        ("video_id", "string"), ("title", "string"), ("channel_name", "string"), ("channel_handle", "string"),
+        ("channel_id", "string"), ("channel_url", "string"), ("sound_metadata", "string"), ("like_count", "int64"),
+        ("comment_count", "int64"), ("view_count", "int64"), ("publish_date", "string"),
+        ("comments_continuation", "string"), ("thumbnail", "thumbnails"), ("enriched", "bool"),
+        ("enrich_error", "string"),
+    ],
+}
+
+
+def _to_string(value):
+    return None if value is None else str(value)
+
+
+def _to_int64(value):
+    if value is None or isinstance(value, int):
+        return value
+    if isinstance(value, float):
+        return int(value)
+    return utils.extract_number(value)
+
+
+def _to_bool(value):
+    return None if value is None else bool(value)
+
+
+def _to_string_list(value):
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return [value]
+    return [str(item) for item in value]
+
+
+def _to_thumbnails(value):
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return [{'url': value, 'width': None, 'height': None}]
+    return [{'url': item.get('url'), 'width': item.get('width'), 'height': item.get('height')} for item in value]
+
+
+_CONVERTERS = {
+    "string": _to_string,
+    "int64": _to_int64,
+    "bool": _to_bool,
+    "string_list": _to_string_list,
+    "thumbnails": _to_thumbnails,
+}
+
+
+class ParquetSink(RecordSink):
+    """
+    Streaming columnar sink for Video, Comments, Channel, Search and Shorts output.
+
+    Rows are buffered column by column and written as one row group whenever
+    row_group_size rows are collected, so memory stays bounded to one row group.
+    Count columns are stored as int64 (text counts like "1.2M views" are parsed),
+    keys that are not part of the schema are ignored.
+
+    Attributes:
+        path (str): The output file.
+        kind (str): The schema in use, one of SCHEMAS.
+        rows_written (int): Number of rows flushed to the file.
+    """
+
+    def __init__(self, path: str, kind: str, row_group_size: int = 50000, format: str = "parquet",
+                 compression: str = "zstd", columns: Optional[list] = None):
+        """
+        Initialize the sink.
+
+        Args:
+            path (str): The output file.
+            kind (str): "video", "comment", "channel_video", "search" or "short".
+            row_group_size (int): Number of rows per row group (Parquet) or record batch (Arrow).
+            format (str): "parquet" or "arrow" (Arrow IPC file).
+            compression (str): Parquet compression codec, or "lz4"/"zstd"/None for Arrow.
+            columns (list, optional): Custom column specs in the SCHEMAS format, overrides kind.
+        """
+        try:
+            import pyarrow
+        except ImportError:
+            raise ImportError("ParquetSink requires pyarrow, install it with 'pip install NGTube[parquet]'")
+        if columns is None and kind not in SCHEMAS:
+            raise ValueError(f"Unknown kind {kind!r}, use one of {list(SCHEMAS)}")
+        if format not in ("parquet", "arrow"):
+            raise ValueError(f"Unknown format {format!r}, use 'parquet' or 'arrow'")
+        self._pa = pyarrow
+        self.path = path
+        self.kind = kind
+        self.format = format
+        self.compression = compression
+        self.row_group_size = max(1, row_group_size)
+        self.rows_written = 0
+        self._columns = []
+        for spec in columns or SCHEMAS[kind]:
+            name, type_name = spec[0], spec[1]
+            sources = spec[2] if len(spec) > 2 else (name,)
+            self._columns.append((name, sources, _CONVERTERS[type_name]))
+        self.schema = pyarrow.schema([(spec[0], self._arrow_type(spec[1])) for spec in columns or SCHEMAS[kind]])
+        self._buffer = {name: [] for name, _, _ in self._columns}
+        self._buffered = 0
+        self._writer = None
+        self._closed = False
+
+    def _arrow_type(self, type_name: str):
+        pa = self._pa
+        return {
+            "string": pa.string(),
+            "int64": pa.int64(),
+            "bool": pa.bool_(),
+            "string_list": pa.list_(pa.string()),
+            "thumbnails": pa.list_(pa.struct([("url", pa.string()), ("width", pa.int32()), ("height", pa.int32())])),
+        }[type_name]
+
+    def _write_row(self, row: dict):
+        for name, sources, convert in self._columns:
+            value = None
+            for source in sources:
+                value = row.get(source)
+                if value is not None:
+                    break
+            self._buffer[name].append(convert(value))
+        self._buffered += 1
+        if self._buffered >= self.row_group_size:
+            self.flush()
+
+    def _open_writer(self):
+        if self.format == "parquet":
+            import pyarrow.parquet as pq
+            return pq.ParquetWriter(self.path, self.schema, compression=self.compression)
+        import pyarrow.ipc as ipc
+        options = ipc.IpcWriteOptions(compression=self.compression) if self.compression else None
+        return ipc.new_file(self.path, self.schema, options=options)
+
+    def flush(self):
+        """Write buffered rows as one row group."""
+        if not self._buffered:
+            return
+        if self._writer is None:
+            self._writer = self._open_writer()
+        table = self._pa.Table.from_pydict(self._buffer, schema=self.schema)
+        self._writer.write_table(table)
+        self.rows_written += self._buffered
+        self._buffer = {name: [] for name, _, _ in self._columns}
+        self._buffered = 0
+
+    def close(self):
+        """Flush remaining rows and close the file. An empty file with the schema is written if no rows were written."""
+        if self._closed:
+            return
+        self.flush()
+        if self._writer is None:
+            self._writer = self._open_writer()
+        self._writer.close()
+        self._closed = True
@@ -0,0 +1,186 @@
+"""
+NGTube Hedging Module
+
+This module provides hedged requests: when a request is slower than most recent requests,
+a duplicate is sent and whichever answers first is used. This cuts the tail latency caused
+by the occasional stuck response at the cost of a few extra requests, capped by a budget.
+"""
+
+import asyncio
+import collections
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Optional
+
+
+class HedgePolicy:
+    """
+    When and how often to hedge, shared by all requests that use it.
+
+    A request that has not answered after the percentile of the recent latencies gets
+    a duplicate, as long as the budget allows: every request earns budget hedges, so
+    at most about budget * requests extra requests are sent. Enable it with:
+
+        YouTubeCore.hedging = HedgePolicy(percentile=0.95, budget=0.05)
+
+    Attributes:
+        percentile (float): Latency percentile after which a request is hedged.
+        budget (float): Hedges allowed per request.
+        min_delay (float): Shortest wait in seconds before hedging.
+        max_delay (float): Longest wait in seconds before hedging.
+        min_samples (int): Latencies needed before hedging starts.
+        stats (dict): Counts of 'requests', 'hedged' and 'hedge_wins'.
+    """
+
+    def __init__(self, percentile: float = 0.95, budget: float = 0.05, min_delay: float = 0.05, max_delay: float = 5.0,
+                 window: int = 200, min_samples: int = 20, max_workers: int = 128):
+        """
+        Create a hedging policy.
+
+        Args:
+            percentile (float): Latency percentile after which a request is hedged.
+            budget (float): Hedges allowed per request, e.g. 0.05 for at most 5% extra requests.
+            min_delay (float): Shortest wait in seconds before hedging.
+            max_delay (float): Longest wait in seconds before hedging.
+            window (int): Number of recent latencies the percentile is taken from.
+            min_samples (int): Latencies needed before hedging starts.
+            max_workers (int): Threads that run the requests of the synchronous API.
+        """
+        self.percentile = percentile
+        self.budget = budget
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.min_samples = min_samples
+        self.max_workers = max_workers
+        self.stats = {'requests': 0, 'hedged': 0, 'hedge_wins': 0}
+        self._latencies = collections.deque(maxlen=window)
+        self._tokens = 0.0
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def delay(self) -> Optional[float]:
+        """
+        Get the current wait before hedging.
+
+        Returns:
+            float: Seconds, None while there are fewer than min_samples latencies.
+        """
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return None
+            latencies = sorted(self._latencies)
+        index = min(len(latencies) - 1, int(self.percentile * len(latencies)))
+        return min(self.max_delay, max(self.min_delay, latencies[index]))
+
+    def record(self, latency: float):
+        """Add the latency of a finished request, for hedged requests the latency of the original."""
+        with self._lock:
+            self._latencies.append(latency)
+
+    def _start(self):
+        with self._lock:
+            self.stats['requests'] += 1
+            # Budget tokens, a burst of at most 10 hedges
+            self._tokens = min(10.0, self._tokens + self.budget)
+
+    def _spend(self) -> bool:
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            self.stats['hedged'] += 1
+            return True
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="ngtube-hedge")
+            return self._executor
+
+    def run(self, fn: Callable, allow: Optional[Callable] = None, discard: Optional[Callable] = None):
+        """
+        Call fn, and a second time if the first call is slow and the budget allows.
+
+        Args:
+            fn (callable): The request, without arguments.
+            allow (callable, optional): Called before hedging, return False to skip the hedge.
+            discard (callable, optional): Called with the result of the losing call, e.g. to close it.
+
+        Returns:
+            The result of the call that finished first. If it failed, the other call's result.
+        """
+        self._start()
+        delay = self.delay()
+        start = time.monotonic()
+        if delay is None:
+            try:
+                return fn()
+            finally:
+                self.record(time.monotonic() - start)
+        executor = self._get_executor()
+        primary = executor.submit(fn)
+        primary.add_done_callback(lambda future: self.record(time.monotonic() - start))
+        if wait([primary], timeout=delay).done or not self._allowed(allow):
+            return primary.result()
+
+        backup = executor.submit(fn)
+        done, _ = wait([primary, backup], return_when=FIRST_COMPLETED)
+        first = primary if primary in done else backup
+        second = backup if first is primary else primary
+        if first.exception() is not None:
+            first, second = second, first
+            if first.exception() is not None:
+                raise second.exception()
+        if first is backup:
+            with self._lock:
+                self.stats['hedge_wins'] += 1
+        if discard is not None:
+            second.add_done_callback(lambda future: future.exception() is None and discard(future.result()))
+        return first.result()
+
+    async def run_async(self, fn: Callable, allow: Optional[Callable] = None):
+        """
+        Await fn(), and a second time if the first call is slow and the budget allows.
+
+        The losing call is cancelled.
+
+        Args:
+            fn (callable): The request, a coroutine function without arguments.
+            allow (callable, optional): Called before hedging, return False to skip the hedge.
+
+        Returns:
+            The result of the call that finished first. If it failed, the other call's result.
+        """
+        self._start()
+        delay = self.delay()
+        start = time.monotonic()
+        primary = asyncio.ensure_future(fn())
+        primary.add_done_callback(lambda task: task.cancelled() or self.record(time.monotonic() - start))
+        if delay is None:
+            return await primary
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if done or not self._allowed(allow):
+            return await primary
+
+        backup = asyncio.ensure_future(fn())
+        pending = {primary, backup}
+        error = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is not None:
+                        error = error or task.exception()
+                        continue
+                    if task is backup:
+                        with self._lock:
+                            self.stats['hedge_wins'] += 1
+                    return task.result()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def _allowed(self, allow: Optional[Callable]) -> bool:
+        return (allow is None or allow()) and self._spend()
@@ -0,0 +1,103 @@
+"""
+NGTube Paging Module
+
+This module runs pagination logic shared by the synchronous and the async extractors.
+
+A paging protocol is a generator that yields Fetch steps for the API requests it needs
+and any other value as an item for the caller. The response of a Fetch is sent back
+into the generator, a failed request is thrown into it, so error handling, deadlines and
+truncation are written once. drive() and drive_async() only do the I/O.
+"""
+
+from concurrent.futures import Executor
+from typing import Callable, NamedTuple, Optional
+
+
+class Fetch(NamedTuple):
+    """
+    API request step of a paging protocol.
+
+    Attributes:
+        endpoint (str): The API endpoint.
+        payload (dict): The request payload.
+        parse (callable): Module-level function applied to the undecoded body, so it can run
+            in a parse pool. None to receive the decoded JSON.
+        headers (dict): Extra HTTP headers for this request only, None for the core's headers.
+    """
+
+    endpoint: str
+    payload: dict
+    parse: Optional[Callable] = None
+    headers: Optional[dict] = None
+
+
+def drive(steps, core, parse_pool: Optional[Executor] = None):
+    """
+    Run a paging protocol with a YouTubeCore.
+
+    Args:
+        steps (generator): The paging protocol.
+        core (YouTubeCore): Sends the requests.
+        parse_pool (Executor, optional): Runs the parse functions of Fetch steps.
+
+    Yields:
+        The items of the protocol.
+    """
+    try:
+        send, value = steps.send, None
+        while True:
+            try:
+                step = send(value)
+            except StopIteration:
+                return
+            if not isinstance(step, Fetch):
+                yield step
+                send, value = steps.send, None
+                continue
+            try:
+                if step.parse is None:
+                    value = core.make_api_request(step.endpoint, step.payload, headers=step.headers)
+                elif parse_pool is None:
+                    value = step.parse(core.fetch_api_body(step.endpoint, step.payload, headers=step.headers))
+                else:
+                    body = core.fetch_api_body(step.endpoint, step.payload, headers=step.headers)
+                    value = parse_pool.submit(step.parse, body).result()
+                send = steps.send
+            except Exception as e:
+                send, value = steps.throw, e
+    finally:
+        steps.close()
+
+
+async def drive_async(steps, core):
+    """
+    Run a paging protocol with an AsyncYouTubeCore.
+
+    Args:
+        steps (generator): The paging protocol.
+        core (AsyncYouTubeCore): Sends the requests.
+
+    Yields:
+        The items of the protocol.
+    """
+    try:
+        send, value = steps.send, None
+        while True:
+            try:
+                step = send(value)
+            except StopIteration:
+                return
+            if not isinstance(step, Fetch):
+                yield step
+                send, value = steps.send, None
+                continue
+            try:
+                if step.parse is None:
+                    value = await core.make_api_request(step.endpoint, step.payload, headers=step.headers)
+                else:
+                    value = step.parse(await core.fetch_api_body(step.endpoint, step.payload, headers=step.headers))
+                send = steps.send
+            except Exception as e:
+                send, value = steps.throw, e
+    finally:
+        steps.close()
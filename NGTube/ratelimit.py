@@ -0,0 +1,202 @@
+"""
+NGTube Rate Limit Module
+
+This module provides thread-safe token buckets to cap the request rate of concurrent extractors,
+and the adaptive per-endpoint limiters YouTubeCore uses for every API request.
+"""
+
+import re
+import threading
+import time
+from typing import Optional
+
+# Innertube endpoint families that are limited separately
+FAMILIES = ("next", "browse", "search", "reel")
+
+_FAMILY = re.compile(r'/youtubei/v1/(next|browse|search|reel)(?=[/?]|$)')
+
+
+def endpoint_family(url: str) -> Optional[str]:
+    """
+    Get the endpoint family of an innertube URL.
+
+    Args:
+        url (str): The request URL.
+
+    Returns:
+        str: One of FAMILIES, None for other URLs.
+    """
+    match = _FAMILY.search(url)
+    return match.group(1) if match else None
+
+
+class RateLimiter:
+    """
+    Token bucket shared by any number of threads.
+
+    Tokens are added at rate per second up to burst. acquire() takes one token and
+    blocks until one is available, so the long-run request rate never exceeds rate.
+
+    Attributes:
+        rate (float): Tokens added per second.
+        burst (float): Maximum number of stored tokens.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        """
+        Create a rate limiter.
+
+        Args:
+            rate (float): Requests per second.
+            burst (float, optional): Requests allowed at once after an idle period. Defaults to 1.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.burst = float(burst) if burst is not None else 1.0
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """
+        Take one token without waiting.
+
+        Returns:
+            float: Seconds the caller has to wait before using the token.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            # Reserve the token now, callers queue up behind each other by going into debt
+            self._tokens -= 1
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+    def try_acquire(self) -> bool:
+        """
+        Take one token if one is available right now.
+
+        Returns:
+            bool: True if a token was taken.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+    def acquire(self):
+        """Take one token, waiting until one is available."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+
+class AdaptiveRateLimiter(RateLimiter):
+    """
+    Token bucket whose rate follows the health of the responses (AIMD).
+
+    Every healthy response raises the rate by increase, up to max_rate. A 429 or 503
+    response or a latency spike multiplies the rate by decrease, down to min_rate, at
+    most once per second so a burst of throttled requests that were already in flight
+    counts once. A latency spike is a response slower than spike_factor times the moving
+    average latency and slower than spike_floor. Other errors leave the rate alone, they are the circuit breaker's
+    business.
+
+    Attributes:
+        rate (float): Current requests per second.
+        min_rate (float): Lowest rate.
+        max_rate (float): Highest rate.
+        latency (float): Moving average latency of successful responses in seconds, None before the first.
+    """
+
+    def __init__(self, rate: float = 3.0, min_rate: float = 0.2, max_rate: float = 20.0, burst: Optional[float] = None,
+                 increase: float = 0.2, decrease: float = 0.5, spike_factor: float = 3.0, spike_floor: float = 0.5):
+        """
+        Create an adaptive rate limiter.
+
+        Args:
+            rate (float): Initial requests per second.
+            min_rate (float): Lowest rate.
+            max_rate (float): Highest rate, the limiter never goes faster.
+            burst (float, optional): Requests allowed at once after an idle period. Defaults to 1.
+            increase (float): Requests per second added per healthy response.
+            decrease (float): Factor applied to the rate on errors and latency spikes.
+            spike_factor (float): Latency above this multiple of the average counts as a spike.
+            spike_floor (float): Latency in seconds a spike has to exceed as well.
+        """
+        super().__init__(min(max(rate, min_rate), max_rate), burst)
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.spike_factor = spike_factor
+        self.spike_floor = spike_floor
+        self.latency = None
+        self._slowed = 0.0
+
+    def record(self, status: Optional[int], latency: float):
+        """
+        Adapt the rate to a finished request.
+
+        Args:
+            status (int | None): HTTP status, None if the request failed without a response.
+            latency (float): Request duration in seconds.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            spike = self.latency is not None and latency > max(self.spike_factor * self.latency, self.spike_floor)
+            if status is not None and status < 400:
+                self.latency = latency if self.latency is None else 0.9 * self.latency + 0.1 * latency
+            if status is not None and status < 400 and not spike:
+                self.rate = min(self.max_rate, self.rate + self.increase)
+            elif (status in (429, 503) or spike) and now - self._slowed >= 1.0:
+                self.rate = max(self.min_rate, self.rate * self.decrease)
+                self._slowed = now
+
+
+class RateLimits:
+    """
+    Adaptive rate limiters shared by all YouTubeCore instances, one per endpoint family.
+
+    YouTubeCore.rate_limits holds the process-wide instance. Replace it to change the
+    rates, or set it to None to disable rate limiting:
+
+        YouTubeCore.rate_limits = RateLimits(rate=5.0, max_rate=50.0)
+
+    Attributes:
+        limiters (dict): AdaptiveRateLimiter per family in FAMILIES.
+    """
+
+    def __init__(self, rate: float = 3.0, min_rate: float = 0.2, max_rate: float = 20.0, burst: Optional[float] = 2.0,
+                 **kwargs):
+        """
+        Create one limiter per endpoint family.
+
+        Args:
+            rate (float): Initial requests per second of every family.
+            min_rate (float): Lowest rate.
+            max_rate (float): Highest rate.
+            burst (float, optional): Requests allowed at once after an idle period.
+            **kwargs: Passed to AdaptiveRateLimiter.
+        """
+        self.limiters = {family: AdaptiveRateLimiter(rate, min_rate, max_rate, burst, **kwargs) for family in FAMILIES}
+
+    def limiter(self, url: str) -> Optional[AdaptiveRateLimiter]:
+        """
+        Get the limiter for a request URL.
+
+        Args:
+            url (str): The request URL.
+
+        Returns:
+            AdaptiveRateLimiter: The family's limiter, None for URLs outside the innertube API.
+        """
+        family = endpoint_family(url)
+        return self.limiters[family] if family else None
@@ -0,0 +1,121 @@
+"""
+NGTube Records Module
+
+Compact record types for large crawls. Every extractor that accepts record_type="record"
+returns these instead of dictionaries. They use __slots__ and intern strings that repeat
+across many items, and still support dictionary-style reads and to_dict().
+"""
+
+import sys
+
+RECORD_TYPES = ("dict", "record")
+
+
+class _Record:
+    """
+    Base class for slotted records.
+
+    Fields that were never set are left out of to_dict(), so a record converts back to
+    exactly the dictionary the extractor would have returned.
+    """
+
+    __slots__ = ()
+    _interned = ()
+
+    def __init__(self, **fields):
+        for name, value in fields.items():
+            if name in self._interned and isinstance(value, str):
+                value = sys.intern(value)
+            setattr(self, name, value)
+
+    def to_dict(self) -> dict:
+        """
+        Convert the record to a dictionary.
+
+        Returns:
+            dict: The record fields that were set.
+        """
+        return {name: getattr(self, name) for name in self.__slots__ if hasattr(self, name)}
+
+    def keys(self) -> list:
+        return [name for name in self.__slots__ if hasattr(self, name)]
+
+    def get(self, key: str, default=None):
+        return getattr(self, key, default) if key in self.__slots__ else default
+
+    def __getitem__(self, key: str):
+        try:
+            return getattr(self, key)
+        except (AttributeError, TypeError):
+            raise KeyError(key)
+
+    def __setitem__(self, key: str, value):
+        try:
+            setattr(self, key, value)
+        except AttributeError:
+            raise KeyError(key)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.__slots__ and hasattr(self, key)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, _Record):
+            other = other.to_dict()
+        return self.to_dict() == other
+
+    # Records are mutable and compare equal to their dictionaries, which are unhashable,
+    # so they are unhashable too. Deduplicate by an ID field such as record['videoId'] instead.
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+
+class CommentRecord(_Record):
+    """A comment from Comments (API, engagement panel or microformat)."""
+
+    __slots__ = ('author', 'text', 'likeCount', 'publishedTimeText', 'authorThumbnail', 'commentId', 'replyCount',
+                 'dateCreated', 'url', 'alternateName', 'upvoteCount')
+    _interned = ('author', 'publishedTimeText', 'authorThumbnail', 'alternateName')
+
+
+class VideoRecord(_Record):
+    """A video or short from a channel's video and shorts tabs."""
+
+    __slots__ = ('videoId', 'title', 'publishedTimeText', 'viewCountText', 'viewCount', 'lengthText', 'thumbnails')
+    _interned = ('publishedTimeText',)
+
+
+class ShortRecord(_Record):
+    """A short from the Shorts feed or reel_item_watch."""
+
+    __slots__ = ('video_id', 'title', 'channel_name', 'channel_handle', 'channel_id', 'channel_url', 'sound_metadata',
+                 'like_count', 'comment_count', 'comments_continuation', 'view_count', 'publish_date', 'thumbnail',
+                 'sequence_continuation', 'enriched', 'enrich_error')
+    _interned = ('channel_name', 'channel_handle', 'channel_id', 'channel_url', 'sound_metadata', 'publish_date')
+
+
+class SearchHit(_Record):
+    """A search result of any type (video, channel, movie or playlist)."""
+
+    __slots__ = ('type', 'videoId', 'channelId', 'title', 'description', 'channel', 'publishedTime', 'length',
+                 'viewCount', 'subscriberCount', 'videoCount', 'thumbnail')
+    _interned = ('type', 'channel', 'publishedTime')
+
+
+def record_factory(record_class, record_type: str = "dict"):
+    """
+    Get a function that turns extracted fields into the requested output type.
+
+    Args:
+        record_class (type): The record class used for record_type "record".
+        record_type (str): "dict" to keep dictionaries, "record" for slotted records.
+
+    Returns:
+        callable: Takes a dictionary of fields and returns a dictionary or a record.
+    """
+    if record_type == "dict":
+        return lambda fields: fields
+    if record_type == "record":
+        return lambda fields: record_class(**fields)
+    raise ValueError(f"Unknown record_type {record_type!r}, use one of {RECORD_TYPES}")
@@ -5,10 +5,9 @@ This module provides functionality to search YouTube and extract search results.
 """
 
 from ..core import YouTubeCore
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
-import time
+from ..exceptions import DeadlineExceededError, NotFoundError, RateLimitedError, RequestError
+from ..paging import Fetch, drive
+from ..records import SearchHit, record_factory
 from typing import Optional
 
 class SearchFilters:
@@ -31,9 +30,12 @@ class Search:
         max_results (int): Maximum number of results to load.
         results (list): List of video results.
         estimated_results (int): Estimated total results.
+        truncated (bool): True if the last search stopped early because of its deadline.
+        continuation (str): Token a truncated search resumes from on the next perform_search(), None
+            to start from the first page.
     """
 
-    def __init__(self, query: str, max_results: int = 50, filter: str = "", country: Optional[dict] = None):
+    def __init__(self, query: str, max_results: int = 50, filter: str = "", country: Optional[dict] = None, record_type: str = "dict"):
         """
         Initialize the Search with a query.
 
@@ -42,7 +44,18 @@ class Search:
             max_results (int): Maximum number of results to load.
             filter (str): Search filter, use SearchFilters constants or custom params string.
             country (dict): Country filter with 'hl' and 'gl' keys, use CountryFilters constants.
+            record_type (str): "dict" for dictionaries, "record" for compact SearchHit objects.
         """
+        self._setup(query, max_results, filter, country, record_type)
+        self.visitor_data = self.core.extract_visitor_data(self.core.fetch_html())
+        self.client_version = self.core.get_client_version("2.20251208.06.00")
+        self.payload = self._get_payload()
+        # Search requests go through the core session so they share its retries and response cache,
+        # the search headers are sent with the search requests only
+        self.session = self.core.session
+
+    def _setup(self, query: str, max_results: int, filter: str, country: Optional[dict], record_type: str):
+        """Initialize state shared with AsyncSearch."""
         if country is None:
             from ..core import CountryFilters
             country = CountryFilters.US
@@ -53,11 +66,24 @@ class Search:
         self.params = filter if isinstance(filter, str) else (filter.value if hasattr(filter, 'value') else str(filter))
         self.results = []
         self.estimated_results = 0
-        self.core = YouTubeCore("https://www.youtube.com")
-        self.visitor_data = self.core.extract_visitor_data(self.core.fetch_html())
-        self.client_version = self.core.get_client_version("2.20251208.06.00")
+        self.truncated = False
+        self.continuation = None
+        self._search_record = record_factory(SearchHit, record_type)
+        self.core = self._make_core("https://www.youtube.com")
         self.url = "https://www.youtube.com/youtubei/v1/search?prettyPrint=false"
-        self.payload = {
+        self.headers = {
+            "Content-Type": "application/json",
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/140.0.0.0 Safari/537.36 OPR/124.0.0.0"
+        }
+        self.timeout = 10
+
+    def _make_core(self, url: str) -> YouTubeCore:
+        """Create the core that sends the requests."""
+        return YouTubeCore(url)
+
+    def _get_payload(self) -> dict:
+        """Get payload for the first search request."""
+        payload = {
             "context": {
                 "client": {
                     "hl": self.country["hl"],
@@ -67,54 +93,69 @@ class Search:
                     "visitorData": self.visitor_data
                 }
             },
-            "query": query
+            "query": self.query
         }
         if self.params:
-            self.payload["params"] = self.params
-        if self.params:
-            self.payload["params"] = self.params
-        self.headers = {
-            "Content-Type": "application/json",
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/140.0.0.0 Safari/537.36 OPR/124.0.0.0"
-        }
-        self.timeout = 10
-        self.session = self._init_session()
+            payload["params"] = self.params
+        return payload
 
-    def _init_session(self) -> requests.Session:
-        """Create a session with retries to reduce transient failures."""
-        session = requests.Session()
-        session.headers.update(self.headers)
-        retries = Retry(
-            total=3,
-            backoff_factor=0.5,
-            status_forcelist=(429, 500, 502, 503, 504),
-            allowed_methods=("GET", "POST"),
-        )
-        adapter = HTTPAdapter(max_retries=retries)
-        session.mount("https://", adapter)
-        session.mount("http://", adapter)
-        return session
-
-    def perform_search(self):
+    def perform_search(self, deadline=None, time_budget: Optional[float] = None):
         """
         Perform the search and load results.
+
+        With a deadline, loading stops before a page that would not finish in time and
+        truncated is set. Calling perform_search() again resumes from continuation and
+        appends to results.
+
+        Args:
+            deadline (Deadline | float, optional): A Deadline, or a time.time() timestamp to finish by.
+            time_budget (float, optional): Seconds the call may take.
         """
-        continuation = None
-        while len(self.results) < self.max_results:
+        with self.core.budget(deadline, time_budget):
+            self.results.extend(self.iter_results())
+
+    def iter_results(self):
+        """
+        Stream search results page by page without storing them in results.
+
+        Stops after the page on which max_results is reached.
+
+        Yields:
+            dict: A search result.
+        """
+        return drive(self._result_steps(), self.core)
+
+    def _result_steps(self):
+        """Paging protocol of iter_results(), shared with AsyncSearch. See NGTube.paging."""
+        continuation = self.continuation
+        self.truncated = False
+        self.continuation = None
+        loaded = len(self.results)
+        while loaded < self.max_results:
             if continuation:
                 self.payload["continuation"] = continuation
-            response = self.session.post(self.url, json=self.payload, timeout=self.timeout)
-            if response.status_code != 200:
+            if self.core.out_of_time():
+                self.truncated, self.continuation = True, continuation
+                break
+            try:
+                data = yield Fetch(self.url, self.payload, headers=self.headers)
+            except DeadlineExceededError:
+                self.truncated, self.continuation = True, continuation
+                break
+            except (RateLimitedError, NotFoundError):
+                raise
+            except RequestError:
+                # Any other status ends the results, connection, parse and breaker errors propagate
                 break
-            data = response.json()
             items, estimated, cont = self._parse_results(data)
             if not self.estimated_results:
                 self.estimated_results = estimated
-            self.results.extend(items)
+            for item in items:
+                yield self._search_record(item)
+            loaded += len(items)
             continuation = cont
             if not continuation:
                 break
-            time.sleep(0.3)
 
     def _parse_results(self, data):
         if not data:
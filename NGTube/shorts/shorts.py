@@ -4,7 +4,14 @@ NGTube Shorts Module
 This module provides functionality to extract shorts from YouTube.
 """
 
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, as_completed, wait
 from ..core import YouTubeCore
+from .. import utils
+from ..exceptions import DeadlineExceededError, ParseError
+from ..paging import Fetch, drive
+from ..records import ShortRecord, record_factory
 from typing import Optional
 
 class Shorts:
@@ -13,24 +20,40 @@ class Shorts:
 
     Attributes:
         data (dict): The extracted short data.
+        truncated (bool): True if the last fetch_shorts_feed() stopped early because of its deadline.
+        continuation (str): Feed token to resume a truncated fetch_shorts_feed() from, None otherwise.
     """
 
-    def __init__(self, country: Optional[dict] = None):
+    def __init__(self, country: Optional[dict] = None, record_type: str = "dict"):
         """
         Initialize the Shorts class.
 
         Args:
             country (dict): Country filter with 'hl' and 'gl' keys, use CountryFilters constants.
+            record_type (str): "dict" for dictionaries, "record" for compact ShortRecord objects.
         """
+        self._setup(country, record_type)
+        self.client_version = self.core.get_client_version("2.20251212.01.00")
+        self.visitor_data = self.core.extract_visitor_data(self.core.fetch_html())
+
+    def _setup(self, country: Optional[dict], record_type: str):
+        """Initialize state shared with AsyncShorts."""
         if country is None:
             from ..core import CountryFilters
             country = CountryFilters.US
         self.country = country
-        self.core = YouTubeCore("https://www.youtube.com/shorts")
+        self._short_record = record_factory(ShortRecord, record_type)
+        self.core = self._make_core("https://www.youtube.com/shorts")
         self.data = {}
+        self.sample_stats = {}
+        self.truncated = False
+        self.continuation = None
         self.endpoint = "https://www.youtube.com/youtubei/v1/reel/reel_item_watch"
-        self.client_version = self.core.get_client_version("2.20251212.01.00")
-        self.visitor_data = self.core.extract_visitor_data(self.core.fetch_html())
+        self.feed_endpoint = "https://www.youtube.com/youtubei/v1/reel/reel_watch_sequence"
+
+    def _make_core(self, url: str) -> YouTubeCore:
+        """Create the core that sends the requests."""
+        return YouTubeCore(url)
 
     def fetch_short(self) -> dict:
         """
@@ -39,6 +62,108 @@ class Shorts:
         Returns:
             dict: A dictionary containing short metadata.
         """
+        self.data = self._short_record(self._fetch_random_short())
+        return self.data
+
+    def sample(self, n: int, concurrency: int = 4, max_requests: Optional[int] = None) -> list:
+        """
+        Sample unique random shorts.
+
+        Args:
+            n (int): Number of unique shorts to collect.
+            concurrency (int): Number of parallel reel_item_watch requests.
+            max_requests (int, optional): Stop after this many requests. Defaults to 10 * n.
+
+        Returns:
+            list: Unique short metadata dictionaries. Request statistics are stored in sample_stats.
+        """
+        return list(self.iter_sample(n, concurrency, max_requests))
+
+    def iter_sample(self, n: int, concurrency: int = 4, max_requests: Optional[int] = None):
+        """
+        Stream unique random shorts, deduplicated by video ID.
+
+        Runs below one million shorts use a set for deduplication, larger runs use a
+        Bloom filter, which may drop a small fraction (0.1%) of unseen shorts.
+
+        Args:
+            n (int): Number of unique shorts to yield.
+            concurrency (int): Number of parallel reel_item_watch requests.
+            max_requests (int, optional): Stop after this many requests. Defaults to 10 * n.
+
+        Yields:
+            dict: Short metadata for every short not seen before.
+        """
+        max_requests, seen = self._start_sample(n, max_requests)
+        stats = self.sample_stats
+        concurrency = max(1, concurrency)
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            pending = set()
+            submitted = 0
+            while stats['unique'] < n:
+                while len(pending) < concurrency and submitted < max_requests:
+                    pending.add(executor.submit(self._fetch_random_short))
+                    submitted += 1
+                if not pending:
+                    break
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    try:
+                        short_data = future.result()
+                    except Exception:
+                        short_data = None
+                    if self._accept_sample(short_data, seen, n):
+                        yield self._short_record(short_data)
+            for future in pending:
+                future.cancel()
+
+    def _start_sample(self, n: int, max_requests: Optional[int]) -> tuple:
+        """Reset sample_stats and return the request limit and the seen video IDs of a sample run."""
+        if max_requests is None:
+            max_requests = n * 10
+        seen = set() if n < 1000000 else utils.BloomFilter(n, error_rate=0.001)
+        self.sample_stats = {
+            'requests': 0,
+            'failed_requests': 0,
+            'unique': 0,
+            'duplicates': 0,
+            'unique_per_request': 0.0
+        }
+        return max_requests, seen
+
+    def _accept_sample(self, short_data: Optional[dict], seen, n: int) -> bool:
+        """Count a finished sample request, None for a failed one. Returns True if the short is new and still needed."""
+        stats = self.sample_stats
+        stats['requests'] += 1
+        if short_data is None:
+            stats['failed_requests'] += 1
+            return False
+        video_id = short_data.get('video_id')
+        accepted = bool(video_id) and video_id not in seen and stats['unique'] < n
+        if accepted:
+            seen.add(video_id)
+            stats['unique'] += 1
+        else:
+            stats['duplicates'] += 1
+        stats['unique_per_request'] = stats['unique'] / stats['requests']
+        return accepted
+
+    def _fetch_random_short(self) -> dict:
+        """Fetch and parse one random short."""
+        response = self.core.make_api_request(self.endpoint, self._get_watch_payload(), cacheable=False)
+
+        if response.get("status") == "REEL_ITEM_WATCH_STATUS_SUCCEEDED":
+            return self._parse_response(response)
+        raise Exception("Failed to fetch short")
+
+    def _get_watch_payload(self, video_id: Optional[str] = None) -> dict:
+        """
+        Get payload for a reel_item_watch request.
+
+        Args:
+            video_id (str, optional): Short to load. If None, YouTube picks a random short.
+        """
         payload = {
             "context": {
                 "client": {
@@ -55,18 +180,13 @@ class Shorts:
                 }
             },
             "params": "CA8%3D",
-            "inputType": "REEL_WATCH_INPUT_TYPE_SEEDLESS",
             "disablePlayerResponse": True
         }
-
-        response = self.core.make_api_request(self.endpoint, payload)
-
-        if response.get("status") == "REEL_ITEM_WATCH_STATUS_SUCCEEDED":
-            self.data = self._parse_response(response)
+        if video_id:
+            payload["playerRequest"] = {"videoId": video_id}
         else:
-            raise Exception("Failed to fetch short")
-
-        return self.data
+            payload["inputType"] = "REEL_WATCH_INPUT_TYPE_SEEDLESS"
+        return payload
 
     def _parse_response(self, response: dict) -> dict:
         """
@@ -116,20 +236,20 @@ class Shorts:
                 toggle_vm = like_vm.get("toggleButtonViewModel", {}).get("toggleButtonViewModel", {})
                 default_vm = toggle_vm.get("defaultButtonViewModel", {}).get("buttonViewModel", {})
                 title = default_vm.get("title", "")
-                if title and title.replace(".", "").replace(",", "").isdigit():
-                    data["like_count"] = self._parse_number(title)
+                if title[:1].isdigit():
+                    data["like_count"] = utils.extract_number(title)
                 toggled_vm = toggle_vm.get("toggledButtonViewModel", {}).get("buttonViewModel", {})
                 toggled_title = toggled_vm.get("title", "")
-                if toggled_title and toggled_title.replace(".", "").replace(",", "").isdigit():
-                    data["like_count"] = self._parse_number(toggled_title)
+                if toggled_title[:1].isdigit():
+                    data["like_count"] = utils.extract_number(toggled_title)
 
             elif "buttonViewModel" in button_vm:
                 bvm = button_vm["buttonViewModel"]
                 title = bvm.get("title", "")
                 accessibility = bvm.get("accessibilityText", "")
                 if "Kommentar" in accessibility or "comment" in accessibility.lower():
-                    if title and title.isdigit():
-                        data["comment_count"] = int(title)
+                    if title[:1].isdigit():
+                        data["comment_count"] = utils.extract_number(title)
 
         # Parse engagement panels for comments and description
         engagement_panels = response.get("engagementPanels", [])
@@ -145,8 +265,8 @@ class Shorts:
                     info_runs = contextual_info.get("runs", [])
                     if info_runs:
                         comment_count_text = info_runs[0].get("text", "")
-                        if comment_count_text.isdigit():
-                            data["comment_count"] = int(comment_count_text)
+                        if comment_count_text[:1].isdigit():
+                            data["comment_count"] = utils.extract_number(comment_count_text)
 
                     # Extract continuation token for comments
                     content = panel_renderer.get("content", {})
@@ -180,7 +300,7 @@ class Shorts:
 
                             views = header_renderer.get("views", {}).get("simpleText", "")
                             if views:
-                                data["view_count"] = self._parse_number(views.split()[0])
+                                data["view_count"] = utils.extract_number(views)
 
                             publish_date = header_renderer.get("publishDate", {}).get("simpleText", "")
                             if publish_date:
@@ -193,15 +313,15 @@ class Shorts:
                                     label = fr.get("label", {}).get("simpleText", "")
                                     value = fr.get("value", {}).get("simpleText", "")
                                     if "Like" in label:
-                                        data["like_count"] = self._parse_number(value)
+                                        data["like_count"] = utils.extract_number(value)
                                     elif "Aufruf" in label:
-                                        data["view_count"] = self._parse_number(value)
+                                        data["view_count"] = utils.extract_number(value)
                                 elif "viewCountFactoidRenderer" in factoid:
                                     vcfr = factoid["viewCountFactoidRenderer"]
                                     fr = vcfr.get("factoid", {}).get("factoidRenderer", {})
                                     value = fr.get("value", {}).get("simpleText", "")
                                     if value:
-                                        data["view_count"] = self._parse_number(value)
+                                        data["view_count"] = utils.extract_number(value)
 
         # Additional data from replacementEndpoint
         replacement = response.get("replacementEndpoint", {}).get("reelWatchEndpoint", {})
@@ -213,94 +333,235 @@ class Shorts:
 
         return data
 
-    def fetch_shorts_feed(self, max_shorts: int = 50) -> list:
+    def fetch_shorts_feed(self, max_shorts: int = 50, enrich: bool = False, workers: int = 4, deadline=None,
+                          time_budget: Optional[float] = None, continuation: Optional[str] = None) -> list:
         """
         Fetch multiple shorts from the YouTube Shorts feed.
 
+        With a deadline, paging stops before a page that would not finish in time. The shorts
+        loaded so far are returned, truncated is set and continuation holds the token to pass
+        to the next call to resume the feed.
+
+        With enrich, every short has 'enriched' set to True if its details were loaded. A short
+        whose details request failed or ran out of time keeps the basic data, with 'enriched'
+        False and the reason in 'enrich_error'.
+
         Args:
             max_shorts (int): Maximum number of shorts to fetch.
+            enrich (bool): If True, load full metadata (likes, comment count, comments continuation) for every short.
+            workers (int): Number of parallel detail requests when enrich is True.
+            deadline (Deadline | float, optional): A Deadline, or a time.time() timestamp to finish by.
+            time_budget (float, optional): Seconds the call may take.
+            continuation (str, optional): Feed token of a truncated call to resume from.
 
         Returns:
-            list: A list of dictionaries containing short metadata (basic info only for performance).
+            list: A list of dictionaries containing short metadata (basic info only unless enrich is True).
         """
-        shorts_list = []
-        
-        # Get initial sequence continuation from Shorts page
-        html = self.core.fetch_html()
-        yt_initial_data = self.core.extract_ytinitialdata(html)
-        sequence_continuation = yt_initial_data.get('sequenceContinuation', '')
-        
-        if not sequence_continuation:
-            raise Exception("Could not find sequence continuation for Shorts feed")
-        
-        endpoint = "https://www.youtube.com/youtubei/v1/reel/reel_watch_sequence"
-        
-        while len(shorts_list) < max_shorts and sequence_continuation:
-            payload = {
-                "context": {
-                    "client": {
-                        "hl": self.country["hl"],
-                        "gl": self.country["gl"],
-                        "visitorData": self.visitor_data,
-                        "clientName": "WEB",
-                        "clientVersion": self.client_version,
-                        "osName": "Windows",
-                        "osVersion": "10.0",
-                        "platform": "DESKTOP"
-                    },
-                    "request": {
-                        "useSsl": True
-                    }
-                },
-                "sequenceParams": sequence_continuation
-            }
-            
-            response = self.core.make_api_request(endpoint, payload)
-            
-            # Parse entries
-            entries = response.get('entries', [])
-            for entry in entries:
-                if len(shorts_list) >= max_shorts:
-                    break
-                if 'command' in entry:
-                    command = entry['command']
-                    if 'reelWatchEndpoint' in command:
-                        endpoint_data = command['reelWatchEndpoint']
-                        video_id = endpoint_data.get('videoId')
-                        if video_id:
-                            # Create basic short data
-                            short_data = {
-                                'video_id': video_id,
-                                'title': endpoint_data.get('overlay', {}).get('reelPlayerOverlayRenderer', {}).get('reelPlayerHeaderSupportedRenderers', {}).get('reelPlayerHeaderRenderer', {}).get('reelTitleText', {}).get('simpleText', ''),
-                                'channel_name': endpoint_data.get('overlay', {}).get('reelPlayerOverlayRenderer', {}).get('reelPlayerHeaderSupportedRenderers', {}).get('reelPlayerHeaderRenderer', {}).get('channelTitleText', {}).get('simpleText', ''),
-                                'thumbnail': endpoint_data.get('thumbnail', {}).get('thumbnails', [])
-                            }
-                            shorts_list.append(short_data)
-            
-            # Get next continuation
-            continuation_endpoint = response.get('continuationEndpoint', {})
-            if continuation_endpoint:
-                continuation_command = continuation_endpoint.get('continuationCommand', {})
-                sequence_continuation = continuation_command.get('token', '')
-            else:
-                sequence_continuation = ''
-        
-        return shorts_list
-
-    def _parse_number(self, text: str) -> int:
+        with self.core.budget(deadline, time_budget):
+            return list(self.iter_shorts_feed(max_shorts, enrich=enrich, workers=workers, continuation=continuation))
+
+    def iter_shorts_feed(self, max_shorts: int = 50, prefetch: int = 2, enrich: bool = False, workers: int = 4,
+                         continuation: Optional[str] = None):
         """
-        Parse a number string with potential suffixes like 'Mio.', 'K', etc.
+        Stream shorts from the YouTube Shorts feed.
+
+        The next sequence page is requested by a background thread as soon as its
+        continuation token is known, so network time overlaps with parsing.
 
         Args:
-            text (str): The text to parse.
+            max_shorts (int): Maximum number of shorts to yield.
+            prefetch (int): Maximum number of fetched pages waiting to be parsed.
+            enrich (bool): If True, load full metadata for every short in a worker pool while the feed keeps paging.
+                Enriched shorts are yielded in completion order, marked as in fetch_shorts_feed().
+            workers (int): Number of parallel detail requests when enrich is True.
+            continuation (str, optional): Feed token to start from instead of the Shorts page.
+
+        Yields:
+            dict: Short metadata (basic info only unless enrich is True).
+        """
+        shorts = self._iter_feed_entries(max_shorts, prefetch, continuation)
+        if enrich:
+            shorts = self._enrich_shorts(shorts, workers)
+        for short_data in shorts:
+            yield self._short_record(short_data)
+
+    def _iter_feed_entries(self, max_shorts: int, prefetch: int, continuation: Optional[str] = None):
+        """Yield basic short data from the feed while a background thread fetches the next pages."""
+        self.truncated = False
+        self.continuation = None
+        # Without a token, the initial sequence continuation comes from the Shorts page
+        sequence_continuation = continuation or self._feed_start(self.core.fetch_html())
+
+        pages = queue.Queue(maxsize=max(1, prefetch))
+        stop = threading.Event()
+
+        def put(item) -> bool:
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def fetch_pages(token: str):
+            try:
+                for page in drive(self._feed_page_steps(token, max_shorts), self.core):
+                    if not put(page):
+                        return
+            except Exception as e:
+                put(e)
+                return
+            put(None)
+
+        fetcher = threading.Thread(target=fetch_pages, args=(sequence_continuation,), daemon=True)
+        fetcher.start()
+
+        yielded = 0
+        try:
+            while yielded < max_shorts:
+                page_shorts = self._feed_page_shorts(pages.get())
+                if page_shorts is None:
+                    break
+                for short_data in page_shorts[:max_shorts - yielded]:
+                    yield short_data
+                    yielded += 1
+        finally:
+            stop.set()
+
+    def _feed_start(self, html: str) -> str:
+        """Get the initial sequence continuation from the Shorts page."""
+        sequence_continuation = self.core.extract_ytinitialdata(html).get('sequenceContinuation', '')
+        if not sequence_continuation:
+            raise ParseError("Could not find sequence continuation for Shorts feed")
+        return sequence_continuation
 
-        Returns:
-            int: The parsed number.
+    def _feed_page_steps(self, token: str, max_shorts: int):
         """
-        text = text.replace(".", "").replace(",", "").strip()
-        if "Mio" in text or "M" in text:
-            return int(float(text.replace("Mio", "").replace("M", "")) * 1000000)
-        elif "K" in text:
-            return int(float(text.replace("K", "")) * 1000)
-        else:
-            return int(text) if text.isdigit() else 0
\ No newline at end of file
+        Paging protocol of the feed pages, shared with AsyncShorts. See NGTube.paging.
+
+        Yields the feed responses, then the token to resume from if the deadline cut the feed short.
+        """
+        found = 0
+        while token and found < max_shorts:
+            if self.core.out_of_time():
+                # A token string tells the consumer the feed was cut short at the deadline
+                yield token
+                return
+            try:
+                response = yield Fetch(self.feed_endpoint, self._get_feed_payload(token))
+            except DeadlineExceededError:
+                yield token
+                return
+            # Only the token and the shorts count are read here, the entries are parsed by the consumer.
+            # Entries that are not shorts are dropped by the consumer and do not count towards max_shorts.
+            token = self._get_feed_continuation(response)
+            found += sum(1 for entry in response.get('entries', []) if self._feed_entry_video_id(entry))
+            yield response
+
+    def _feed_page_shorts(self, page) -> Optional[list]:
+        """
+        Parse an item the feed fetcher queued.
+
+        Returns the basic shorts of a response, None at the end of the feed. An exception of
+        the fetcher is raised, a token marks the feed as truncated.
+        """
+        if page is None:
+            return None
+        if isinstance(page, Exception):
+            raise page
+        if isinstance(page, str):
+            self.truncated = True
+            self.continuation = page
+            return None
+        return [short_data for short_data in map(self._parse_feed_entry, page.get('entries', [])) if short_data]
+
+    def _enrich_shorts(self, shorts, workers: int):
+        """Load full metadata for shorts from an iterator, keeping at most 2 * workers requests in flight."""
+        workers = max(1, workers)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = set()
+            for short_data in shorts:
+                pending.add(executor.submit(self._enrich_short, short_data))
+                if len(pending) >= workers * 2:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+            for future in as_completed(pending):
+                yield future.result()
+
+    def _enrich_short(self, short_data: dict) -> dict:
+        """Add reel_item_watch metadata to basic feed data. Falls back to the marked basic data on failure."""
+        try:
+            response = self.core.make_api_request(self.endpoint, self._get_watch_payload(short_data['video_id']))
+        except Exception as e:
+            return self._enrich_failed(short_data, f"{type(e).__name__}: {e}")
+        return self._merge_details(short_data, response)
+
+    def _merge_details(self, short_data: dict, response: dict) -> dict:
+        """Merge a reel_item_watch response into basic feed data and mark it as enriched."""
+        status = response.get("status")
+        if status != "REEL_ITEM_WATCH_STATUS_SUCCEEDED":
+            return self._enrich_failed(short_data, f"reel_item_watch status {status}")
+        enriched = dict(short_data)
+        details = self._parse_response(response)
+        for key, value in details.items():
+            if value or key not in enriched:
+                enriched[key] = value
+        enriched['video_id'] = short_data['video_id']
+        enriched['enriched'] = True
+        return enriched
+
+    def _enrich_failed(self, short_data: dict, error: str) -> dict:
+        """Return the basic feed data, marked as not enriched with the reason."""
+        basic = dict(short_data)
+        basic['enriched'] = False
+        basic['enrich_error'] = error
+        return basic
+
+    def _get_feed_payload(self, sequence_continuation: str) -> dict:
+        """Get payload for a reel_watch_sequence request."""
+        return {
+            "context": {
+                "client": {
+                    "hl": self.country["hl"],
+                    "gl": self.country["gl"],
+                    "visitorData": self.visitor_data,
+                    "clientName": "WEB",
+                    "clientVersion": self.client_version,
+                    "osName": "Windows",
+                    "osVersion": "10.0",
+                    "platform": "DESKTOP"
+                },
+                "request": {
+                    "useSsl": True
+                }
+            },
+            "sequenceParams": sequence_continuation
+        }
+
+    def _get_feed_continuation(self, response: dict) -> str:
+        """Get the next sequence continuation token from a feed response."""
+        continuation_endpoint = response.get('continuationEndpoint', {})
+        if continuation_endpoint:
+            continuation_command = continuation_endpoint.get('continuationCommand', {})
+            return continuation_command.get('token', '')
+        return ''
+
+    def _feed_entry_video_id(self, entry: dict) -> Optional[str]:
+        """Return the video ID of a feed entry, None if the entry is not a short."""
+        return entry.get('command', {}).get('reelWatchEndpoint', {}).get('videoId') or None
+
+    def _parse_feed_entry(self, entry: dict) -> Optional[dict]:
+        """Parse a single feed entry into basic short data."""
+        video_id = self._feed_entry_video_id(entry)
+        if not video_id:
+            return None
+        endpoint_data = entry['command']['reelWatchEndpoint']
+        header = endpoint_data.get('overlay', {}).get('reelPlayerOverlayRenderer', {}).get('reelPlayerHeaderSupportedRenderers', {}).get('reelPlayerHeaderRenderer', {})
+        return {
+            'video_id': video_id,
+            'title': header.get('reelTitleText', {}).get('simpleText', ''),
+            'channel_name': header.get('channelTitleText', {}).get('simpleText', ''),
+            'thumbnail': endpoint_data.get('thumbnail', {}).get('thumbnails', [])
+        }
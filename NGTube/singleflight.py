@@ -0,0 +1,131 @@
+"""
+NGTube Single-Flight Module
+
+This module coalesces identical concurrent calls: while a call for a key is running,
+further calls for the same key wait for it and share its result instead of repeating it.
+"""
+
+import asyncio
+import threading
+from typing import Callable, Hashable, Optional
+from .deadline import Deadline
+from .exceptions import DeadlineExceededError
+
+
+class _Call:
+    """A running call and, once it finished, its outcome."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Single-flight group for threads.
+
+    YouTubeCore.single_flight holds the process-wide group. Set it to None to disable
+    coalescing.
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable, deadline: Optional[Deadline] = None) -> tuple:
+        """
+        Run fn, unless a call for key is already running, then wait for that call instead.
+
+        Exceptions of the running call are raised in every caller waiting for it, except
+        DeadlineExceededError: the running call only ran out of its own caller's time, so the
+        waiting callers try again and one of them runs fn.
+
+        Args:
+            key (hashable): Identifies equivalent calls.
+            fn (callable): Function without arguments.
+            deadline (Deadline, optional): Deadline of this caller, it waits for another
+                caller's call at most until then.
+
+        Returns:
+            tuple: The result, and True if it came from another caller's call. Copy shared
+                mutable results before changing them.
+
+        Raises:
+            DeadlineExceededError: If the deadline passed while waiting for another caller's call.
+        """
+        while True:
+            with self._lock:
+                call = self._calls.get(key)
+                leader = call is None
+                if leader:
+                    call = self._calls[key] = _Call()
+            if leader:
+                break
+            timeout = max(0.0, deadline.remaining()) if deadline is not None else None
+            if not call.done.wait(timeout):
+                raise DeadlineExceededError("Deadline passed while waiting for a shared request")
+            if isinstance(call.error, DeadlineExceededError):
+                continue
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+
+class AsyncSingleFlight:
+    """
+    Single-flight group for asyncio tasks.
+
+    The call runs as a task of its own, so cancelling one of the waiting tasks does not
+    cancel it for the others. AsyncYouTubeCore.single_flight holds the process-wide group.
+    """
+
+    def __init__(self):
+        self._calls = {}
+
+    async def do(self, key: Hashable, fn: Callable, deadline: Optional[Deadline] = None) -> tuple:
+        """
+        Await fn(), unless a call for key is already running in this event loop, then await that call instead.
+
+        Like SingleFlight.do(), a DeadlineExceededError of another task's call is not passed
+        on, the waiting tasks try again.
+
+        Args:
+            key (hashable): Identifies equivalent calls.
+            fn (callable): Coroutine function without arguments.
+            deadline (Deadline, optional): Deadline of this task, it waits for another task's
+                call at most until then.
+
+        Returns:
+            tuple: The result, and True if it came from another task's call.
+
+        Raises:
+            DeadlineExceededError: If the deadline passed while waiting for another task's call.
+        """
+        loop = asyncio.get_event_loop()
+        key = (id(loop), key)
+        while True:
+            task = self._calls.get(key)
+            if task is None:
+                break
+            timeout = max(0.0, deadline.remaining()) if deadline is not None else None
+            # wait() leaves the call running for the other tasks when it times out or is cancelled
+            done, _ = await asyncio.wait({task}, timeout=timeout)
+            if not done:
+                raise DeadlineExceededError("Deadline passed while waiting for a shared request")
+            if not task.cancelled() and isinstance(task.exception(), DeadlineExceededError):
+                continue
+            return task.result(), True
+        task = self._calls[key] = asyncio.ensure_future(fn())
+        task.add_done_callback(lambda finished: self._calls.pop(key, None) if self._calls.get(key) is finished else None)
+        return await asyncio.shield(task), False
@@ -0,0 +1,5 @@
+"""
+NGTube Store Module
+"""
+
+from .store import NGTubeStore
@@ -0,0 +1,345 @@
+"""
+NGTube Store Module
+
+This module provides a SQLite-backed store that keeps videos, channels and comments across runs.
+"""
+
+import sqlite3
+import threading
+import time
+from itertools import islice
+from .. import utils
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS channels (
+    channel_id TEXT PRIMARY KEY,
+    title TEXT,
+    description TEXT,
+    channel_url TEXT,
+    subscribers INTEGER,
+    total_views INTEGER,
+    video_count INTEGER,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS videos (
+    video_id TEXT PRIMARY KEY,
+    channel_id TEXT,
+    title TEXT,
+    channel_name TEXT,
+    view_count INTEGER,
+    like_count INTEGER,
+    duration_in_seconds INTEGER,
+    length_text TEXT,
+    published TEXT,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS comments (
+    comment_id TEXT PRIMARY KEY,
+    video_id TEXT,
+    author TEXT,
+    text TEXT,
+    like_count INTEGER,
+    reply_count INTEGER,
+    published_time_text TEXT,
+    is_top INTEGER,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS snapshots (
+    entity_type TEXT NOT NULL,
+    entity_id TEXT NOT NULL,
+    observed_at REAL NOT NULL,
+    view_count INTEGER,
+    like_count INTEGER,
+    subscribers INTEGER,
+    video_count INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_channels_last_seen ON channels (last_seen);
+CREATE INDEX IF NOT EXISTS idx_videos_last_seen ON videos (last_seen);
+CREATE INDEX IF NOT EXISTS idx_videos_channel ON videos (channel_id);
+CREATE INDEX IF NOT EXISTS idx_comments_video ON comments (video_id);
+CREATE INDEX IF NOT EXISTS idx_comments_last_seen ON comments (last_seen);
+CREATE INDEX IF NOT EXISTS idx_snapshots_entity ON snapshots (entity_type, entity_id, observed_at);
+"""
+
+# New values only overwrite stored ones when they are known, partial rows (e.g. search hits) keep older data
+_UPSERT_CHANNEL = """
+INSERT INTO channels (channel_id, title, description, channel_url, subscribers, total_views, video_count, first_seen, last_seen)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (channel_id) DO UPDATE SET
+    title = COALESCE(excluded.title, channels.title),
+    description = COALESCE(excluded.description, channels.description),
+    channel_url = COALESCE(excluded.channel_url, channels.channel_url),
+    subscribers = COALESCE(excluded.subscribers, channels.subscribers),
+    total_views = COALESCE(excluded.total_views, channels.total_views),
+    video_count = COALESCE(excluded.video_count, channels.video_count),
+    last_seen = excluded.last_seen
+"""
+
+_UPSERT_VIDEO = """
+INSERT INTO videos (video_id, channel_id, title, channel_name, view_count, like_count, duration_in_seconds, length_text, published, first_seen, last_seen)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (video_id) DO UPDATE SET
+    channel_id = COALESCE(excluded.channel_id, videos.channel_id),
+    title = COALESCE(excluded.title, videos.title),
+    channel_name = COALESCE(excluded.channel_name, videos.channel_name),
+    view_count = COALESCE(excluded.view_count, videos.view_count),
+    like_count = COALESCE(excluded.like_count, videos.like_count),
+    duration_in_seconds = COALESCE(excluded.duration_in_seconds, videos.duration_in_seconds),
+    length_text = COALESCE(excluded.length_text, videos.length_text),
+    published = COALESCE(excluded.published, videos.published),
+    last_seen = excluded.last_seen
+"""
+
+_UPSERT_COMMENT = """
+INSERT INTO comments (comment_id, video_id, author, text, like_count, reply_count, published_time_text, is_top, first_seen, last_seen)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (comment_id) DO UPDATE SET
+    video_id = COALESCE(excluded.video_id, comments.video_id),
+    author = COALESCE(excluded.author, comments.author),
+    text = COALESCE(excluded.text, comments.text),
+    like_count = COALESCE(excluded.like_count, comments.like_count),
+    reply_count = COALESCE(excluded.reply_count, comments.reply_count),
+    published_time_text = COALESCE(excluded.published_time_text, comments.published_time_text),
+    is_top = MAX(excluded.is_top, comments.is_top),
+    last_seen = excluded.last_seen
+"""
+
+_INSERT_SNAPSHOT = """
+INSERT INTO snapshots (entity_type, entity_id, observed_at, view_count, like_count, subscribers, video_count)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _first(item, *keys):
+    """Get the first known value of several alternative keys (dict or record)."""
+    for key in keys:
+        value = item.get(key)
+        if value is not None and value != '':
+            return value
+    return None
+
+
+def _count(value):
+    if value is None or isinstance(value, int):
+        return value
+    return utils.extract_number(value)
+
+
+class NGTubeStore:
+    """
+    SQLite store for videos, channels and comments seen across runs.
+
+    Rows are upserted on video_id, channel_id and commentId, keeping first_seen and
+    updating last_seen. Every video and channel write also adds a row to snapshots,
+    so count changes over time can be read with history(). The database uses WAL mode
+    and writes in batched transactions.
+
+    Attributes:
+        path (str): The database file.
+        batch_size (int): Number of rows per transaction in bulk writes.
+    """
+
+    def __init__(self, path: str, batch_size: int = 5000):
+        """
+        Open or create a store.
+
+        Args:
+            path (str): The database file, or ":memory:".
+            batch_size (int): Number of rows per transaction in bulk writes.
+        """
+        self.path = path
+        self.batch_size = max(1, batch_size)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def _write_batches(self, statement: str, rows, snapshots=None) -> int:
+        """Execute statement for rows in transactions of batch_size rows."""
+        count = 0
+        rows = iter(rows)
+        while True:
+            batch = list(islice(rows, self.batch_size))
+            if not batch:
+                return count
+            with self._lock, self._conn:
+                self._conn.executemany(statement, batch)
+                if snapshots:
+                    self._conn.executemany(_INSERT_SNAPSHOT, snapshots(batch))
+            count += len(batch)
+
+    def add_video(self, metadata: dict) -> int:
+        """Upsert the output of Video.extract_metadata()."""
+        return self.add_videos([metadata])
+
+    def add_videos(self, videos, channel_id: str = None) -> int:
+        """
+        Upsert videos from Video, Channel (videos/shorts) or Search output.
+
+        Args:
+            videos (iterable): Video dictionaries or records; search items that are not videos are skipped.
+            channel_id (str, optional): Channel ID for videos that do not carry one.
+
+        Returns:
+            int: Number of videos written.
+        """
+        now = time.time()
+        rows = (
+            (
+                _first(video, 'video_id', 'videoId'),
+                _first(video, 'channel_id') or channel_id,
+                _first(video, 'title'),
+                _first(video, 'channel_name', 'channel', 'author'),
+                _count(_first(video, 'view_count', 'viewCount', 'viewCountText')),
+                _count(_first(video, 'like_count')),
+                _first(video, 'duration_in_seconds'),
+                _first(video, 'lengthText', 'length'),
+                _first(video, 'publish_date', 'publishedTimeText', 'publishedTime'),
+                now,
+                now,
+            )
+            for video in videos
+            if _first(video, 'video_id', 'videoId') and video.get('type', 'video') == 'video'
+        )
+        return self._write_batches(_UPSERT_VIDEO, rows, lambda batch: [
+            ('video', row[0], now, row[4], row[5], None, None) for row in batch
+        ])
+
+    def add_comments(self, comments, video_id: str, is_top: bool = False) -> int:
+        """
+        Upsert comments, e.g. from Comments.iter_comments(). Comments without commentId are skipped.
+
+        Args:
+            comments (iterable): Comment dictionaries or records.
+            video_id (str): The video the comments belong to.
+            is_top (bool): Whether these are top/pinned comments.
+
+        Returns:
+            int: Number of comments written.
+        """
+        now = time.time()
+        rows = (
+            (
+                comment.get('commentId'),
+                video_id,
+                _first(comment, 'author'),
+                _first(comment, 'text'),
+                _count(_first(comment, 'likeCount', 'upvoteCount')),
+                _first(comment, 'replyCount'),
+                _first(comment, 'publishedTimeText', 'dateCreated'),
+                int(is_top),
+                now,
+                now,
+            )
+            for comment in comments
+            if comment.get('commentId')
+        )
+        return self._write_batches(_UPSERT_COMMENT, rows)
+
+    def add_comment_output(self, output: dict, video_id: str) -> int:
+        """Upsert the output of Comments.get_comments()."""
+        count = self.add_comments(output.get('top_comment', []), video_id, is_top=True)
+        return count + self.add_comments(output.get('comments', []), video_id)
+
+    def add_channel(self, profile: dict) -> int:
+        """
+        Upsert the output of Channel.extract_profile(), including its videos.
+
+        Returns:
+            int: Number of rows written (channel and videos).
+        """
+        channel_id = profile.get('channelId')
+        if not channel_id:
+            return 0
+        now = time.time()
+        row = (
+            channel_id,
+            profile.get('title'),
+            profile.get('description'),
+            profile.get('channelUrl'),
+            profile.get('subscribers'),
+            profile.get('total_views'),
+            profile.get('video_count'),
+            now,
+            now,
+        )
+        count = self._write_batches(_UPSERT_CHANNEL, [row], lambda batch: [
+            ('channel', channel_id, now, row[5], None, row[4], row[6])
+        ])
+        return count + self.add_videos(profile.get('videos', []), channel_id=channel_id)
+
+    def add_search_results(self, results) -> int:
+        """
+        Upsert videos and channels from Search.get_results() or Search.iter_results().
+
+        Returns:
+            int: Number of rows written.
+        """
+        items = results.get('items', []) if isinstance(results, dict) else results
+        now = time.time()
+        videos = []
+        channels = []
+        for item in items:
+            if item.get('type') == 'channel' and item.get('channelId'):
+                channels.append((item.get('channelId'), item.get('title'), item.get('description'), None, None, None, None, now, now))
+            elif item.get('type') in ('video', 'movie'):
+                videos.append(item.to_dict() if hasattr(item, 'to_dict') else dict(item))
+                videos[-1]['type'] = 'video'
+        count = self._write_batches(_UPSERT_CHANNEL, channels)
+        return count + self.add_videos(videos)
+
+    def last_seen(self, entity_type: str, entity_id: str):
+        """
+        Get when an entity was last written.
+
+        Args:
+            entity_type (str): "video", "channel" or "comment".
+            entity_id (str): Its ID.
+
+        Returns:
+            float | None: Unix timestamp, or None if unknown.
+        """
+        table, key = {'video': ('videos', 'video_id'), 'channel': ('channels', 'channel_id'), 'comment': ('comments', 'comment_id')}[entity_type]
+        with self._lock:
+            row = self._conn.execute(f"SELECT last_seen FROM {table} WHERE {key} = ?", (entity_id,)).fetchone()
+        return row[0] if row else None
+
+    def seen_since(self, entity_type: str, since: float) -> list:
+        """Get the IDs of all entities of a type written at or after a Unix timestamp."""
+        table, key = {'video': ('videos', 'video_id'), 'channel': ('channels', 'channel_id'), 'comment': ('comments', 'comment_id')}[entity_type]
+        with self._lock:
+            rows = self._conn.execute(f"SELECT {key} FROM {table} WHERE last_seen >= ?", (since,)).fetchall()
+        return [row[0] for row in rows]
+
+    def history(self, entity_type: str, entity_id: str) -> list:
+        """
+        Get the count snapshots of a video or channel, oldest first.
+
+        Returns:
+            list: Dictionaries with observed_at, view_count, like_count, subscribers and video_count.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT observed_at, view_count, like_count, subscribers, video_count FROM snapshots "
+                "WHERE entity_type = ? AND entity_id = ? ORDER BY observed_at",
+                (entity_type, entity_id),
+            ).fetchall()
+        return [
+            {'observed_at': row[0], 'view_count': row[1], 'like_count': row[2], 'subscribers': row[3], 'video_count': row[4]}
+            for row in rows
+        ]
+
+    def close(self):
+        """Close the database."""
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,401 @@
+"""
+NGTube Transport Module
+
+This module provides transport adapters for YouTubeCore sessions, such as recording every
+exchange to an archive, replaying an archive offline and sending requests over HTTP/2.
+
+Usage:
+
+    YouTubeCore.transport = RecordingAdapter("session.ndjson.gz")   # record live traffic
+    YouTubeCore.transport = ReplayAdapter("session.ndjson.gz")      # replay it offline
+    YouTubeCore.transport = HTTP2Adapter()                          # multiplex over HTTP/2
+
+HTTP2Adapter requires httpx with HTTP/2 support (pip install NGTube[http2]).
+"""
+
+import base64
+import gzip
+import http.client
+import json
+import os
+import ssl
+import threading
+import time
+from collections import defaultdict
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.cookies import extract_cookies_to_jar
+from requests.utils import DEFAULT_CA_BUNDLE_PATH, get_encoding_from_headers, select_proxy
+
+from .cache import ResponseCache
+from .core import YouTubeCore, default_retries, transport_deadline
+
+# Bodies are archived decoded, so these headers no longer apply on replay
+_DROPPED_HEADERS = ('content-encoding', 'transfer-encoding', 'content-length')
+
+
+def request_key(method: str, url: str, body) -> str:
+    """
+    Build the key used to match replayed requests.
+
+    JSON bodies are normalized like ResponseCache keys (sorted keys, no visitorData),
+    so a replay matches even when the visitor session differs from the recording.
+    """
+    payload = None
+    if body:
+        if isinstance(body, bytes):
+            body = body.decode('utf-8', 'replace')
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            payload = {'body': body}
+        if not isinstance(payload, dict):
+            payload = {'body': payload}
+    return ResponseCache.make_key(method.upper(), url, payload)
+
+
+def load_archive(path: str) -> list:
+    """
+    Read all exchanges of an archive.
+
+    Returns:
+        list: Dictionaries with method, url, body, status, headers and content (bytes).
+    """
+    exchanges = []
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                exchange = json.loads(line)
+                exchange['content'] = base64.b64decode(exchange['content'])
+                exchanges.append(exchange)
+    return exchanges
+
+
+def save_archive(path: str, exchanges) -> int:
+    """
+    Write exchanges in the archive format, e.g. to build fixtures without network access.
+
+    Args:
+        path (str): The archive file, overwritten if it exists.
+        exchanges (iterable): Dictionaries with method, url, body, status, headers and content (bytes).
+            Extra keys are kept.
+
+    Returns:
+        int: Number of exchanges written.
+    """
+    count = 0
+    # A fixed mtime keeps the file identical when the same exchanges are written again
+    with open(path, 'wb') as raw, gzip.GzipFile(fileobj=raw, mode='wb', mtime=0) as f:
+        for exchange in exchanges:
+            exchange = dict(exchange)
+            exchange['content'] = base64.b64encode(exchange['content']).decode('ascii')
+            f.write((json.dumps(exchange, separators=(',', ':')) + '\n').encode('utf-8'))
+            count += 1
+    return count
+
+
+class RecordingAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that appends every exchange (URL, payload, status, headers, body) to a gzip NDJSON archive.
+
+    Attributes:
+        path (str): The archive file.
+        recorded (int): Number of exchanges written.
+    """
+
+    def __init__(self, path: str, **kwargs):
+        """
+        Initialize the adapter.
+
+        Args:
+            path (str): The archive file, appended to if it exists.
+            **kwargs: Passed to HTTPAdapter, max_retries defaults to the YouTubeCore retry policy.
+        """
+        kwargs.setdefault('max_retries', default_retries())
+        super().__init__(**kwargs)
+        self.path = path
+        self.recorded = 0
+        self._lock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        response = super().send(request, **kwargs)
+        body = request.body
+        if isinstance(body, bytes):
+            body = body.decode('utf-8', 'replace')
+        exchange = {
+            'method': request.method,
+            'url': request.url,
+            'body': body,
+            'status': response.status_code,
+            'headers': {k: v for k, v in response.headers.items() if k.lower() not in _DROPPED_HEADERS},
+            'content': base64.b64encode(response.content).decode('ascii'),
+        }
+        line = json.dumps(exchange, separators=(',', ':')) + '\n'
+        # Every exchange is a complete gzip member, so the archive stays readable if the process dies
+        with self._lock:
+            with gzip.open(self.path, 'at', encoding='utf-8') as f:
+                f.write(line)
+            self.recorded += 1
+        return response
+
+
+class ReplayAdapter(BaseAdapter):
+    """
+    Adapter that answers requests from a recorded archive without network access.
+
+    Identical requests recorded several times are answered in recording order, the last
+    response is repeated once they are used up. Requests that were never recorded raise
+    requests.ConnectionError.
+
+    Attributes:
+        latency (float): Simulated latency in seconds added to every response.
+        served (int): Number of responses served.
+    """
+
+    def __init__(self, path: str, latency: float = 0.0):
+        """
+        Load an archive.
+
+        Args:
+            path (str): The archive written by RecordingAdapter.
+            latency (float): Simulated latency in seconds added to every response.
+        """
+        super().__init__()
+        self.latency = latency
+        self.served = 0
+        self._lock = threading.Lock()
+        self._exchanges = defaultdict(list)
+        self._positions = defaultdict(int)
+        for exchange in load_archive(path):
+            self._exchanges[request_key(exchange['method'], exchange['url'], exchange['body'])].append(exchange)
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        key = request_key(request.method, request.url, request.body)
+        with self._lock:
+            exchanges = self._exchanges.get(key)
+            if not exchanges:
+                raise requests.ConnectionError(f"No recorded response for {request.method} {request.url}", request=request)
+            position = self._positions[key]
+            exchange = exchanges[min(position, len(exchanges) - 1)]
+            self._positions[key] = position + 1
+            self.served += 1
+        if self.latency:
+            time.sleep(self.latency)
+        return self._build_response(request, exchange)
+
+    def _build_response(self, request, exchange: dict) -> requests.Response:
+        response = requests.Response()
+        response.status_code = exchange['status']
+        response.headers = CaseInsensitiveDict(exchange['headers'])
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = exchange['content']
+        response.url = request.url
+        response.request = request
+        response.reason = 'OK' if response.status_code == 200 else ''
+        return response
+
+    def close(self):
+        pass
+
+
+def _import_httpx():
+    try:
+        import httpx
+    except ImportError:
+        raise ImportError("HTTP2Adapter requires httpx, install it with 'pip install NGTube[http2]'")
+    return httpx
+
+
+def _brotli_available() -> bool:
+    for module in ('brotli', 'brotlicffi'):
+        try:
+            __import__(module)
+            return True
+        except ImportError:
+            continue
+    return False
+
+
+def _ssl_context(verify, cert):
+    """
+    Build the httpx verify setting from requests' verify and cert arguments.
+
+    Args:
+        verify (bool | str): Verify certificates, or the path of a CA bundle file or directory.
+        cert (str | tuple): Client certificate file, or a (certificate, key) tuple.
+
+    Returns:
+        bool | ssl.SSLContext: True for the default verification, an SSLContext otherwise.
+    """
+    if verify is True and not cert:
+        return True
+    if verify is False:
+        context = ssl.create_default_context()
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+    elif isinstance(verify, str):
+        if not os.path.exists(verify):
+            raise OSError(f"Could not find a suitable TLS CA certificate bundle, invalid path: {verify}")
+        context = ssl.create_default_context(capath=verify) if os.path.isdir(verify) else ssl.create_default_context(cafile=verify)
+    else:
+        context = ssl.create_default_context(cafile=DEFAULT_CA_BUNDLE_PATH)
+    if cert:
+        certfile, keyfile = cert if isinstance(cert, tuple) else (cert, None)
+        context.load_cert_chain(certfile, keyfile)
+    return context
+
+
+class _RawResponse:
+    """Stand-in for the urllib3 response requests reads Set-Cookie headers from."""
+
+    def __init__(self, headers):
+        message = http.client.HTTPMessage()
+        for name, value in headers:
+            message[name] = value
+        self._original_response = self
+        self.msg = message
+
+    def close(self):
+        pass
+
+    def release_conn(self):
+        pass
+
+
+# Connection-specific headers are not allowed in HTTP/2 requests
+_HOP_BY_HOP_HEADERS = ('connection', 'keep-alive', 'proxy-connection', 'transfer-encoding', 'upgrade')
+
+
+class HTTP2Adapter(BaseAdapter):
+    """
+    Adapter that sends requests through an httpx client over HTTP/2.
+
+    Install one instance as YouTubeCore.transport so every session shares its client:
+    concurrent requests to www.youtube.com are multiplexed over a few connections instead
+    of one HTTP/1.1 connection each, which saves TLS handshakes. Responses are compressed
+    with brotli when brotli is installed, with gzip otherwise. Connection errors are retried
+    like with the default transport, not for requests with a deadline, 429 and 5xx responses
+    are retried by YouTubeCore.
+
+    The async API uses aiohttp and is not affected.
+
+    Requests are sent through the proxies requests selects for them, e.g. YouTubeCore.proxy
+    or the HTTP(S)_PROXY environment variables, with the session's verify and cert settings.
+    Each combination gets its own client. Set-Cookie headers reach the session cookie jar
+    like with HTTPAdapter.
+
+    Attributes:
+        client (httpx.Client): The shared client for requests without a proxy.
+    """
+
+    def __init__(self, http2: bool = True, max_connections: int = 10, retries: int = 3, **kwargs):
+        """
+        Create the httpx client.
+
+        Args:
+            http2 (bool): Negotiate HTTP/2, False for HTTP/1.1 through httpx.
+            max_connections (int): Maximum number of open connections.
+            retries (int): Retries of failed connection attempts.
+            **kwargs: Passed to every httpx.Client, e.g. follow_redirects.
+        """
+        super().__init__()
+        httpx = _import_httpx()
+        self._httpx = httpx
+        self._transport_options = {
+            'http2': http2,
+            'limits': httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+        }
+        self._retries = retries
+        self._client_options = kwargs
+        self._clients = {}
+        self._lock = threading.Lock()
+        self.client = self._client(None, True, None, retries)
+        self._accept_encoding = 'br, gzip, deflate' if _brotli_available() else 'gzip, deflate'
+
+    def _client(self, proxy, verify, cert, retries: int):
+        """
+        Get the client for a proxy URL (None for direct connections), the requests verify and cert
+        settings and a number of connection retries.
+        """
+        key = (proxy, verify, cert, retries)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                transport = self._httpx.HTTPTransport(proxy=proxy, verify=_ssl_context(verify, cert), retries=retries,
+                                                      **self._transport_options)
+                client = self._httpx.Client(transport=transport, **self._client_options)
+                self._clients[key] = client
+            return client
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        httpx = self._httpx
+        headers = {k: v for k, v in request.headers.items() if k.lower() not in _HOP_BY_HOP_HEADERS}
+        headers['Accept-Encoding'] = self._accept_encoding
+        if isinstance(cert, list):
+            cert = tuple(cert)
+        # Retries would ignore the deadline, YouTubeCore retries within it
+        retries = 0 if transport_deadline() is not None else self._retries
+        client = self._client(select_proxy(request.url, proxies or {}), verify, cert, retries)
+        try:
+            response = client.request(request.method, request.url, content=request.body, headers=headers,
+                                      timeout=self._timeout(timeout))
+        except httpx.TimeoutException as e:
+            raise requests.Timeout(str(e), request=request)
+        except httpx.TransportError as e:
+            raise requests.ConnectionError(str(e), request=request)
+        return self._build_response(request, response)
+
+    def _timeout(self, timeout):
+        """Convert a requests timeout, a number or a (connect, read) tuple, to an httpx.Timeout."""
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            return self._httpx.Timeout(read, connect=connect)
+        return self._httpx.Timeout(timeout)
+
+    def _build_response(self, request, response) -> requests.Response:
+        result = requests.Response()
+        result.status_code = response.status_code
+        # httpx already decoded the body
+        result.headers = CaseInsensitiveDict((k, v) for k, v in response.headers.items() if k.lower() not in _DROPPED_HEADERS)
+        result.encoding = get_encoding_from_headers(result.headers)
+        result._content = response.content
+        result._content_consumed = True
+        result.url = request.url
+        result.request = request
+        result.reason = response.reason_phrase
+        result.raw = _RawResponse(response.headers.multi_items())
+        # Session.send() copies cookies from raw into the session jar as well
+        extract_cookies_to_jar(result.cookies, request, result.raw)
+        return result
+
+    def close(self):
+        with self._lock:
+            clients, self._clients = list(self._clients.values()), {}
+        for client in clients:
+            client.close()
+
+
+def replay(path: str, latency: float = 0.0) -> ReplayAdapter:
+    """
+    Route every new YouTubeCore session through a ReplayAdapter.
+
+    Returns:
+        ReplayAdapter: The installed adapter.
+    """
+    adapter = ReplayAdapter(path, latency)
+    YouTubeCore.transport = adapter
+    return adapter
+
+
+def record(path: str) -> RecordingAdapter:
+    """
+    Route every new YouTubeCore session through a RecordingAdapter.
+
+    Returns:
+        RecordingAdapter: The installed adapter.
+    """
+    adapter = RecordingAdapter(path)
+    YouTubeCore.transport = adapter
+    return adapter
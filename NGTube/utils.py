@@ -1,9 +1,70 @@
+import functools
+import hashlib
+import math
 import re
+import string
+
+
+# Count suffixes per CountryFilters language ('hl'). Tokens do not clash between
+# languages, so all of them are matched by one combined pattern.
+NUMBER_SUFFIXES = {
+    'en': {'K': 1000, 'M': 1000000, 'B': 1000000000, 'thousand': 1000, 'million': 1000000, 'billion': 1000000000},
+    'de': {'Tsd.': 1000, 'Mio.': 1000000, 'Mio': 1000000, 'Mrd.': 1000000000, 'Mrd': 1000000000, 'Millionen': 1000000, 'Milliarden': 1000000000},
+    'fr': {'k': 1000, 'M': 1000000, 'Md': 1000000000, 'Mrd': 1000000000},
+    'es': {'mil': 1000, 'M': 1000000, 'mil M': 1000000000},
+    'it': {'mila': 1000, 'Mln': 1000000, 'Mrd': 1000000000},
+    'ja': {'千': 1000, '万': 10000, '億': 100000000},
+}
+
+_NUMBER_MULTIPLIERS = {}
+for _suffixes in NUMBER_SUFFIXES.values():
+    _NUMBER_MULTIPLIERS.update(_suffixes)
+
+
+def _suffix_pattern(suffix: str) -> str:
+    pattern = r'\s*'.join(re.escape(part) for part in suffix.split(' '))
+    if suffix[-1] in string.ascii_letters:
+        # Latin suffixes must not be the start of a longer word ("M" in "Music")
+        pattern += r'(?![^\W\d_])'
+    return pattern
+
+
+_NUMBER_PATTERN = re.compile(
+    r'(\d[\d.,\s\u00a0\u202f\']*)(?:\s*(' +
+    '|'.join(_suffix_pattern(suffix) for suffix in sorted(_NUMBER_MULTIPLIERS, key=len, reverse=True)) +
+    r'))?'
+)
+_NUMBER_SEPARATORS = re.compile(r'[^\d]')
+_SUFFIX_SPACES = re.compile(r'\s+')
+
+
+@functools.lru_cache(maxsize=65536)
+def _parse_count(text: str) -> int:
+    match = _NUMBER_PATTERN.search(text)
+    if not match:
+        return 0
+    digits = match.group(1).rstrip('.,\u00a0\u202f\' \t\n')
+    suffix = match.group(2)
+    if not suffix:
+        # No multiplier, every separator is a thousands separator
+        return int(_NUMBER_SEPARATORS.sub('', digits))
+    multiplier = _NUMBER_MULTIPLIERS[_SUFFIX_SPACES.sub(' ', suffix)]
+    # With a multiplier the last '.' or ',' is the decimal separator
+    split_at = max(digits.rfind('.'), digits.rfind(','))
+    if split_at == -1:
+        return int(_NUMBER_SEPARATORS.sub('', digits)) * multiplier
+    whole = _NUMBER_SEPARATORS.sub('', digits[:split_at]) or '0'
+    fraction = _NUMBER_SEPARATORS.sub('', digits[split_at + 1:])
+    # Exact integer arithmetic, a float product truncates e.g. 4.1 * 1000000 to 4099999
+    return int(whole + fraction) * multiplier // 10 ** len(fraction)
 
 
 def extract_number(text):
     """
-    Extract and parse numbers from text, handling German number formatting.
+    Extract and parse a count from text, e.g. "1,234,567 views", "1,2 Mio. Aufrufe" or "1.2万回視聴".
+
+    Suffixes of every CountryFilters language are recognized (see NUMBER_SUFFIXES).
+    Results are cached, so repeated strings are parsed only once.
 
     Args:
         text (str): The text containing numbers.
@@ -13,36 +74,34 @@ def extract_number(text):
     """
     if not text:
         return 0
-    text = text.strip()
-    multiplier = 1
-    if 'Mio' in text:
-        multiplier = 1000000
-        text = text.replace('Mio.', '').replace('Mio', '').strip()
-    elif 'M' in text and 'Mio' not in text:
-        multiplier = 1000000
-        text = text.replace('M', '').strip()
-    elif 'K' in text:
-        multiplier = 1000
-        text = text.replace('K', '').strip()
-    cleaned = re.sub(r'[^\d.,]', '', text)
-    if multiplier == 1:
-        # No multiplier, treat as integer with thousand separators
-        cleaned = cleaned.replace(',', '')
-    else:
-        # With multiplier, handle decimal
-        if '.' in cleaned and ',' not in cleaned:
-            pass  # already good
-        elif ',' in cleaned and '.' not in cleaned:
-            cleaned = cleaned.replace(',', '.')
-        elif ',' in cleaned and '.' in cleaned:
-            cleaned = cleaned.replace('.', '').replace(',', '.')
     try:
-        num = float(cleaned)
-        return int(num * multiplier)
-    except Exception:
+        return _parse_count(str(text))
+    except ValueError:
         return 0
 
 
+def extract_numbers(texts, as_numpy: bool = False):
+    """
+    Parse a column of count strings at once.
+
+    Args:
+        texts (iterable): Strings as accepted by extract_number.
+        as_numpy (bool): If True, return a NumPy int64 array (requires numpy).
+
+    Returns:
+        list | numpy.ndarray: The parsed numbers in input order.
+    """
+    texts = list(texts)
+    parsed = {text: extract_number(text) for text in set(texts)}
+    if as_numpy:
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError("as_numpy=True requires numpy, install it with 'pip install numpy'")
+        return numpy.fromiter((parsed[text] for text in texts), dtype=numpy.int64, count=len(texts))
+    return [parsed[text] for text in texts]
+
+
 def extract_links(text):
     """
     Extract URLs from text.
@@ -57,4 +116,42 @@ def extract_links(text):
         return []
     url_pattern = r'https?://[^\s]+'
     urls = re.findall(url_pattern, text)
-    return urls
\ No newline at end of file
+    return urls
+
+
+class BloomFilter:
+    """
+    Memory-efficient probabilistic set for deduplicating large numbers of IDs.
+
+    Membership tests may return false positives at roughly error_rate, never false negatives.
+
+    Args:
+        capacity (int): Expected number of items.
+        error_rate (float): Target false positive rate at capacity.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        capacity = max(1, capacity)
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, int(round(self.size / capacity * math.log(2))))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.hash_count):
+            yield (first + i * second) % self.size
+
+    def add(self, item: str):
+        """Add an item to the filter."""
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+    def __len__(self) -> int:
+        return self.count
@@ -4,7 +4,12 @@ NGTube Video Module
 This module provides functionality to extract video metadata from YouTube.
 """
 
-from ..core import YouTubeCore
+import copy
+from concurrent.futures import Executor, ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Iterable, Optional
+from requests.adapters import HTTPAdapter
+from ..core import YouTubeCore, default_retries
+from ..ratelimit import RateLimiter
 from ..utils import extract_number
 
 class Video:
@@ -27,14 +32,96 @@ class Video:
         self.core = YouTubeCore(url)
         self.data = {}
 
+    @classmethod
+    def extract_many(cls, urls: Iterable[str], workers: int = 8, rate: Optional[float] = None,
+                     parse_pool: Optional[Executor] = None):
+        """
+        Extract metadata for many videos in a thread pool.
+
+        All videos share one connection pool of workers connections (or YouTubeCore.transport,
+        if set). At most 2 * workers URLs are taken from urls at a time, so it can be a
+        generator over a very long list.
+
+        Parsing a watch page is CPU bound and holds the GIL, so with threads alone throughput
+        tops out at about one core. Pass a ProcessPoolExecutor as parse_pool to fetch pages
+        in the worker threads and parse them in its processes, only the metadata is sent back.
+
+        Args:
+            urls (iterable): YouTube video URLs.
+            workers (int): Number of parallel fetches.
+            rate (float, optional): Maximum number of page fetches per second over all workers.
+            parse_pool (Executor, optional): Executor that parses the fetched pages, e.g. a ProcessPoolExecutor.
+
+        Yields:
+            tuple: (url, metadata) as fetches finish, or (url, exception) for failed videos.
+        """
+        workers = max(1, workers)
+        transport = YouTubeCore.transport
+        if transport is None:
+            transport = HTTPAdapter(max_retries=default_retries(), pool_connections=1, pool_maxsize=workers)
+        limiter = RateLimiter(rate) if rate else None
+
+        def extract(url: str) -> dict:
+            video = cls.__new__(cls)
+            video.url = url
+            video.core = YouTubeCore(url, transport=transport)
+            video.data = {}
+            if limiter is not None:
+                limiter.acquire()
+            if parse_pool is None:
+                return video.extract_metadata()
+            return parse_pool.submit(_parse_watch_page, url, video.core.fetch_html()).result()
+
+        def finished(done):
+            for future in done:
+                url = pending.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = e
+                yield url, result
+
+        pending = {}
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            try:
+                for url in urls:
+                    pending[executor.submit(extract, url)] = url
+                    if len(pending) >= workers * 2:
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        yield from finished(done)
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    yield from finished(done)
+            finally:
+                for future in pending:
+                    future.cancel()
+
     def extract_metadata(self) -> dict:
         """
         Extract video metadata from ytInitialData and ytInitialPlayerResponse.
 
+        Concurrent calls for the same video share one download and one parse, see YouTubeCore.single_flight.
+
+        Returns:
+            dict: A dictionary containing video metadata.
+        """
+        key = ("metadata", self.core.resolve_url(self.url))
+        data = self.core.coalesce(key, lambda: self._parse_metadata(self.core.fetch_html()))
+        if data is not self.data:
+            # Parsed by another instance
+            self.data = copy.deepcopy(data)
+        return self.data
+
+    def _parse_metadata(self, html: str) -> dict:
+        """
+        Parse video metadata from the watch page HTML into self.data.
+
+        Args:
+            html (str): The watch page HTML.
+
         Returns:
             dict: A dictionary containing video metadata.
         """
-        html = self.core.fetch_html()
         data = self.core.extract_ytinitialdata(html)
         player_data = self.core.extract_ytinitialplayerresponse(html)
 
@@ -161,4 +248,9 @@ class Video:
         if subscriber_text:
             self.data['subscriber_count'] = extract_number(subscriber_text)
 
-        return self.data
\ No newline at end of file
+        return self.data
+
+
+def _parse_watch_page(url: str, html: str) -> dict:
+    """Parse video metadata from watch page HTML, run in parse pool processes."""
+    return Video(url)._parse_metadata(html)
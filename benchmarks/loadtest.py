@@ -0,0 +1,247 @@
+"""
+NGTube Load Test
+
+Runs Video, Comments, Channel and Search workloads against the stand-in server at
+increasing worker counts and reports requests per second, items per second, request
+latency percentiles, retries, errors and CPU use per configuration:
+
+    python benchmarks/loadtest.py --workers 1,2,4,8,16 --duration 10 --latency 0.05
+
+Unless --base-url is given, a stand-in server is started in a separate process, so its
+CPU use does not count against the extractors. CPU % is the process CPU time of all
+threads over wall time, 100% is one fully used core. The adaptive rate limits of
+YouTubeCore are disabled unless --rate-limits is given.
+"""
+
+import argparse
+import itertools
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from requests.adapters import HTTPAdapter
+
+from NGTube import Channel, Comments, Search, Video, YouTubeCore
+from NGTube.core import default_retries
+
+STANDIN = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'standin.py')
+
+
+class TimedAdapter(HTTPAdapter):
+    """
+    HTTPAdapter with the default retry policy that records the latency, retries and status of every attempt.
+
+    One instance is shared by all sessions of a run, so they also share its connection pool.
+    """
+
+    def __init__(self, pool_size: int):
+        super().__init__(max_retries=default_retries(), pool_connections=pool_size, pool_maxsize=pool_size)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.latencies = []
+            self.retries = 0
+            self.errors = 0
+
+    def send(self, request, **kwargs):
+        start = time.perf_counter()
+        try:
+            response = super().send(request, **kwargs)
+        except Exception:
+            with self._lock:
+                self.errors += 1
+            raise
+        elapsed = time.perf_counter() - start
+        retries = getattr(response.raw, 'retries', None)
+        with self._lock:
+            self.latencies.append(elapsed)
+            self.retries += len(retries.history) if retries is not None else 0
+            # Error statuses are retried by YouTubeCore, each attempt comes through here
+            if response.status_code in YouTubeCore.retry_statuses:
+                self.retries += 1
+            if response.status_code != 200:
+                self.errors += 1
+        return response
+
+
+def video_task(index: int, args) -> int:
+    Video(f"https://www.youtube.com/watch?v=load{index:07d}").extract_metadata()
+    return 1
+
+
+def comments_task(index: int, args) -> int:
+    comments = Comments(f"https://www.youtube.com/watch?v=load{index:07d}")
+    return sum(1 for _ in comments.iter_comments(max_comments=args.max_comments))
+
+
+def channel_task(index: int, args) -> int:
+    return Channel(f"https://www.youtube.com/@load{index}").extract_profile(max_videos=args.max_videos)['loaded_videos_count']
+
+
+def search_task(index: int, args) -> int:
+    search = Search(f"load test {index}", max_results=args.max_results)
+    search.perform_search()
+    return len(search.results)
+
+
+WORKLOADS = {'video': video_task, 'comments': comments_task, 'channel': channel_task, 'search': search_task}
+
+
+def percentile(values: list, fraction: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(fraction * (len(values) - 1))))]
+
+
+def run_configuration(task, workers: int, duration: float, adapter: TimedAdapter, args) -> dict:
+    """Run a workload with a number of workers for a duration. Tasks running at the end are finished."""
+    adapter.reset()
+    counter = itertools.count()
+    lock = threading.Lock()
+    totals = {'tasks': 0, 'failed_tasks': 0, 'items': 0}
+    deadline = time.perf_counter() + duration
+
+    def worker():
+        while time.perf_counter() < deadline:
+            try:
+                items = task(next(counter), args)
+            except Exception:
+                with lock:
+                    totals['failed_tasks'] += 1
+                continue
+            with lock:
+                totals['tasks'] += 1
+                totals['items'] += items
+
+    cpu_start = time.process_time()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for future in [executor.submit(worker) for _ in range(workers)]:
+            future.result()
+    elapsed = time.perf_counter() - start
+    cpu = time.process_time() - cpu_start
+
+    latencies = list(adapter.latencies)
+    return {
+        'workers': workers,
+        'seconds': elapsed,
+        'tasks': totals['tasks'],
+        'failed_tasks': totals['failed_tasks'],
+        'items': totals['items'],
+        'requests': len(latencies),
+        'requests_per_second': len(latencies) / elapsed,
+        'items_per_second': totals['items'] / elapsed,
+        'p50': percentile(latencies, 0.50),
+        'p95': percentile(latencies, 0.95),
+        'p99': percentile(latencies, 0.99),
+        'mean': statistics.mean(latencies) if latencies else 0.0,
+        'retries': adapter.retries,
+        'errors': adapter.errors,
+        'cpu_percent': 100.0 * cpu / elapsed,
+    }
+
+
+def print_workload(name: str, results: list):
+    print(f"\n{name}")
+    header = (f"{'workers':>7} {'tasks':>7} {'req/s':>9} {'items/s':>10} {'speedup':>8} {'p50 ms':>8} "
+              f"{'p95 ms':>8} {'p99 ms':>8} {'retries':>8} {'errors':>7} {'CPU %':>6}")
+    print(header)
+    print('-' * len(header))
+    base = results[0]['requests_per_second'] if results else 0
+    for r in results:
+        speedup = r['requests_per_second'] / base if base else 0.0
+        print(f"{r['workers']:>7} {r['tasks']:>7} {r['requests_per_second']:>9.1f} {r['items_per_second']:>10.1f} "
+              f"{speedup:>7.2f}x {r['p50'] * 1000:>8.1f} {r['p95'] * 1000:>8.1f} {r['p99'] * 1000:>8.1f} "
+              f"{r['retries']:>8} {r['errors']:>7} {r['cpu_percent']:>6.0f}")
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def start_standin(args):
+    """Start the stand-in server in a subprocess and wait until it accepts connections."""
+    port = free_port()
+    command = [sys.executable, STANDIN, '--port', str(port), '--latency', str(args.latency), '--jitter', str(args.jitter),
+               '--error-rate', str(args.error_rate), '--videos', str(args.videos), '--pages', str(args.pages)]
+    process = subprocess.Popen(command, stdout=subprocess.DEVNULL)
+    deadline = time.time() + 15
+    while time.time() < deadline:
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=0.5).close()
+            return process, f"http://127.0.0.1:{port}"
+        except OSError:
+            if process.poll() is not None:
+                break
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError("Stand-in server did not start")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrency sweep of NGTube workloads against the stand-in server.")
+    parser.add_argument('--workloads', default=','.join(WORKLOADS), help="Comma-separated workloads: " + ', '.join(WORKLOADS))
+    parser.add_argument('--workers', default='1,2,4,8,16', help="Comma-separated worker counts")
+    parser.add_argument('--duration', type=float, default=10.0, help="Seconds per configuration")
+    parser.add_argument('--base-url', help="Use a running stand-in server instead of starting one")
+    parser.add_argument('--latency', type=float, default=0.05, help="Stand-in response delay in seconds")
+    parser.add_argument('--jitter', type=float, default=0.0, help="Stand-in random extra delay in seconds")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Stand-in fraction of 429/5xx responses")
+    parser.add_argument('--videos', type=int, default=300, help="Videos per stand-in channel")
+    parser.add_argument('--pages', type=int, default=5, help="Pages per stand-in comments and search chain")
+    parser.add_argument('--max-videos', type=int, default=300, help="max_videos per Channel task")
+    parser.add_argument('--max-comments', type=int, default=None, help="max_comments per Comments task")
+    parser.add_argument('--max-results', type=int, default=100, help="max_results per Search task")
+    parser.add_argument('--rate-limits', action='store_true', help="Keep the default adaptive rate limits enabled")
+    parser.add_argument('--json', metavar='FILE', help="Write all results to a file")
+    args = parser.parse_args()
+
+    workloads = [name.strip() for name in args.workloads.split(',') if name.strip()]
+    unknown = [name for name in workloads if name not in WORKLOADS]
+    if unknown:
+        parser.error(f"Unknown workloads: {', '.join(unknown)}")
+    worker_counts = [int(n) for n in args.workers.split(',')]
+
+    process = None
+    base_url = args.base_url
+    if not base_url:
+        process, base_url = start_standin(args)
+    adapter = TimedAdapter(pool_size=max(10, max(worker_counts)))
+    YouTubeCore.base_url = base_url
+    YouTubeCore.transport = adapter
+    if not args.rate_limits:
+        YouTubeCore.rate_limits = None
+    print(f"Stand-in at {base_url}, {args.duration:g} s per configuration", file=sys.stderr)
+
+    report = {}
+    try:
+        for name in workloads:
+            report[name] = []
+            for workers in worker_counts:
+                print(f"Running {name} with {workers} worker(s) ...", file=sys.stderr)
+                report[name].append(run_configuration(WORKLOADS[name], workers, args.duration, adapter, args))
+            print_workload(name, report[name])
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'config': vars(args), 'base_url': base_url, 'results': report}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
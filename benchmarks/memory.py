@@ -0,0 +1,318 @@
+"""
+NGTube Memory Benchmarks
+
+Runs long crawls against synthetic continuation chains, replayed offline, and records
+memory over the crawl: traced Python memory, RSS and the number of live objects after
+every few requests. Every scenario runs in its own process, so peak RSS is not shared.
+
+Streaming scenarios (iter_*) should stay flat, apart from the video IDs they keep for
+deduplication. They are flagged when memory grows by more than --threshold bytes per
+page. Accumulating scenarios (extract_profile, get_comments, ...) grow by design, their
+growth per page is reported for comparison.
+
+    python benchmarks/memory.py
+    python benchmarks/memory.py -k comments --pages 1000
+"""
+
+import argparse
+import gc
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from NGTube import Channel, Comments, Search, Shorts, YouTubeCore
+from NGTube.transport import ReplayAdapter, save_archive
+
+import corpus
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+
+def current_rss():
+    """Resident set size in bytes, None where /proc is not available."""
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def peak_rss():
+    """Peak resident set size of this process in bytes, None if unknown."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+class Sampler:
+    """
+    Records memory after every few API requests of an extractor.
+
+    Attributes:
+        every (int): Requests between samples.
+        requests (int): Requests made so far.
+        items (int): Items consumed so far, updated by the scenario.
+        samples (list): One dictionary per sample.
+    """
+
+    def __init__(self, every: int):
+        self.every = max(1, every)
+        self.requests = 0
+        self.items = 0
+        self.samples = []
+        self._lock = threading.Lock()
+
+    def attach(self, core: YouTubeCore):
+        """
+        Sample after every few calls to the core's fetch_api_body.
+
+        make_api_request goes through fetch_api_body, and pages parsed in a pool call it
+        directly, so every API page is counted once.
+        """
+        original = core.fetch_api_body
+
+        def fetch_api_body(*args, **kwargs):
+            body = original(*args, **kwargs)
+            with self._lock:
+                self.requests += 1
+                if self.requests % self.every == 0:
+                    self.sample()
+            return body
+
+        core.fetch_api_body = fetch_api_body
+
+    def sample(self, final: bool = False):
+        gc.collect()
+        self.samples.append({
+            'final': final,
+            'requests': self.requests,
+            'items': self.items,
+            'traced': tracemalloc.get_traced_memory()[0],
+            'rss': current_rss(),
+            'objects': len(gc.get_objects()),
+        })
+
+
+def growth_per_page(samples: list, key: str) -> float:
+    """Least-squares slope of a sample value per request during the crawl, ignoring its first fifth."""
+    samples = [s for s in samples if not s.get('final')]
+    points = [(s['requests'], s[key]) for s in samples[len(samples) // 5:] if s[key] is not None]
+    if len(points) < 2:
+        return 0.0
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    variance = sum((x - mean_x) ** 2 for x, _ in points)
+    if not variance:
+        return 0.0
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / variance
+
+
+def consume(iterator, sampler: Sampler) -> int:
+    """Drain an iterator without keeping its items."""
+    for _ in iterator:
+        sampler.items += 1
+    return sampler.items
+
+
+# Scenarios: each returns the exchanges to replay, a factory for the extractor and the crawl.
+
+def channel_exchanges(c: corpus.Corpus, args) -> list:
+    home = corpus.api_exchange('channel_home', corpus.BROWSE_URL, c.browse_payload(), c.channel_videos(6))
+    html = corpus.page_exchange('channel_html', corpus.CHANNEL_URL, c.html_page({"responseContext": c.response_context(), "metadata": c.channel_metadata()}))
+    return [html, home] + c.channel_chain(args.videos)
+
+
+def comments_exchanges(c: corpus.Corpus, args) -> list:
+    token = c.token("Eg0S")
+    page = corpus.page_exchange('watch', corpus.WATCH_URL, c.watch_page(corpus.WATCH_URL.split('v=')[1], token))
+    return [page] + c.comments_chain(token, args.pages)
+
+
+def search_exchanges(c: corpus.Corpus, args) -> list:
+    home = corpus.page_exchange('home_html', corpus.BASE_URL + '/', c.html_page({"responseContext": c.response_context()}))
+    return [home] + c.search_chain("benchmark", args.pages)
+
+
+def feed_exchanges(c: corpus.Corpus, args) -> list:
+    token = c.token("CBQ")
+    page = corpus.page_exchange('shorts_html', f"{corpus.BASE_URL}/shorts", c.shorts_page(token))
+    return [page] + c.feed_chain(token, args.pages)
+
+
+SCENARIOS = {
+    'channel.extract_profile': {
+        'flat': False, 'exchanges': channel_exchanges,
+        'create': lambda args: Channel(corpus.CHANNEL_URL),
+        'crawl': lambda channel, sampler, args: len(channel.extract_profile(max_videos='all')['videos']),
+    },
+    'channel.iter_videos': {
+        'flat': True, 'exchanges': channel_exchanges,
+        'create': lambda args: Channel(corpus.CHANNEL_URL),
+        'crawl': lambda channel, sampler, args: consume(channel.iter_videos('all'), sampler),
+    },
+    'comments.get_comments': {
+        'flat': False, 'exchanges': comments_exchanges,
+        'create': lambda args: Comments(corpus.WATCH_URL),
+        'crawl': lambda comments, sampler, args: len(comments.get_comments()['comments']),
+    },
+    'comments.iter_comments': {
+        'flat': True, 'exchanges': comments_exchanges,
+        'create': lambda args: Comments(corpus.WATCH_URL),
+        'crawl': lambda comments, sampler, args: consume(comments.iter_comments(), sampler),
+    },
+    'search.perform_search': {
+        'flat': False, 'exchanges': search_exchanges,
+        'create': lambda args: Search("benchmark", max_results=args.pages * 20),
+        'crawl': lambda search, sampler, args: (search.perform_search(), len(search.results))[1],
+    },
+    'search.iter_results': {
+        'flat': True, 'exchanges': search_exchanges,
+        'create': lambda args: Search("benchmark", max_results=args.pages * 20),
+        'crawl': lambda search, sampler, args: consume(search.iter_results(), sampler),
+    },
+    'shorts.iter_shorts_feed': {
+        'flat': True, 'exchanges': feed_exchanges,
+        'create': lambda args: Shorts(),
+        'crawl': lambda shorts, sampler, args: consume(shorts.iter_shorts_feed(max_shorts=args.pages * 10), sampler),
+    },
+}
+
+
+def top_allocators(snapshot, limit: int) -> list:
+    """The source lines holding the most traced memory."""
+    snapshot = snapshot.filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+        tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+        tracemalloc.Filter(False, '<unknown>'),
+    ))
+    allocators = []
+    for stat in snapshot.statistics('lineno')[:limit]:
+        frame = stat.traceback[0]
+        filename = frame.filename
+        if filename.startswith(ROOT):
+            filename = os.path.relpath(filename, ROOT)
+        allocators.append({'where': f"{filename}:{frame.lineno}", 'size': stat.size, 'count': stat.count})
+    return allocators
+
+
+def run_scenario(name: str, args) -> dict:
+    """Run one scenario in this process and return its report."""
+    scenario = SCENARIOS[name]
+    exchanges = scenario['exchanges'](corpus.Corpus(seed=args.seed), args)
+    handle, path = tempfile.mkstemp(suffix='.ndjson.gz')
+    os.close(handle)
+    try:
+        save_archive(path, exchanges)
+        YouTubeCore.transport = ReplayAdapter(path)
+    finally:
+        os.remove(path)
+    # The replayed crawl has nothing to wait for
+    YouTubeCore.rate_limits = None
+    del exchanges
+    gc.collect()
+
+    tracemalloc.start()
+    sampler = Sampler(args.sample_every)
+    sampler.sample()
+    extractor = scenario['create'](args)
+    sampler.attach(extractor.core)
+    start = time.perf_counter()
+    items = scenario['crawl'](extractor, sampler, args)
+    elapsed = time.perf_counter() - start
+    sampler.sample(final=True)
+    snapshot = tracemalloc.take_snapshot()
+    traced_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    traced_growth = growth_per_page(sampler.samples, 'traced')
+    return {
+        'scenario': name,
+        'flat': scenario['flat'],
+        'pages': sampler.requests,
+        'items': items,
+        'seconds': elapsed,
+        'peak_rss': peak_rss(),
+        'traced_peak': traced_peak,
+        'traced_growth_per_page': traced_growth,
+        'rss_growth_per_page': growth_per_page(sampler.samples, 'rss'),
+        'objects_growth_per_page': growth_per_page(sampler.samples, 'objects'),
+        'grows': scenario['flat'] and traced_growth > args.threshold,
+        'samples': sampler.samples,
+        'top_allocators': top_allocators(snapshot, args.top),
+    }
+
+
+def print_report(reports: list, top: int):
+    header = (f"{'scenario':<26} {'pages':>6} {'items':>8} {'peak RSS MiB':>13} {'traced MiB':>11} "
+              f"{'B/page':>9} {'objs/page':>10}")
+    print(header)
+    print('-' * len(header))
+    for report in reports:
+        rss = f"{report['peak_rss'] / 2 ** 20:.1f}" if report['peak_rss'] else '-'
+        line = (f"{report['scenario']:<26} {report['pages']:>6} {report['items']:>8} {rss:>13} "
+                f"{report['traced_peak'] / 2 ** 20:>11.1f} {report['traced_growth_per_page']:>9.0f} "
+                f"{report['objects_growth_per_page']:>10.1f}")
+        if report['grows']:
+            line += "  GROWS"
+        elif not report['flat']:
+            line += "  (accumulates)"
+        print(line)
+    for report in reports:
+        if top:
+            print(f"\nTop allocators at the end of {report['scenario']}:")
+            for allocator in report['top_allocators'][:top]:
+                print(f"  {allocator['size'] / 1024:>10.1f} KiB {allocator['count']:>8} blocks  {allocator['where']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Profile NGTube memory over long crawls against replayed fixtures.")
+    parser.add_argument('-k', '--filter', default='', help="Only run scenarios whose name contains this text")
+    parser.add_argument('--videos', type=int, default=20000, help="Videos in the channel chain")
+    parser.add_argument('--pages', type=int, default=500, help="Pages in the comments, search and Shorts feed chains")
+    parser.add_argument('--sample-every', type=int, default=10, help="Requests between memory samples")
+    parser.add_argument('--threshold', type=float, default=8192, help="Growth in bytes per page that flags a streaming scenario")
+    parser.add_argument('--top', type=int, default=5, help="Top allocators shown per scenario")
+    parser.add_argument('--seed', type=int, default=20251208, help="Corpus seed")
+    parser.add_argument('--json', metavar='FILE', help="Also write the full reports, including all samples, to a file")
+    parser.add_argument('--child', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_scenario(args.child, args)))
+        return
+
+    reports = []
+    for name in SCENARIOS:
+        if args.filter not in name:
+            continue
+        print(f"Running {name} ...", file=sys.stderr)
+        command = [sys.executable, os.path.abspath(__file__), '--child', name] + sys.argv[1:]
+        output = subprocess.run(command, stdout=subprocess.PIPE, check=True, universal_newlines=True).stdout
+        reports.append(json.loads(output.strip().splitlines()[-1]))
+
+    print_report(reports, args.top)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(reports, f, indent=2)
+
+    growing = [report['scenario'] for report in reports if report['grows']]
+    if growing:
+        print(f"\nMemory grows with crawl length in: {', '.join(growing)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+"""
+NGTube Extractor Benchmarks
+
+Times every extractor against the fixture corpus and reports time per page, items per
+second and allocations. Results can be saved as a baseline and compared later:
+
+    python benchmarks/run.py --save baseline.json
+    python benchmarks/run.py --compare baseline.json
+
+The comparison exits with status 1 if any benchmark got slower than the threshold.
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import NGTube
+from NGTube import Channel, Comments, Search, Shorts, Video, YouTubeCore
+from NGTube.transport import ReplayAdapter, load_archive, save_archive
+
+import corpus
+
+
+class Benchmark:
+    """
+    A benchmark case.
+
+    Attributes:
+        name (str): Unique name, used to match baselines.
+        extractor (str): The extractor under test.
+        pages (int): Pages processed per call.
+        run (callable): Processes the pages once and returns the number of items extracted.
+    """
+
+    def __init__(self, name: str, extractor: str, pages: int, run):
+        self.name = name
+        self.extractor = extractor
+        self.pages = pages
+        self.run = run
+
+
+def load_fixtures(path: str) -> dict:
+    """Load the fixture archive, keyed by fixture name."""
+    return {exchange['name']: exchange for exchange in load_archive(path)}
+
+
+def offline(exchanges: list):
+    """Route new YouTubeCore sessions through a ReplayAdapter serving the given exchanges."""
+    handle, path = tempfile.mkstemp(suffix='.ndjson.gz')
+    os.close(handle)
+    try:
+        save_archive(path, exchanges)
+        YouTubeCore.transport = ReplayAdapter(path)
+    finally:
+        os.remove(path)
+
+
+def build_benchmarks(fixtures: dict, chain_videos: int) -> list:
+    """Create the benchmark cases. Extractor objects are built once, offline."""
+    html = fixtures['watch']['content'].decode('utf-8')
+    data = {name: json.loads(exchange['content']) for name, exchange in fixtures.items() if exchange['method'] == 'POST'}
+
+    YouTubeCore.rate_limits = None
+    offline(list(fixtures.values()))
+    core = YouTubeCore(corpus.WATCH_URL)
+    channel = Channel(corpus.CHANNEL_URL)
+    search = Search("benchmark")
+    shorts = Shorts()
+    comments = Comments.from_continuation("benchmark", corpus.VISITOR_DATA)
+
+    def metadata():
+        video = Video(corpus.WATCH_URL)
+        video.core._cached_html = html
+        return int(bool(video.extract_metadata()))
+
+    def comments_page(name):
+        return lambda: len(comments.extract_api_comments(data[name]))
+
+    def feed():
+        return sum(1 for entry in data['shorts_feed']['entries'] if shorts._parse_feed_entry(entry))
+
+    chain_pages = max(1, -(-chain_videos // 30))
+    chain = corpus.Corpus(seed=chain_videos).channel_chain(chain_videos)
+    offline([fixtures['channel_html']] + chain)
+    chain_channel = Channel(corpus.CHANNEL_URL)
+    YouTubeCore.transport = None
+
+    return [
+        Benchmark('extract_ytinitialdata/watch', 'YouTubeCore.extract_ytinitialdata', 1, lambda: int(bool(core.extract_ytinitialdata(html)))),
+        Benchmark('extract_ytinitialplayerresponse/watch', 'YouTubeCore.extract_ytinitialplayerresponse', 1, lambda: int(bool(core.extract_ytinitialplayerresponse(html)))),
+        Benchmark('extract_metadata/watch', 'Video.extract_metadata', 1, metadata),
+        Benchmark('find_videos/first_page', 'Channel._find_videos', 1, lambda: len(channel._find_videos(data['channel_videos']))),
+        Benchmark('find_videos/continuation', 'Channel._find_videos', 1, lambda: len(channel._find_videos(data['channel_continuation']))),
+        Benchmark(f'iter_videos/{chain_videos}_videos', 'Channel.iter_videos', chain_pages, lambda: sum(1 for _ in chain_channel.iter_videos('all'))),
+        Benchmark('parse_results/search', 'Search._parse_results', 1, lambda: len(search._parse_results(data['search'])[0])),
+        Benchmark('extract_api_comments/page', 'Comments.extract_api_comments', 1, comments_page('comments_page')),
+        Benchmark('extract_api_comments/large_page', 'Comments.extract_api_comments', 1, comments_page('comments_page_large')),
+        Benchmark('parse_response/short', 'Shorts._parse_response', 1, lambda: len(shorts._parse_response(data['short']))),
+        Benchmark('parse_feed_entry/feed', 'Shorts._parse_feed_entry', 1, feed),
+    ]
+
+
+def measure(benchmark: Benchmark, repeat: int, min_time: float) -> dict:
+    """
+    Time a benchmark, then run it once more under tracemalloc.
+
+    Every sample runs the benchmark often enough to take min_time seconds, the
+    median of the samples is reported.
+    """
+    items = benchmark.run()
+    start = time.perf_counter()
+    benchmark.run()
+    loops = max(1, int(min_time / max(time.perf_counter() - start, 1e-9)))
+
+    samples = []
+    gc.collect()
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(loops):
+            benchmark.run()
+        samples.append((time.perf_counter() - start) / loops)
+    seconds = statistics.median(samples)
+
+    gc.collect()
+    tracemalloc.start()
+    blocks = sys.getallocatedblocks()
+    benchmark.run()
+    _, peak = tracemalloc.get_traced_memory()
+    blocks = sys.getallocatedblocks() - blocks
+    tracemalloc.stop()
+
+    return {
+        'extractor': benchmark.extractor,
+        'pages': benchmark.pages,
+        'items': items,
+        'seconds': seconds,
+        'seconds_per_page': seconds / benchmark.pages,
+        'items_per_second': items / seconds if seconds else 0.0,
+        'stdev': statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        'peak_bytes': peak,
+        'retained_blocks': blocks,
+    }
+
+
+def print_results(results: dict, baseline: dict = None, threshold: float = 0.1) -> list:
+    """
+    Print a result table, with the change against the baseline if given.
+
+    Returns:
+        list: Names of benchmarks slower than the baseline by more than the threshold.
+    """
+    regressions = []
+    header = f"{'benchmark':<40} {'items':>7} {'ms/page':>10} {'items/s':>12} {'peak KiB':>10} {'blocks':>8}"
+    if baseline is not None:
+        header += f" {'baseline':>10} {'change':>8}"
+    print(header)
+    print('-' * len(header))
+    for name, result in results.items():
+        line = (f"{name:<40} {result['items']:>7} {result['seconds_per_page'] * 1000:>10.3f} "
+                f"{result['items_per_second']:>12,.0f} {result['peak_bytes'] / 1024:>10.1f} {result['retained_blocks']:>8}")
+        if baseline is not None:
+            previous = baseline.get(name)
+            if previous is None:
+                line += f" {'-':>10} {'new':>8}"
+            else:
+                change = result['seconds_per_page'] / previous['seconds_per_page'] - 1
+                line += f" {previous['seconds_per_page'] * 1000:>10.3f} {change:>+8.1%}"
+                if change > threshold:
+                    line += "  SLOWER"
+                    regressions.append(name)
+        print(line)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark NGTube extractors against the fixture corpus.")
+    parser.add_argument('-k', '--filter', default='', help="Only run benchmarks whose name contains this text")
+    parser.add_argument('--repeat', type=int, default=5, help="Number of timing samples per benchmark")
+    parser.add_argument('--min-time', type=float, default=0.2, help="Minimum duration of one sample in seconds")
+    parser.add_argument('--chain-videos', type=int, default=10000, help="Videos in the channel continuation chain")
+    parser.add_argument('--fixtures', default=corpus.FIXTURES, help="Fixture archive")
+    parser.add_argument('--save', metavar='FILE', help="Save the results as a baseline")
+    parser.add_argument('--compare', metavar='FILE', help="Compare against a saved baseline")
+    parser.add_argument('--threshold', type=float, default=0.1, help="Relative slowdown reported as a regression")
+    args = parser.parse_args()
+
+    benchmarks = [b for b in build_benchmarks(load_fixtures(args.fixtures), args.chain_videos) if args.filter in b.name]
+    results = {}
+    for benchmark in benchmarks:
+        print(f"Running {benchmark.name} ...", file=sys.stderr)
+        results[benchmark.name] = measure(benchmark, args.repeat, args.min_time)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)['results']
+    regressions = print_results(results, baseline, args.threshold)
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump({
+                'ngtube_version': NGTube.__version__,
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                'results': results,
+            }, f, indent=2)
+        print(f"Saved baseline to {args.save}")
+
+    if regressions:
+        print(f"{len(regressions)} benchmark(s) slower than the baseline by more than {args.threshold:.0%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
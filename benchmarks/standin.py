@@ -0,0 +1,334 @@
+"""
+NGTube Stand-in Server
+
+A local HTTP server that imitates the youtube.com pages and innertube endpoints the
+extractors use, for load tests of concurrency, retry and rate limiting changes without
+touching YouTube. Responses come from the benchmark corpus builders. Continuation
+chains have a configurable length and page size, and every response can be delayed or
+replaced by a 429/5xx error.
+
+    python benchmarks/standin.py --port 8080 --latency 0.05 --error-rate 0.02
+
+Point NGTube at it with:
+
+    YouTubeCore.base_url = "http://127.0.0.1:8080"
+
+Served routes:
+
+    GET  /watch?v=ID, /@handle, /channel/ID, /c/name, /user/name, /shorts, /
+    POST /youtubei/v1/next, /browse, /search, /reel/reel_item_watch, /reel/reel_watch_sequence
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+import zlib
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from urllib.parse import parse_qs, urlsplit
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import corpus
+
+# Tokens carry the chain, the page and the seed, so the server keeps no state per crawl
+_TOKEN = re.compile(r'^NGT(?P<kind>[a-z])(?P<page>\d{6})x(?P<seed>\d+)_')
+
+DEFAULT_PAGE_SIZES = {'channel': 30, 'comments': 20, 'search': 20, 'feed': 10}
+
+
+class StandinConfig:
+    """
+    Behaviour of the stand-in server, can be changed while it runs.
+
+    Attributes:
+        videos (int): Videos on every channel's videos tab.
+        pages (int): Pages in comments, search and Shorts feed chains.
+        page_sizes (dict): Items per page for 'channel', 'comments', 'search' and 'feed'.
+        latency (float): Delay in seconds before every response.
+        jitter (float): Random extra delay of up to this many seconds.
+        error_rate (float): Fraction of requests answered with an error status.
+        error_statuses (tuple): Statuses to pick errors from.
+        retry_after (int | None): Retry-After header in seconds sent with 429 responses.
+    """
+
+    def __init__(self, videos: int = 10000, pages: int = 50, page_sizes: dict = None, latency: float = 0.0,
+                 jitter: float = 0.0, error_rate: float = 0.0, error_statuses=(429, 500, 503), retry_after=1):
+        self.videos = videos
+        self.pages = pages
+        self.page_sizes = dict(DEFAULT_PAGE_SIZES, **(page_sizes or {}))
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_statuses = tuple(error_statuses)
+        self.retry_after = retry_after
+
+
+def make_token(kind: str, page: int, seed: int) -> str:
+    """A continuation token for page of a chain, padded to the length of real tokens."""
+    prefix = f"NGT{kind}{page:06d}x{seed}_"
+    padding = corpus.Corpus(seed=zlib.crc32(prefix.encode('ascii'))).token('')
+    return (prefix + padding)[:max(len(prefix), 128)]
+
+
+def parse_token(token: str):
+    """Return (kind, page, seed) of a stand-in token, None for anything else."""
+    match = _TOKEN.match(token or '')
+    if not match:
+        return None
+    return match.group('kind'), int(match.group('page')), int(match.group('seed'))
+
+
+def seed_of(text: str) -> int:
+    return zlib.crc32(text.encode('utf-8'))
+
+
+class StandinHandler(BaseHTTPRequestHandler):
+    """Request handler, answers from the corpus builders according to server.config."""
+
+    protocol_version = "HTTP/1.1"
+    server_version = "NGTubeStandin/1.0"
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    # Plumbing
+
+    def _send(self, status: int, body: bytes, content_type: str, headers: dict = None):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _delay_or_fail(self, route: str) -> bool:
+        """Apply latency and error injection. Returns True if an error was sent."""
+        config = self.server.config
+        delay = config.latency + (random.uniform(0, config.jitter) if config.jitter else 0.0)
+        if delay > 0:
+            time.sleep(delay)
+        self.server.count(route)
+        if config.error_rate and random.random() < config.error_rate:
+            status = random.choice(config.error_statuses)
+            headers = {}
+            if status == 429 and config.retry_after is not None:
+                headers['Retry-After'] = str(config.retry_after)
+            self.server.count(f"{route} {status}")
+            self._send(status, json.dumps({"error": {"code": status}}).encode('utf-8'), 'application/json', headers)
+            return True
+        return False
+
+    def _html(self, route: str, html: str):
+        if not self._delay_or_fail(route):
+            self._send(200, html.encode('utf-8'), 'text/html; charset=utf-8')
+
+    def _json(self, route: str, data: dict):
+        if not self._delay_or_fail(route):
+            self._send(200, json.dumps(data, separators=(',', ':')).encode('utf-8'), 'application/json; charset=UTF-8')
+
+    def _not_found(self):
+        self.server.count('not found')
+        self._send(404, b'Not Found', 'text/plain')
+
+    # Routes
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        path = parts.path.rstrip('/') or '/'
+        query = parse_qs(parts.query)
+        c = corpus.Corpus(seed=seed_of(self.path))
+        if path == '/watch' and query.get('v'):
+            video_id = query['v'][0]
+            self._html('watch', c.watch_page(video_id, make_token('c', 0, seed_of(video_id))))
+        elif path == '/shorts':
+            self._html('shorts', c.shorts_page(make_token('f', 0, random.getrandbits(31))))
+        elif path == '/':
+            self._html('home', c.html_page({"responseContext": c.response_context()}))
+        elif path.startswith(('/@', '/channel/', '/c/', '/user/')):
+            self._html('channel', c.html_page({"responseContext": c.response_context(), "header": c.channel_header(),
+                                               "metadata": c.channel_metadata()}, title="NGTube Benchmark - YouTube"))
+        else:
+            self._not_found()
+
+    def do_POST(self):
+        path = urlsplit(self.path).path
+        length = int(self.headers.get('Content-Length') or 0)
+        try:
+            payload = json.loads(self.rfile.read(length) or b'{}')
+        except ValueError:
+            payload = {}
+        routes = {
+            '/youtubei/v1/next': self._next,
+            '/youtubei/v1/browse': self._browse,
+            '/youtubei/v1/search': self._search,
+            '/youtubei/v1/reel/reel_item_watch': self._reel_item,
+            '/youtubei/v1/reel/reel_watch_sequence': self._reel_sequence,
+        }
+        route = routes.get(path)
+        if route is None:
+            self._not_found()
+        else:
+            route(payload)
+
+    def _chain_page(self, token: str, kind: str):
+        """Return (page, seed, next token) for a token of the given chain kind."""
+        parsed = parse_token(token)
+        if parsed is None or parsed[0] != kind:
+            return None
+        _, page, seed = parsed
+        following = make_token(kind, page + 1, seed) if page + 1 < self.server.config.pages else ""
+        return page, seed, following
+
+    def _next(self, payload: dict):
+        chain = self._chain_page(payload.get('continuation'), 'c')
+        if chain is None:
+            return self._not_found()
+        page, seed, following = chain
+        c = corpus.Corpus(seed=seed + page)
+        self._json('next', c.comments_page(self.server.config.page_sizes['comments'], following, reload=page == 0))
+
+    def _browse(self, payload: dict):
+        config = self.server.config
+        size = config.page_sizes['channel']
+        pages = max(1, -(-config.videos // size))
+        if 'continuation' in payload:
+            parsed = parse_token(payload['continuation'])
+            if parsed is None or parsed[0] != 'v':
+                return self._not_found()
+            _, page, seed = parsed
+            following = make_token('v', page + 1, seed) if page + 1 < pages else ""
+            count = min(size, config.videos - page * size)
+            return self._json('browse', corpus.Corpus(seed=seed + page).channel_continuation(count, following))
+        browse_id = payload.get('browseId', '')
+        c = corpus.Corpus(seed=seed_of(browse_id))
+        if payload.get('params') == "EgZ2aWRlb3PyBgQKAjoA":
+            following = make_token('v', 1, seed_of(browse_id)) if pages > 1 else ""
+            return self._json('browse', c.channel_videos(min(size, config.videos), following))
+        # Home and the other tabs only need the channel metadata
+        self._json('browse', c.channel_videos(6))
+
+    def _search(self, payload: dict):
+        size = self.server.config.page_sizes['search']
+        if 'continuation' in payload:
+            chain = self._chain_page(payload['continuation'], 's')
+            if chain is None:
+                return self._not_found()
+            page, seed, following = chain
+            return self._json('search', corpus.Corpus(seed=seed + page).search_continuation(size, following))
+        seed = seed_of(payload.get('query', '') + payload.get('params', ''))
+        following = make_token('s', 1, seed) if self.server.config.pages > 1 else ""
+        self._json('search', corpus.Corpus(seed=seed).search_results(size, following))
+
+    def _reel_item(self, payload: dict):
+        video_id = payload.get('playerRequest', {}).get('videoId')
+        c = corpus.Corpus(seed=seed_of(video_id) if video_id else random.getrandbits(31))
+        self._json('reel_item_watch', c.short(video_id or c.video_id()))
+
+    def _reel_sequence(self, payload: dict):
+        chain = self._chain_page(payload.get('sequenceParams'), 'f')
+        if chain is None:
+            return self._not_found()
+        page, seed, following = chain
+        self._json('reel_watch_sequence', corpus.Corpus(seed=seed + page).shorts_feed(self.server.config.page_sizes['feed'], following))
+
+
+class StandinServer(ThreadingMixIn, HTTPServer):
+    """
+    Threaded stand-in server.
+
+    Use it as a context manager to run it in a background thread and point
+    YouTubeCore.base_url at it:
+
+        with StandinServer(StandinConfig(latency=0.05)) as server:
+            Channel("https://www.youtube.com/@Any").extract_profile(max_videos='all')
+            print(server.stats)
+
+    Attributes:
+        config (StandinConfig): Current behaviour, changes apply to the next request.
+        stats (Counter): Requests per route, and errors per route and status.
+        url (str): Base URL of the server.
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+    request_queue_size = 128
+
+    def __init__(self, config: StandinConfig = None, host: str = "127.0.0.1", port: int = 0, verbose: bool = False):
+        super().__init__((host, port), StandinHandler)
+        self.config = config or StandinConfig()
+        self.verbose = verbose
+        self.stats = Counter()
+        self._stats_lock = threading.Lock()
+        self._thread = None
+        self._previous_base_url = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def count(self, key: str):
+        with self._stats_lock:
+            self.stats[key] += 1
+
+    def start(self):
+        """Serve in a daemon thread."""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop serving and close the socket."""
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self):
+        from NGTube.core import YouTubeCore
+        self.start()
+        self._previous_base_url = YouTubeCore.base_url
+        YouTubeCore.base_url = self.url
+        return self
+
+    def __exit__(self, *exc_info):
+        from NGTube.core import YouTubeCore
+        YouTubeCore.base_url = self._previous_base_url
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve synthetic youtube.com pages and innertube responses for load tests.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--videos', type=int, default=10000, help="Videos on every channel's videos tab")
+    parser.add_argument('--pages', type=int, default=50, help="Pages in comments, search and Shorts feed chains")
+    parser.add_argument('--page-size', type=int, help="Items per page for all chains (default 30 videos, 20 comments, 20 results, 10 shorts)")
+    parser.add_argument('--latency', type=float, default=0.0, help="Delay in seconds before every response")
+    parser.add_argument('--jitter', type=float, default=0.0, help="Random extra delay of up to this many seconds")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Fraction of requests answered with 429/500/503")
+    parser.add_argument('--retry-after', type=int, default=1, help="Retry-After seconds sent with 429 responses")
+    parser.add_argument('-v', '--verbose', action='store_true', help="Log every request")
+    args = parser.parse_args()
+
+    page_sizes = {kind: args.page_size for kind in DEFAULT_PAGE_SIZES} if args.page_size else None
+    config = StandinConfig(videos=args.videos, pages=args.pages, page_sizes=page_sizes, latency=args.latency,
+                           jitter=args.jitter, error_rate=args.error_rate, retry_after=args.retry_after)
+    server = StandinServer(config, args.host, args.port, verbose=args.verbose)
+    print(f"Serving on {server.url}, use YouTubeCore.base_url = \"{server.url}\"")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(dict(server.stats))
+
+
+if __name__ == "__main__":
+    main()
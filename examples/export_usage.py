@@ -0,0 +1,37 @@
+"""
+NGTube Export Example
+
+This example shows how to write comments and channel videos to Parquet files
+instead of one JSON file per video. Requires pyarrow (pip install NGTube[parquet]).
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from NGTube import Comments, Channel
+from NGTube.export import ParquetSink
+
+def main():
+    video_urls = [
+        "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+        "https://www.youtube.com/watch?v=kJQP7kiw5Fk",
+    ]
+
+    # All comments go into one file, written in row groups of 10,000 comments
+    with ParquetSink("comments.parquet", kind="comment", row_group_size=10000) as sink:
+        for url in video_urls:
+            video_id = url.split('v=')[1].split('&')[0]
+            comments = Comments(url)
+            count = sink.write_comments(comments.get_comments(max_comments=500), video_id=video_id)
+            print(f"Wrote {count} comments for {video_id}")
+
+    with ParquetSink("channel_videos.parquet", kind="channel_video") as sink:
+        channel = Channel("https://www.youtube.com/@RickAstleyYT")
+        count = sink.write_channel(channel.extract_profile(max_videos=100))
+        print(f"Wrote {count} channel videos")
+
+    # Load with e.g. pandas.read_parquet("comments.parquet") or pyarrow.parquet.read_table(...)
+
+if __name__ == "__main__":
+    main()
@@ -34,11 +34,11 @@ def main():
         print(f"Sequence Continuation: {short_data.get('sequence_continuation', 'N/A')}")
         print()
 
-        # Fetch comments for the short
-        if short_data.get('video_id'):
+        # Fetch comments for the short, reusing its continuation token (no page download)
+        if short_data.get('comments_continuation'):
             print("Fetching comments...")
             from NGTube import Comments
-            comments_obj = Comments(f"https://www.youtube.com/watch?v={short_data['video_id']}")
+            comments_obj = Comments.from_continuation(short_data['comments_continuation'], shorts.visitor_data)
             comments_data = comments_obj.get_comments(max_comments=50)  # Limit to 50 for demo
             comments = comments_data['comments']
             print(f"Found {len(comments)} comments")
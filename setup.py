@@ -33,4 +33,10 @@ setup(
         "requests",
         "demjson3",
     ],
+    extras_require={
+        "parquet": ["pyarrow"],
+        "zstd": ["zstandard"],
+        "async": ["aiohttp"],
+        "http2": ["httpx[http2,brotli]"],
+    },
 )
\ No newline at end of file
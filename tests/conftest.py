@@ -0,0 +1,66 @@
+import os
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'benchmarks'))
+
+import pytest
+
+from NGTube import YouTubeCore
+
+
+@pytest.fixture
+def standin():
+    """Run the stand-in server, with the process-wide rate limits disabled and the breaker reset afterwards."""
+    from standin import StandinConfig, StandinServer
+    rate_limits = YouTubeCore.rate_limits
+    YouTubeCore.rate_limits = None
+    try:
+        with StandinServer(StandinConfig(latency=0.02)) as server:
+            yield server
+    finally:
+        YouTubeCore.rate_limits = rate_limits
+        YouTubeCore.breaker.reset()
+
+
+@pytest.fixture
+def forward_proxy():
+    """Run a plain HTTP forwarding proxy, its seen attribute lists the proxied URLs."""
+    import threading
+    import urllib.error
+    import urllib.request
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    seen = []
+    opener = urllib.request.build_opener(urllib.request.ProxyHandler({}))
+
+    class Handler(BaseHTTPRequestHandler):
+        def forward(self):
+            seen.append(self.path)
+            body = self.rfile.read(int(self.headers.get('Content-Length') or 0)) or None
+            headers = {k: v for k, v in self.headers.items() if k.lower() not in ('connection', 'proxy-connection', 'host')}
+            try:
+                with opener.open(urllib.request.Request(self.path, data=body, method=self.command, headers=headers)) as r:
+                    status, content = r.status, r.read()
+            except urllib.error.HTTPError as e:
+                status, content = e.code, e.read()
+            self.send_response(status)
+            self.send_header('Content-Length', str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+        do_GET = do_POST = forward
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    server.seen = seen
+    server.url = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
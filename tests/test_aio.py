@@ -0,0 +1,41 @@
+import asyncio
+import threading
+
+from NGTube.aio import AsyncChannel, AsyncSearch
+from NGTube.cache import ResponseCache
+
+
+def test_async_cache_runs_off_the_event_loop(standin, tmp_path):
+    threads = set()
+
+    class RecordingCache(ResponseCache):
+        def get(self, key):
+            threads.add(threading.get_ident())
+            return super().get(key)
+
+        def set(self, key, body):
+            threads.add(threading.get_ident())
+            super().set(key, body)
+
+    async def main():
+        async with AsyncSearch("python", max_results=20) as search:
+            search.core.cache = RecordingCache(str(tmp_path))
+            await search.perform_search()
+            return threading.get_ident(), search.results
+
+    loop_thread, results = asyncio.run(main())
+    assert results
+    assert threads and loop_thread not in threads
+
+
+def test_async_extractors_share_deadline_truncation(standin):
+    async def main():
+        async with AsyncChannel("https://www.youtube.com/@standin") as channel:
+            first = dict(await channel.extract_profile('all', time_budget=0.3))
+            rest = await channel.extract_profile(20, continuation=first['continuation'])
+            return first, rest
+
+    first, rest = asyncio.run(main())
+    assert first['truncated'] and first['continuation']
+    assert not rest['truncated']
+    assert rest['videos'][0]['videoId'] not in {video['videoId'] for video in first['videos']}
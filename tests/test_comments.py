@@ -0,0 +1,20 @@
+from NGTube import Comments
+
+
+def test_resumed_crawls_continue_where_the_last_one_stopped(standin):
+    comments = Comments("https://www.youtube.com/watch?v=resume0001")
+    first = comments.get_comments(time_budget=0.3)
+    assert first['truncated'] and first['continuation']
+
+    # Pages hold 20 comments, max_comments counts the comments of every call
+    loaded = len(first['comments'])
+    second = comments.get_comments(max_comments=loaded + 40)
+    assert not second['truncated']
+    assert len(second['comments']) == loaded + 40
+    third = comments.get_comments(max_comments=loaded + 80)
+    ids = [comment['commentId'] for comment in third['comments']]
+    assert len(ids) == loaded + 80
+    assert len(set(ids)) == len(ids)
+
+    streamed = next(comments.iter_comments(max_comments=1))
+    assert streamed['commentId'] not in ids
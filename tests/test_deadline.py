@@ -0,0 +1,46 @@
+import time
+
+import pytest
+
+from NGTube import Deadline, DeadlineExceededError, YouTubeCore
+
+
+def _fetch_within(core, seconds, fetch=None):
+    start = time.monotonic()
+    with pytest.raises(DeadlineExceededError):
+        with core.budget(Deadline(seconds)):
+            (fetch or core.fetch_html)()
+    return time.monotonic() - start
+
+
+def test_slow_server_fails_within_the_deadline(standin):
+    standin.config.latency = 1.5
+    elapsed = _fetch_within(YouTubeCore("https://www.youtube.com/watch?v=deadline01"), 0.8)
+    assert elapsed < 1.1
+
+
+def test_http2_adapter_fails_within_the_deadline(standin, monkeypatch):
+    pytest.importorskip('httpx')
+    from NGTube.transport import HTTP2Adapter
+    adapter = HTTP2Adapter(http2=False)
+    monkeypatch.setattr(YouTubeCore, 'transport', adapter)
+    standin.config.latency = 1.5
+    try:
+        elapsed = _fetch_within(YouTubeCore("https://www.youtube.com/watch?v=deadline02"), 0.8)
+    finally:
+        adapter.close()
+    assert elapsed < 1.1
+
+
+def test_deadline_timeouts_do_not_count_as_upstream_failures(standin):
+    from NGTube.ratelimit import RateLimits
+    limits = RateLimits()
+    core = YouTubeCore("https://www.youtube.com")
+    core.rate_limits = limits
+    url = "https://www.youtube.com/youtubei/v1/search"
+    limiter = limits.limiter(core.resolve_url(url))
+    rate = limiter.rate
+    standin.config.latency = 0.5
+    _fetch_within(core, 0.2, lambda: core.make_api_request(url, {"query": "deadline"}))
+    assert list(YouTubeCore.breaker._outcomes) == []
+    assert limiter.rate == rate
@@ -0,0 +1,30 @@
+import json
+import os
+
+import pytest
+
+from NGTube.export import NDJSONSink, RecordSink
+
+
+def test_path_is_only_formatted_when_rotating(tmp_path):
+    path = str(tmp_path / "{query}.ndjson")
+    with NDJSONSink(path) as sink:
+        sink.write({'title': 'a'})
+    assert sink.files == [path]
+    with open(path, encoding='utf-8') as f:
+        assert json.loads(f.read()) == {'title': 'a'}
+
+
+def test_rotation_fills_the_index_placeholder(tmp_path):
+    with NDJSONSink(str(tmp_path / "rows.ndjson"), rotate_bytes=20) as sink:
+        sink.write_many({'n': n, 'text': 'x' * 20} for n in range(3))
+    assert [os.path.basename(path) for path in sink.files] == ["rows.00000.ndjson", "rows.00001.ndjson", "rows.00002.ndjson"]
+
+
+def test_record_sink_subclasses_must_implement_the_writer():
+    class Incomplete(RecordSink):
+        def close(self):
+            pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
@@ -0,0 +1,11 @@
+import pytest
+
+from NGTube.records import VideoRecord
+
+
+def test_records_compare_like_dicts_and_are_unhashable():
+    record = VideoRecord(videoId='abc', title='Title')
+    assert record == {'videoId': 'abc', 'title': 'Title'}
+    assert record == VideoRecord(videoId='abc', title='Title')
+    with pytest.raises(TypeError):
+        hash(record)
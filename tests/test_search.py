@@ -0,0 +1,54 @@
+import pytest
+
+from NGTube import ParseError, RequestError, Search
+
+
+def test_search_stops_on_an_error_status(standin):
+    search = Search("stand-in", max_results=100)
+
+    def fail(endpoint, payload, **kwargs):
+        raise RequestError("API request failed: 500", 500, endpoint)
+
+    search.core.make_api_request = fail
+    search.perform_search()
+    assert search.results == []
+
+
+def test_search_propagates_parse_errors(standin):
+    search = Search("stand-in", max_results=100)
+
+    def fail(endpoint, payload, **kwargs):
+        raise ParseError("Invalid JSON in API response")
+
+    search.core.make_api_request = fail
+    with pytest.raises(ParseError):
+        search.perform_search()
+
+
+def test_search_headers_are_sent_with_search_requests_only(standin):
+    search = Search("stand-in", max_results=20)
+    sent = []
+    search.core.session.hooks['response'].append(lambda r, *args, **kwargs: sent.append(r.request))
+    search.perform_search()
+    search.core._send("GET", search.core.resolve_url(search.core.url))
+
+    post, get = sent[0], sent[-1]
+    assert post.method == "POST" and get.method == "GET"
+    assert post.headers['Content-Type'] == "application/json"
+    assert post.headers['User-Agent'] == search.headers['User-Agent']
+    assert 'Content-Type' not in get.headers
+    assert get.headers['User-Agent'] != search.headers['User-Agent']
+
+
+def test_async_search_keeps_core_headers(standin):
+    import asyncio
+    from NGTube.aio import AsyncSearch
+
+    async def main():
+        async with AsyncSearch("stand-in", max_results=20) as search:
+            await search.perform_search()
+            return search
+
+    search = asyncio.run(main())
+    assert search.results
+    assert 'Content-Type' not in search.core.headers
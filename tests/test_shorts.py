@@ -0,0 +1,56 @@
+from NGTube import Shorts
+
+
+def test_concurrent_sample_yields_distinct_shorts(standin):
+    shorts = Shorts()
+    sampled = shorts.sample(8, concurrency=4)
+    video_ids = [short['video_id'] for short in sampled]
+    assert len(video_ids) == 8
+    assert len(set(video_ids)) == 8
+    assert shorts.sample_stats['duplicates'] == 0
+
+
+def test_random_shorts_bypass_the_response_cache(standin, tmp_path):
+    from NGTube.cache import ResponseCache
+    shorts = Shorts()
+    shorts.core.cache = ResponseCache(str(tmp_path))
+    video_ids = {shorts.fetch_short()['video_id'] for _ in range(3)}
+    assert len(video_ids) == 3
+
+
+def test_feed_pages_until_enough_shorts_parsed(standin):
+    shorts = Shorts()
+    make_api_request = shorts.core.make_api_request
+
+    def with_non_short_entries(endpoint, payload, **kwargs):
+        response = make_api_request(endpoint, payload, **kwargs)
+        if endpoint == shorts.feed_endpoint:
+            # Every page carries as many ad slots as shorts, the consumer drops them
+            response['entries'] = response['entries'] + [{'adSlotRenderer': {}} for _ in response['entries']]
+        return response
+
+    shorts.core.make_api_request = with_non_short_entries
+    feed = shorts.fetch_shorts_feed(30)
+    assert len(feed) == 30
+    assert not shorts.truncated
+
+
+def test_enrich_marks_shorts_whose_details_failed(standin):
+    from NGTube.exceptions import RequestError
+    shorts = Shorts(record_type="record")
+    make_api_request = shorts.core.make_api_request
+    failed_ids = set()
+
+    def failing_details(endpoint, payload, **kwargs):
+        if endpoint == shorts.endpoint and len(failed_ids) < 3:
+            failed_ids.add(payload['playerRequest']['videoId'])
+            raise RequestError("details unavailable")
+        return make_api_request(endpoint, payload, **kwargs)
+
+    shorts.core.make_api_request = failing_details
+    feed = shorts.fetch_shorts_feed(10, enrich=True, workers=1)
+    assert len(feed) == 10
+    failed = [short for short in feed if not short['enriched']]
+    assert {short['video_id'] for short in failed} == failed_ids
+    assert all('details unavailable' in short['enrich_error'] for short in failed)
+    assert all('enrich_error' not in short for short in feed if short['enriched'])
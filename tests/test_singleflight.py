@@ -0,0 +1,79 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from NGTube import Deadline, DeadlineExceededError
+from NGTube.singleflight import AsyncSingleFlight, SingleFlight
+
+
+def _run_leader(group, fn):
+    """Start a leader call in a thread and return once it is running."""
+    started = threading.Event()
+
+    def leader():
+        try:
+            group.do('key', lambda: (started.set(), fn())[1])
+        except Exception:
+            pass
+
+    thread = threading.Thread(target=leader)
+    thread.start()
+    started.wait()
+    return thread
+
+
+def test_follower_waits_only_until_its_own_deadline():
+    group = SingleFlight()
+    leader = _run_leader(group, lambda: time.sleep(1.0))
+    start = time.monotonic()
+    with pytest.raises(DeadlineExceededError):
+        group.do('key', lambda: 'follower', Deadline(0.2))
+    assert time.monotonic() - start < 0.5
+    leader.join()
+
+
+def test_leader_deadline_is_not_passed_on():
+    group = SingleFlight()
+
+    def leader_out_of_time():
+        time.sleep(0.2)
+        raise DeadlineExceededError("leader out of time")
+
+    leader = _run_leader(group, leader_out_of_time)
+    assert group.do('key', lambda: 'follower result') == ('follower result', False)
+    leader.join()
+
+
+def test_async_follower_retries_after_leader_deadline():
+    async def main():
+        group = AsyncSingleFlight()
+
+        async def leader_out_of_time():
+            await asyncio.sleep(0.1)
+            raise DeadlineExceededError("leader out of time")
+
+        async def slow():
+            await asyncio.sleep(1.0)
+
+        async def follower_result():
+            return 'follower result'
+
+        leader = asyncio.ensure_future(group.do('key', leader_out_of_time))
+        await asyncio.sleep(0)
+        result = await group.do('key', follower_result)
+        with pytest.raises(DeadlineExceededError):
+            await leader
+        slow_leader = asyncio.ensure_future(group.do('other', slow))
+        await asyncio.sleep(0)
+        start = time.monotonic()
+        with pytest.raises(DeadlineExceededError):
+            await group.do('other', follower_result, Deadline(0.2))
+        waited = time.monotonic() - start
+        slow_leader.cancel()
+        return result, waited
+
+    result, waited = asyncio.run(main())
+    assert result == ('follower result', False)
+    assert waited < 0.5
@@ -0,0 +1,88 @@
+import pytest
+
+from NGTube import Search, YouTubeCore
+
+
+@pytest.fixture
+def environment_proxy(monkeypatch):
+    """Point the proxy environment variables at a port nothing listens on."""
+    for name in ('NO_PROXY', 'no_proxy'):
+        monkeypatch.delenv(name, raising=False)
+    for name in ('HTTP_PROXY', 'HTTPS_PROXY', 'http_proxy', 'https_proxy'):
+        monkeypatch.setenv(name, 'http://127.0.0.1:9')
+
+
+def test_explicit_proxy_wins_over_environment(standin, forward_proxy, environment_proxy):
+    core = YouTubeCore("https://www.youtube.com", proxy=forward_proxy.url)
+    assert 'ytInitialData' in core.fetch_html()
+    assert forward_proxy.seen
+
+
+def test_http2_adapter_uses_the_proxy(standin, forward_proxy, environment_proxy, monkeypatch):
+    pytest.importorskip('httpx')
+    from NGTube.transport import HTTP2Adapter
+    adapter = HTTP2Adapter()
+    monkeypatch.setattr(YouTubeCore, 'transport', adapter)
+    monkeypatch.setattr(YouTubeCore, 'proxy', forward_proxy.url)
+    try:
+        search = Search("stand-in", max_results=40)
+        search.perform_search()
+    finally:
+        adapter.close()
+    assert len(search.results) >= 40
+    assert any('/youtubei/v1/search' in url for url in forward_proxy.seen)
+
+
+@pytest.fixture
+def cookie_server():
+    """Serve /set, which sets a cookie, and /echo, which returns the Cookie header."""
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            content = (self.headers.get('Cookie') or '').encode('utf-8')
+            self.send_response(200)
+            if self.path == '/set':
+                self.send_header('Set-Cookie', 'VISITOR_INFO1_LIVE=abc; Path=/')
+            self.send_header('Content-Length', str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def http2_session():
+    pytest.importorskip('httpx')
+    import requests
+    from NGTube.transport import HTTP2Adapter
+    adapter = HTTP2Adapter()
+    session = requests.Session()
+    session.trust_env = False
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def test_http2_adapter_keeps_response_cookies(cookie_server, http2_session):
+    response = http2_session.get(cookie_server + '/set')
+    assert response.cookies.get('VISITOR_INFO1_LIVE') == 'abc'
+    assert http2_session.get(cookie_server + '/echo').text == 'VISITOR_INFO1_LIVE=abc'
+
+
+def test_http2_adapter_rejects_a_missing_ca_bundle(cookie_server, http2_session):
+    with pytest.raises(OSError):
+        http2_session.get(cookie_server + '/echo', verify='/nonexistent/ca-bundle.pem')
@@ -0,0 +1,15 @@
+import pytest
+
+from NGTube import utils
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('4.1M views', 4100000),
+    ('32.3K', 32300),
+    ('8.2M', 8200000),
+    ('1,2 Mio. Aufrufe', 1200000),
+    ('1.2万回視聴', 12000),
+    ('1,234,567 views', 1234567),
+])
+def test_extract_number_is_exact(text, expected):
+    assert utils.extract_number(text) == expected